@@ -0,0 +1,67 @@
+"""Compare two benchmark result files produced by `benchmarks/run.py`.
+
+Usage:
+
+    python benchmarks/compare.py baseline.json candidate.json --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+
+def _medians(report: dict[str, Any]) -> Iterator[tuple[str, float]]:
+    for name, result in report.get("commands", {}).items():
+        for mode in ("cold", "warm"):
+            if mode in result:
+                yield f"{name} ({mode})", float(result[mode]["median"])
+    for name, result in report.get("phases", {}).items():
+        yield f"phase {name}", float(result["median"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown that counts as a regression (default: 0.10).",
+    )
+    args = parser.parse_args()
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    candidate = json.loads(args.candidate.read_text(encoding="utf-8"))
+    if baseline.get("shape") != candidate.get("shape"):
+        print("warning: results were measured on different project shapes", file=sys.stderr)
+
+    before = dict(_medians(baseline))
+    after = dict(_medians(candidate))
+    width = max((len(name) for name in before | after), default=10)
+    print(f"{'benchmark':<{width}}  {'baseline':>10}  {'candidate':>10}  {'change':>8}")
+    regressions = 0
+    for name in sorted(before | after):
+        if name not in before or name not in after:
+            value = before.get(name, after.get(name, 0.0))
+            side = "baseline" if name in before else "candidate"
+            print(f"{name:<{width}}  {value:>9.3f}s  (only in {side})")
+            continue
+        change = (after[name] - before[name]) / before[name] if before[name] else 0.0
+        marker = ""
+        if change > args.threshold:
+            regressions += 1
+            marker = "  regression"
+        print(
+            f"{name:<{width}}  {before[name]:>9.3f}s  {after[name]:>9.3f}s  {change:>+7.1%}{marker}"
+        )
+    if regressions:
+        print(f"{regressions} benchmark(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Generate synthetic changelog projects for benchmarking.
+
+Usage:
+
+    python benchmarks/generate.py OUTPUT_DIR --entries 10000 --releases 1000 --modules 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ENTRY_TYPES = ("breaking", "feature", "bugfix", "change")
+COMPONENTS = ("cli", "api", "docs", "engine", "storage")
+AUTHORS = ("alice", "bob", "carol", "dave", "erin", "frank")
+WORDS = (
+    "pipeline operator query index schema parser export import config cache "
+    "metrics plugin connector format buffer scheduler tokenizer release module "
+    "signal stream window memory allocation latency throughput partition"
+).split()
+MODULE_PATTERN = "modules/*/changelog"
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class ProjectShape:
+    """Size parameters of a synthetic project."""
+
+    entries: int = 10_000
+    releases: int = 1_000
+    entries_per_release: int = 5
+    modules: int = 50
+    module_entries: int = 20
+    body_paragraphs: int = 3
+    seed: int = 0
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _entry_text(rng: random.Random, index: int, created: datetime, paragraphs: int) -> str:
+    title = f"{_sentence(rng, 5).capitalize()} {index}"
+    lines = [
+        "---",
+        f"title: {title}",
+        f"type: {rng.choice(ENTRY_TYPES)}",
+        "authors:",
+        *(f"  - {author}" for author in rng.sample(AUTHORS, rng.randint(1, 2))),
+        "components:",
+        f"  - {rng.choice(COMPONENTS)}",
+        f"prs:\n  - {1000 + index}",
+        f"created: {created.strftime('%Y-%m-%dT%H:%M:%S')}Z",
+        "---",
+        "",
+    ]
+    body = "\n\n".join(
+        f"{_sentence(rng, 40).capitalize()} with `code` and a [link](https://example.com/{index})."
+        for _ in range(paragraphs)
+    )
+    return "\n".join(lines) + body + "\n"
+
+
+def _write_config(root: Path, project_id: str, name: str, *, modules: bool) -> None:
+    lines = [
+        f"id: {project_id}",
+        f"name: {name}",
+        "repository: example/benchmark",
+        "components:",
+        *(f"  {component}: The {component} component." for component in COMPONENTS),
+    ]
+    if modules:
+        lines.append(f"modules: {MODULE_PATTERN}")
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "config.yaml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _write_project(
+    root: Path,
+    rng: random.Random,
+    *,
+    unreleased: int,
+    releases: int,
+    entries_per_release: int,
+    paragraphs: int,
+) -> None:
+    released_total = releases * entries_per_release
+    step = timedelta(hours=1)
+    index = 0
+    for release in range(releases):
+        version = f"v{release // 100}.{release % 100}.0"
+        release_dir = root / "releases" / version
+        entries_dir = release_dir / "entries"
+        entries_dir.mkdir(parents=True, exist_ok=True)
+        for _ in range(entries_per_release):
+            created = START + step * index
+            path = entries_dir / f"entry-{index:06d}.md"
+            path.write_text(_entry_text(rng, index, created, paragraphs), encoding="utf-8")
+            index += 1
+        created_date = (START + step * index).date().isoformat()
+        release_dir.joinpath("manifest.yaml").write_text(
+            f"created: {created_date}\ntitle: Release {version}\n"
+            f"intro: >-\n  {_sentence(rng, 20).capitalize()}.\n",
+            encoding="utf-8",
+        )
+        release_dir.joinpath("notes.md").write_text(
+            f"{_sentence(rng, 20).capitalize()}.\n", encoding="utf-8"
+        )
+    unreleased_dir = root / "unreleased"
+    unreleased_dir.mkdir(parents=True, exist_ok=True)
+    for offset in range(unreleased):
+        index = released_total + offset
+        created = START + step * index
+        path = unreleased_dir / f"entry-{index:06d}.md"
+        path.write_text(_entry_text(rng, index, created, paragraphs), encoding="utf-8")
+
+
+def generate_project(root: Path, shape: ProjectShape) -> Path:
+    """Write a synthetic project below `root` and return its changelog root."""
+    rng = random.Random(shape.seed)
+    _write_config(root, "benchmark", "Benchmark", modules=shape.modules > 0)
+    _write_project(
+        root,
+        rng,
+        unreleased=shape.entries,
+        releases=shape.releases,
+        entries_per_release=shape.entries_per_release,
+        paragraphs=shape.body_paragraphs,
+    )
+    for module in range(shape.modules):
+        module_root = root / "modules" / f"module-{module:03d}" / "changelog"
+        _write_config(module_root, f"module-{module:03d}", f"Module {module}", modules=False)
+        _write_project(
+            module_root,
+            rng,
+            unreleased=shape.module_entries,
+            releases=2,
+            entries_per_release=2,
+            paragraphs=1,
+        )
+    return root
+
+
+def add_shape_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the project shape options on an argument parser."""
+    defaults = ProjectShape()
+    parser.add_argument("--entries", type=int, default=defaults.entries)
+    parser.add_argument("--releases", type=int, default=defaults.releases)
+    parser.add_argument("--entries-per-release", type=int, default=defaults.entries_per_release)
+    parser.add_argument("--modules", type=int, default=defaults.modules)
+    parser.add_argument("--module-entries", type=int, default=defaults.module_entries)
+    parser.add_argument("--body-paragraphs", type=int, default=defaults.body_paragraphs)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def shape_from_arguments(args: argparse.Namespace) -> ProjectShape:
+    """Build a ProjectShape from parsed shape options."""
+    return ProjectShape(**{key: getattr(args, key) for key in asdict(ProjectShape())})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", type=Path, help="Directory to create the project in.")
+    add_shape_arguments(parser)
+    args = parser.parse_args()
+    if args.output.exists() and any(args.output.iterdir()):
+        parser.error(f"{args.output} is not empty")
+    generate_project(args.output, shape_from_arguments(args))
+    print(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Time tenzir-changelog commands against a synthetic project.
+
+Usage:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --entries 1000 --releases 100 --modules 5 --repeat 3
+
+Each command runs end to end in a fresh interpreter, once with an empty entry
+cache ("cold") and once with a primed cache ("warm"), plus one profiled run
+that records the per-phase breakdown from `--profile-output`. Library phases
+are also timed in-process with caching disabled. Results are written as JSON; compare two
+result files with `benchmarks/compare.py`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from generate import ProjectShape, add_shape_arguments, generate_project, shape_from_arguments
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SOURCE_ROOT = REPO_ROOT / "src"
+SCHEMA_VERSION = 1
+CREATED_VERSION = "v999.0.0"
+CACHE_DIR_ENV = "TENZIR_CHANGELOG_CACHE_DIR"
+
+# Commands that modify the project run against a fresh copy each time.
+COMMANDS: dict[str, tuple[list[str], bool]] = {
+    "show-table": (["show", "--table"], False),
+    "show-json": (["show", "--json"], False),
+    "show-markdown": (["show", "--markdown"], False),
+    "release-notes": (["release", "notes", "{latest}"], False),
+    "release-notes-unreleased": (["release", "notes", "-"], False),
+    "release-create": (["release", "create", CREATED_VERSION, "--yes"], True),
+    "validate": (["validate"], False),
+    "modules": (["modules"], False),
+}
+
+
+def _summarize(samples: list[float]) -> dict[str, Any]:
+    return {
+        "runs": [round(sample, 6) for sample in samples],
+        "min": round(min(samples), 6),
+        "median": round(statistics.median(samples), 6),
+        "mean": round(statistics.fmean(samples), 6),
+        "max": round(max(samples), 6),
+    }
+
+
+def _latest_version(shape: ProjectShape) -> str:
+    release = shape.releases - 1
+    return f"v{release // 100}.{release % 100}.0"
+
+
+def _run_cli(root: Path, arguments: list[str], env: dict[str, str]) -> float:
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; from tenzir_changelog.cli import main; sys.exit(main())",
+        "--root",
+        str(root),
+        *arguments,
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(command, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(
+            f"command failed ({result.returncode}): {' '.join(arguments)}\n{result.stderr}"
+        )
+    return elapsed
+
+
+def _time_command(
+    project: Path,
+    scratch: Path,
+    arguments: list[str],
+    mutates: bool,
+    *,
+    repeat: int,
+    warm_cache: Path | None,
+) -> list[float]:
+    samples: list[float] = []
+    for iteration in range(repeat):
+        env = dict(os.environ, PYTHONPATH=str(SOURCE_ROOT))
+        if warm_cache is not None:
+            env[CACHE_DIR_ENV] = str(warm_cache)
+        else:
+            env[CACHE_DIR_ENV] = tempfile.mkdtemp(dir=scratch, prefix="cache-")
+        root = project
+        if mutates:
+            root = scratch / f"copy-{iteration}"
+            shutil.rmtree(root, ignore_errors=True)
+            shutil.copytree(project, root)
+        samples.append(_run_cli(root, arguments, env))
+        if mutates:
+            shutil.rmtree(root, ignore_errors=True)
+    return samples
+
+
+def benchmark_commands(
+    project: Path,
+    scratch: Path,
+    shape: ProjectShape,
+    *,
+    repeat: int,
+    selected: list[str],
+) -> dict[str, Any]:
+    """Time each selected command end to end with a cold and a warm cache."""
+    results: dict[str, Any] = {}
+    warm_cache = scratch / "warm-cache"
+    latest = _latest_version(shape)
+    for name in selected:
+        template, mutates = COMMANDS[name]
+        arguments = [argument.replace("{latest}", latest) for argument in template]
+        print(f"command {name}", file=sys.stderr)
+        cold = _time_command(project, scratch, arguments, mutates, repeat=repeat, warm_cache=None)
+        # Prime the shared cache before timing warm runs.
+        _time_command(project, scratch, arguments, mutates, repeat=1, warm_cache=warm_cache)
+        warm = _time_command(
+            project, scratch, arguments, mutates, repeat=repeat, warm_cache=warm_cache
+        )
+        results[name] = {
+            "arguments": arguments,
+            "cold": _summarize(cold),
+            "warm": _summarize(warm),
+            "profile": _profile_command(project, scratch, arguments, mutates),
+        }
+    return results
+
+
+def _profile_command(
+    project: Path, scratch: Path, arguments: list[str], mutates: bool
+) -> list[dict[str, Any]]:
+    """Return the per-phase breakdown of one cold run via `--profile-output`."""
+    trace = scratch / "trace.json"
+    _time_command(
+        project,
+        scratch,
+        ["--profile-output", str(trace), *arguments],
+        mutates,
+        repeat=1,
+        warm_cache=None,
+    )
+    summary: list[dict[str, Any]] = json.loads(trace.read_text(encoding="utf-8"))["summary"]
+    trace.unlink()
+    return summary
+
+
+def benchmark_phases(project: Path, *, repeat: int) -> dict[str, Any]:
+    """Time the main loading phases in-process with caching disabled."""
+    sys.path.insert(0, str(SOURCE_ROOT))
+    from tenzir_changelog.cache import configure_cache
+    from tenzir_changelog.config import load_project_config
+    from tenzir_changelog.entries import iter_entries
+    from tenzir_changelog.modules import discover_modules_from_config
+    from tenzir_changelog.releases import ProjectSnapshot
+    from tenzir_changelog.validate import run_validation
+
+    configure_cache(enabled=False)
+    config = load_project_config(project)
+
+    def read_bodies() -> None:
+        for entry in iter_entries(project):
+            _ = entry.body
+
+    phases: dict[str, Callable[[], object]] = {
+        "load-unreleased": lambda: list(iter_entries(project)),
+        "read-bodies": read_bodies,
+        "load-manifests": lambda: ProjectSnapshot(project).manifests,
+        "load-released": lambda: ProjectSnapshot(project).released_entries,
+        "discover-modules": lambda: discover_modules_from_config(project, config),
+        "validate": lambda: run_validation(project, config),
+    }
+    results: dict[str, Any] = {}
+    for name, phase in phases.items():
+        print(f"phase {name}", file=sys.stderr)
+        samples: list[float] = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            phase()
+            samples.append(time.perf_counter() - start)
+        results[name] = _summarize(samples)
+    return results
+
+
+def _git(*arguments: str) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", *arguments], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _environment() -> dict[str, Any]:
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_shape_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument(
+        "--command",
+        dest="commands",
+        action="append",
+        choices=sorted(COMMANDS),
+        help="Benchmark only this command (repeatable).",
+    )
+    parser.add_argument("--skip-phases", action="store_true", help="Skip in-process phases.")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file.")
+    parser.add_argument(
+        "--workdir", type=Path, help="Generate the project here and keep it afterwards."
+    )
+    args = parser.parse_args()
+    shape = shape_from_arguments(args)
+    selected = args.commands or list(COMMANDS)
+
+    scratch = Path(tempfile.mkdtemp(prefix="tenzir-changelog-bench-"))
+    try:
+        project = args.workdir if args.workdir is not None else scratch / "project"
+        if not (project / "config.yaml").exists():
+            print(f"generating project in {project}", file=sys.stderr)
+            start = time.perf_counter()
+            generate_project(project, shape)
+            print(f"generated in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        report: dict[str, Any] = {
+            "schema": SCHEMA_VERSION,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "environment": _environment(),
+            "shape": asdict(shape),
+            "repeat": args.repeat,
+            "commands": benchmark_commands(
+                project, scratch, shape, repeat=args.repeat, selected=selected
+            ),
+            "phases": {} if args.skip_phases else benchmark_phases(project, repeat=args.repeat),
+        }
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    payload = json.dumps(report, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(payload, encoding="utf-8")
+        print(f"wrote {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(payload)
+
+
+if __name__ == "__main__":
+    main()
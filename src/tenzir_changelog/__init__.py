@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version as metadata_version
 from typing import TYPE_CHECKING, Any
 
 __all__ = ["__version__", "Changelog", "create_cli_context"]
 
-try:
-    __version__ = metadata_version("tenzir-changelog")
-except PackageNotFoundError:  # pragma: no cover - fallback for editable installs
-    __version__ = "0.0.0"
-
 if TYPE_CHECKING:  # pragma: no cover
     from .api import Changelog
     from .cli import create_cli_context
 
+    __version__: str
+
+
+def _package_version() -> str:
+    # importlib.metadata is slow to import, so only pay for it on demand.
+    from importlib.metadata import PackageNotFoundError, version as metadata_version
+
+    try:
+        return metadata_version("tenzir-changelog")
+    except PackageNotFoundError:  # pragma: no cover - fallback for editable installs
+        return "0.0.0"
+
 
 def __getattr__(name: str) -> Any:  # pragma: no cover - simple delegation
+    if name == "__version__":
+        version = _package_version()
+        globals()["__version__"] = version
+        return version
     if name == "Changelog":
         from .api import Changelog as _Changelog
 
@@ -14,7 +14,10 @@ from .cli import (
     create_entry,
     create_release,
     publish_release,
+    render_all_release_notes,
     render_release_notes,
+    render_release_notes_range,
+    run_backfill_created,
     run_show_entries,
     run_validate,
 )
@@ -31,6 +34,10 @@ class Changelog:
         root: Path | str | None = None,
         config: Path | str | None = None,
         debug: bool = False,
+        cache: bool = True,
+        jobs: Optional[int] = None,
+        discovery: Optional[str] = None,
+        ref: Optional[str] = None,
     ) -> None:
         resolved_root = Path(root) if root is not None else None
         resolved_config = Path(config) if config is not None else None
@@ -38,6 +45,10 @@ class Changelog:
             root=resolved_root,
             config=resolved_config,
             debug=debug,
+            cache=cache,
+            jobs=jobs,
+            discovery=discovery,
+            ref=ref,
         )
 
     @property
@@ -57,9 +68,14 @@ class Changelog:
         compact: Optional[bool] = None,
         include_emoji: bool = True,
         explicit_links: bool = False,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> None:
         """Render entries using the same layouts as ``tenzir-changelog show``."""
 
+        self._ctx.reset_snapshots()
         run_show_entries(
             self._ctx,
             identifiers=identifiers or (),
@@ -70,6 +86,10 @@ class Changelog:
             compact=compact,
             include_emoji=include_emoji,
             explicit_links=explicit_links,
+            since=since,
+            until=until,
+            limit=limit,
+            offset=offset,
         )
 
     def add(
@@ -114,6 +134,7 @@ class Changelog:
     ) -> None:
         """Create or update a release manifest."""
 
+        self._ctx.reset_snapshots()
         create_release(
             self._ctx,
             version=version,
@@ -141,7 +162,8 @@ class Changelog:
         Raises:
             ValueError: If no releases exist.
         """
-        manifest = _get_latest_release_manifest(self._ctx.project_root)
+        self._ctx.reset_snapshots()
+        manifest = _get_latest_release_manifest(self._ctx.snapshot())
         if manifest is None:
             raise ValueError("No releases found. Create a release first with 'release create'.")
 
@@ -162,6 +184,7 @@ class Changelog:
     ) -> None:
         """Render release notes for a specific release or ``-`` for unreleased."""
 
+        self._ctx.reset_snapshots()
         render_release_notes(
             self._ctx,
             identifier=identifier,
@@ -172,6 +195,56 @@ class Changelog:
             compact_explicit=compact is not None,
         )
 
+    def release_notes_range(
+        self,
+        *,
+        since: str | None = None,
+        until: str | None = None,
+        view: LiteralMarkdownJson = "markdown",
+        compact: Optional[bool] = None,
+        include_emoji: bool = True,
+        explicit_links: bool = False,
+    ) -> None:
+        """Render the notes of every release between two versions or dates, inclusive."""
+
+        self._ctx.reset_snapshots()
+        render_release_notes_range(
+            self._ctx,
+            since=since,
+            until=until,
+            view=view,
+            compact=compact,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
+            compact_explicit=compact is not None,
+        )
+
+    def release_notes_all(
+        self,
+        output_dir: Path | str,
+        *,
+        views: Sequence[LiteralMarkdownJson] = ("markdown",),
+        compact: Optional[bool] = None,
+        include_emoji: bool = True,
+        explicit_links: bool = False,
+    ) -> list[Path]:
+        """Write notes for every release into `output_dir` and return the files written.
+
+        Files whose content did not change are left untouched and omitted from
+        the result.
+        """
+
+        self._ctx.reset_snapshots()
+        return render_all_release_notes(
+            self._ctx,
+            output_dir=Path(output_dir),
+            views=views,
+            compact=compact,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
+            compact_explicit=compact is not None,
+        )
+
     def release_publish(
         self,
         *,
@@ -191,7 +264,8 @@ class Changelog:
 
         resolved_version = version
         if resolved_version is None:
-            manifest = _get_latest_release_manifest(self._ctx.project_root)
+            self._ctx.reset_snapshots()
+            manifest = _get_latest_release_manifest(self._ctx.snapshot())
             if manifest is None:
                 raise ValueError("No releases found. Create a release first with 'release create'.")
             resolved_version = manifest.version
@@ -208,10 +282,22 @@ class Changelog:
             assume_yes=assume_yes,
         )
 
-    def validate(self) -> None:
-        """Run the validator against the configured project."""
+    def validate(self, *, changed: bool = False, since: str | None = None) -> None:
+        """Run the validator against the configured project.
+
+        Pass `changed=True` to re-check only files changed since the last clean
+        incremental run, or `since` to re-check only files changed since a git ref.
+        """
+
+        run_validate(self._ctx, changed=changed, since=since)
+
+    def backfill_created(self, *, write: bool = False) -> dict[str, datetime]:
+        """Return git first-add dates for entries without a `created` field.
+
+        Pass `write=True` to also store the dates in the entry files.
+        """
 
-        run_validate(self._ctx)
+        return run_backfill_created(self._ctx, write=write)
 
     def list_modules(self) -> list[dict[str, Any]]:
         """Return discovered modules as a list of dictionaries.
@@ -0,0 +1,410 @@
+"""Persistent caches that speed up repeated invocations."""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Protocol, TypeVar
+
+CACHE_DIR_ENV = "TENZIR_CHANGELOG_CACHE_DIR"
+CACHE_DIRECTORY_NAME = "tenzir-changelog"
+
+# Bump whenever the pickled record layout changes so stale caches are ignored.
+_CACHE_FORMAT = 2
+
+# Files modified within this window are not cached because a subsequent edit
+# in the same timestamp tick with an identical size would go unnoticed.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Records for files that disappeared are kept around this long before pruning.
+_STALE_RECORD_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Size budget of the Markdown cache; least recently used results beyond it
+# are evicted when the cache is flushed.
+_MARKDOWN_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+_enabled = True
+_directory: Optional[Path] = None
+_entry_caches: dict[Path, "EntryCache"] = {}
+_markdown_caches: dict[str, "MarkdownCache"] = {}
+
+
+def default_cache_directory() -> Path:
+    """Return the cache directory honoring overrides and XDG conventions."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / CACHE_DIRECTORY_NAME
+
+
+def configure_cache(*, enabled: bool = True, directory: Optional[Path] = None) -> None:
+    """Enable or disable persistent caching for subsequent operations."""
+    global _enabled, _directory
+    flush_caches()
+    _entry_caches.clear()
+    _markdown_caches.clear()
+    _enabled = enabled
+    _directory = directory
+
+
+def cache_enabled() -> bool:
+    """Return True when persistent caches may be read and written."""
+    return _enabled
+
+
+def cache_directory() -> Path:
+    """Return the directory that holds persistent cache files."""
+    return _directory if _directory is not None else default_cache_directory()
+
+
+def read_cache_file(path: Path) -> Any:
+    """Return the record stored in a cache file, or None if unusable."""
+    try:
+        with path.open("rb") as handle:
+            data = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+    if isinstance(data, dict) and data.get("format") == _CACHE_FORMAT:
+        return data.get("records")
+    return None
+
+
+def write_cache_file(path: Path, records: Any) -> bool:
+    """Atomically replace a cache file, returning False if writing failed."""
+    payload = {"format": _CACHE_FORMAT, "records": records}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temporary.open("wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identity of a file on disk used to detect modifications."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def of(cls, path: Path) -> "FileFingerprint":
+        stat = path.stat()
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino)
+
+    @classmethod
+    def of_optional(cls, path: Path) -> Optional["FileFingerprint"]:
+        """Return the fingerprint of `path`, or None if it does not exist."""
+        try:
+            return cls.of(path)
+        except OSError:
+            return None
+
+    def is_racy(self) -> bool:
+        """Return True if the file changed too recently to trust its mtime."""
+        return time.time_ns() - self.mtime_ns < _RACY_WINDOW_NS
+
+
+class _Record(Protocol):
+    last_used: float
+
+
+_RecordT = TypeVar("_RecordT", bound=_Record)
+
+
+def _merge_records(target: dict[str, _RecordT], records: dict[str, _RecordT]) -> bool:
+    """Merge `records` into `target`, keeping the more recently used of each pair."""
+    changed = False
+    for key, record in records.items():
+        existing = target.get(key)
+        if existing is None or existing.last_used < record.last_used:
+            target[key] = record
+            changed = True
+    return changed
+
+
+@dataclass
+class _EntryRecord:
+    fingerprint: FileFingerprint
+    payload: bytes
+    last_used: float
+
+
+class EntryCache:
+    """Persistent mapping from entry files to their parsed frontmatter.
+
+    Records are keyed by absolute path and validated against the file size,
+    modification time, and inode. Editing a file or moving it into a release
+    directory therefore produces a cache miss. Payloads are stored pickled so
+    that every lookup hands out fresh, independently mutable objects.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._records: dict[str, _EntryRecord] | None = None
+        self._dirty = False
+        self._changed: set[str] = set()
+        self._session_start = time.time()
+        # Parallel loaders share one cache instance per project.
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, _EntryRecord]:
+        with self._lock:
+            if self._records is None:
+                self._records = self._read_records()
+            return self._records
+
+    def _read_records(self) -> dict[str, _EntryRecord]:
+        records = read_cache_file(self.path)
+        return records if isinstance(records, dict) else {}
+
+    def lookup(self, path: Path, fingerprint: FileFingerprint) -> tuple[dict[str, Any], int] | None:
+        """Return cached metadata and body offset for the file, if still valid."""
+        record = self._load().get(str(path))
+        if record is None or record.fingerprint != fingerprint:
+            return None
+        try:
+            metadata, body_offset = pickle.loads(record.payload)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        if record.last_used < self._session_start:
+            record.last_used = self._session_start
+            self._changed.add(str(path))
+            self._dirty = True
+        return metadata, body_offset
+
+    def store(
+        self,
+        path: Path,
+        fingerprint: FileFingerprint,
+        metadata: dict[str, Any],
+        body_offset: int,
+    ) -> None:
+        """Record the parsed frontmatter of an entry file."""
+        if fingerprint.is_racy():
+            return
+        payload = pickle.dumps((metadata, body_offset), protocol=pickle.HIGHEST_PROTOCOL)
+        self._load()[str(path)] = _EntryRecord(
+            fingerprint=fingerprint,
+            payload=payload,
+            last_used=self._session_start,
+        )
+        self._changed.add(str(path))
+        self._dirty = True
+
+    def take_changes(self) -> dict[str, _EntryRecord]:
+        """Return the records stored or used since the last call and forget them.
+
+        The caller becomes responsible for persisting the returned records.
+        """
+        records = self._records or {}
+        changes = {key: records[key] for key in self._changed if key in records}
+        self._changed.clear()
+        self._dirty = False
+        return changes
+
+    def merge(self, records: dict[str, _EntryRecord]) -> None:
+        """Adopt records taken from another instance, keeping the most recently used."""
+        if _merge_records(self._load(), records):
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending changes to disk, pruning records of vanished files.
+
+        Records that concurrent invocations stored since this cache was
+        loaded are merged in first.
+        """
+        if not self._dirty or self._records is None:
+            return
+        for key, record in self._read_records().items():
+            self._records.setdefault(key, record)
+        cutoff = self._session_start - _STALE_RECORD_TTL_SECONDS
+        for key, record in list(self._records.items()):
+            if record.last_used < cutoff and not Path(key).exists():
+                del self._records[key]
+        if write_cache_file(self.path, self._records):
+            self._dirty = False
+
+
+@dataclass
+class _MarkdownRecord:
+    result: str
+    last_used: float
+
+
+class MarkdownCache:
+    """Persistent content-addressed store of normalized Markdown.
+
+    Results are keyed by the SHA-256 digest of the input text. Each formatter
+    configuration gets its own file, so upgrading the formatter or changing
+    its options starts from an empty cache. Flushing evicts the least recently
+    used results once the stored text exceeds `max_bytes`.
+    """
+
+    def __init__(self, path: Path, *, max_bytes: int = _MARKDOWN_CACHE_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._records: dict[str, _MarkdownRecord] | None = None
+        self._dirty = False
+        self._changed: set[str] = set()
+        self._session_start = time.time()
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, _MarkdownRecord]:
+        with self._lock:
+            if self._records is None:
+                records = read_cache_file(self.path)
+                self._records = records if isinstance(records, dict) else {}
+            return self._records
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """Return the key under which the normalized form of `text` is stored."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def lookup(self, digest: str) -> str | None:
+        """Return the cached result for an input digest, if present."""
+        record = self._load().get(digest)
+        if record is None:
+            return None
+        if record.last_used < self._session_start:
+            record.last_used = self._session_start
+            self._changed.add(digest)
+            self._dirty = True
+        return record.result
+
+    def store(self, digest: str, result: str) -> None:
+        """Record the normalized form of the input with the given digest."""
+        self._load()[digest] = _MarkdownRecord(result=result, last_used=self._session_start)
+        self._changed.add(digest)
+        self._dirty = True
+
+    def take_changes(self) -> dict[str, _MarkdownRecord]:
+        """Return the records stored or used since the last call and forget them.
+
+        The caller becomes responsible for persisting the returned records.
+        """
+        records = self._records or {}
+        changes = {key: records[key] for key in self._changed if key in records}
+        self._changed.clear()
+        self._dirty = False
+        return changes
+
+    def merge(self, records: dict[str, _MarkdownRecord]) -> None:
+        """Adopt records taken from another instance, keeping the most recently used."""
+        if _merge_records(self._load(), records):
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending changes to disk, evicting results beyond the size budget.
+
+        Records that concurrent invocations stored since this cache was
+        loaded are merged in first.
+        """
+        if not self._dirty or self._records is None:
+            return
+        on_disk = read_cache_file(self.path)
+        if isinstance(on_disk, dict):
+            for digest, record in on_disk.items():
+                self._records.setdefault(digest, record)
+        retained: dict[str, _MarkdownRecord] = {}
+        size = 0
+        ranked = sorted(self._records.items(), key=lambda item: item[1].last_used, reverse=True)
+        for digest, record in ranked:
+            size += len(digest) + len(record.result)
+            if size > self.max_bytes:
+                break
+            retained[digest] = record
+        self._records = retained
+        if write_cache_file(self.path, self._records):
+            self._dirty = False
+
+
+def markdown_cache_for(signature: str) -> MarkdownCache | None:
+    """Return the Markdown cache for a formatter configuration, or None when disabled."""
+    if not _enabled:
+        return None
+    cache = _markdown_caches.get(signature)
+    if cache is None:
+        key = hashlib.sha256(signature.encode("utf-8")).hexdigest()[:16]
+        cache = MarkdownCache(cache_directory() / "markdown" / f"{key}.pickle")
+        _markdown_caches[signature] = cache
+    return cache
+
+
+def _project_cache_key(project_root: Path) -> str:
+    resolved = str(project_root.resolve())
+    return hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:16]
+
+
+def project_cache_path(project_root: Path, namespace: str, suffix: str) -> Path:
+    """Return the per-project cache file within a namespace directory."""
+    return cache_directory() / namespace / f"{_project_cache_key(project_root)}{suffix}"
+
+
+def entry_cache_for(project_root: Path) -> EntryCache | None:
+    """Return the entry cache for a project, or None when caching is disabled."""
+    if not _enabled:
+        return None
+    key = project_root.resolve()
+    cache = _entry_caches.get(key)
+    if cache is None:
+        cache = EntryCache(project_cache_path(key, "entries", ".pickle"))
+        _entry_caches[key] = cache
+    return cache
+
+
+@dataclass
+class CacheChanges:
+    """Cache records a worker process stored or used, for the parent to persist."""
+
+    entries: dict[Path, dict[str, _EntryRecord]]
+    markdown: dict[str, dict[str, _MarkdownRecord]]
+
+
+def take_cache_changes() -> CacheChanges:
+    """Return and forget the pending changes of all caches in this process.
+
+    Worker processes hand their changes to the parent instead of flushing, so
+    that cache files are written once per command and no worker overwrites
+    what another one stored.
+    """
+    return CacheChanges(
+        entries={root: cache.take_changes() for root, cache in _entry_caches.items()},
+        markdown={signature: cache.take_changes() for signature, cache in _markdown_caches.items()},
+    )
+
+
+def merge_cache_changes(changes: CacheChanges) -> None:
+    """Adopt changes taken from a worker process; they persist with the next flush."""
+    for root, entry_records in changes.entries.items():
+        entry_cache = entry_cache_for(root)
+        if entry_cache is not None:
+            entry_cache.merge(entry_records)
+    for signature, markdown_records in changes.markdown.items():
+        markdown_cache = markdown_cache_for(signature)
+        if markdown_cache is not None:
+            markdown_cache.merge(markdown_records)
+
+
+def flush_caches() -> None:
+    """Persist all pending cache updates."""
+    for cache in _entry_caches.values():
+        cache.flush()
+    for markdown_cache in _markdown_caches.values():
+        markdown_cache.flush()
+
+
+atexit.register(flush_caches)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import json
 import shutil
 import subprocess
 import sys
 import textwrap
-from dataclasses import dataclass
-from datetime import date, datetime, timezone
-from importlib.metadata import PackageNotFoundError, version as metadata_version
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from pathlib import Path
 from typing import (
     Any,
@@ -22,30 +23,31 @@ from typing import (
     Literal,
     TypeVar,
     cast,
+    TYPE_CHECKING,
 )
 
 import click
 from click.core import ParameterSource
-from rich.console import RenderableType, Group
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.markdown import Markdown
-from rich.rule import Rule
 
-from packaging.version import InvalidVersion, Version
-
-from . import __version__ as package_version
+from .cache import configure_cache, flush_caches
 from .config import (
     CHANGELOG_DIRECTORY_NAME,
     Config,
     EXPORT_STYLE_COMPACT,
+    EXPORT_STYLE_STANDARD,
+    ExportStyle,
     PACKAGE_METADATA_FILENAME,
     default_config_path,
     load_project_config,
     package_metadata_path,
     save_config,
 )
+from .discovery import (
+    DISCOVERY_ENV,
+    DISCOVERY_MODES,
+    configure_discovery,
+    invalidate_discovery,
+)
 from .entries import (
     ENTRY_TYPES,
     Entry,
@@ -55,22 +57,29 @@ from .entries import (
     iter_multi_project_entries,
     sort_entries_desc,
     write_entry,
+    write_entry_created,
 )
 from .modules import Module, discover_modules_from_config
+from .parallel import JOBS_ENV, configure_jobs, parallel_map, process_map
+from . import storage
+from .profiling import Profiler, disable_profiling, enable_profiling, span
 from .releases import (
+    ProjectSnapshot,
     ReleaseManifest,
     NOTES_FILENAME,
-    build_entry_release_index,
-    collect_release_entries,
-    iter_release_manifests,
     load_release_entry,
     release_directory,
     serialize_release_manifest,
     unused_entries,
-    used_entry_ids,
     write_release_manifest,
 )
-from .validate import run_validation, run_validation_with_modules
+from .validate import (
+    ValidationState,
+    hash_files,
+    run_validation,
+    run_validation_with_modules,
+    validation_inputs,
+)
 from .utils import (
     CHECKMARK,
     CROSS,
@@ -78,6 +87,8 @@ from .utils import (
     WARNING,
     create_annotated_git_tag,
     create_git_commit,
+    git_changed_files,
+    git_first_added,
     has_staged_changes,
     abort_on_user_interrupt,
     configure_logging,
@@ -92,12 +103,19 @@ from .utils import (
     log_info,
     log_success,
     log_warning,
+    defines_link_references,
     normalize_markdown,
     push_current_branch,
     push_git_tag,
     slugify,
 )
 
+if TYPE_CHECKING:
+    from packaging.version import Version
+    from rich.console import RenderableType
+    from rich.table import Table
+    from rich.text import Text
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 __all__ = [
@@ -118,10 +136,10 @@ VERSION_FLAGS = {"--version", "-V"}
 
 
 def _resolve_cli_version() -> str:
-    try:
-        return metadata_version("tenzir-changelog")
-    except PackageNotFoundError:
-        return package_version
+    # Resolved on demand: importlib.metadata is slow to import and scan.
+    from . import __version__ as package_version
+
+    return package_version
 
 
 ENTRY_TYPE_STYLES = {
@@ -136,16 +154,25 @@ ENTRY_TYPE_EMOJIS = {
     "bugfix": "🐞",
     "change": "🔧",
 }
-STATUS_TABLE_CELLS: dict[str, RenderableType] = {
-    "new": Text.from_ansi(CHECKMARK),
-    "existing": Text(WARNING, style="yellow"),
-    "removed": Text.from_ansi(CROSS),
-}
+
+
+def _status_table_cell(status: str) -> Text:
+    """Return the status marker shown in release summary tables."""
+    from rich.text import Text
+
+    if status == "new":
+        return Text.from_ansi(CHECKMARK)
+    if status == "existing":
+        return Text(WARNING, style="yellow")
+    if status == "removed":
+        return Text.from_ansi(CROSS)
+    return Text("•")
 
 
 def _print_renderable(renderable: RenderableType) -> None:
     """Emit a Rich renderable to the console without logging prefixes."""
-    console.print(renderable)
+    with span("render"):
+        console.print(renderable)
 
 
 def _format_section_title(entry_type: str, include_emoji: bool) -> str:
@@ -297,6 +324,30 @@ def explicit_links_option() -> Callable[[F], F]:
     return decorator
 
 
+def since_until_options() -> Callable[[F], F]:
+    """Shared --since/--until options selecting an inclusive range of releases.
+
+    Each bound accepts a release version (v1.2.0) or a date (YYYY-MM-DD).
+    Only the releases in range are loaded, and output is grouped by release.
+
+    Used by: release notes, show
+    """
+
+    def decorator(f: F) -> F:
+        f = click.option(
+            "--until",
+            metavar="VERSION|DATE",
+            help="Include releases up to this version or date (inclusive).",
+        )(f)
+        return click.option(
+            "--since",
+            metavar="VERSION|DATE",
+            help="Include releases from this version or date onwards (inclusive).",
+        )(f)
+
+    return decorator
+
+
 IdentifierKind = Literal["row", "entry", "release", "unreleased"]
 
 
@@ -542,6 +593,8 @@ def _ellipsis_cell(
 ) -> Text | str:
     """Return a Text cell with ellipsis truncation when requested."""
 
+    from rich.text import Text
+
     spec = specs.get(column)
     if not spec:
         return value
@@ -596,8 +649,10 @@ class CLIContext:
 
     project_root: Path
     config_path: Path
+    ref: Optional[str] = None  # git ref to read from instead of the working tree
     _config: Optional[Config] = None
     _modules: list[Module] | None = None  # cached discovered modules
+    _snapshots: dict[Path, ProjectSnapshot] = field(default_factory=dict)
 
     def ensure_config(self, *, create_if_missing: bool = False) -> Config:
         if self._config is None:
@@ -605,7 +660,8 @@ class CLIContext:
             project_root = config_path.parent
             self.project_root = project_root
             try:
-                self._config = load_project_config(project_root)
+                with span("config.load"):
+                    self._config = load_project_config(project_root)
             except FileNotFoundError:
                 if not create_if_missing:
                     log_info(f"no tenzir-changelog project detected at {project_root}.")
@@ -623,6 +679,11 @@ class CLIContext:
     def reset_config(self, config: Config) -> None:
         self._config = config
 
+    def ensure_writable(self, action: str) -> None:
+        """Reject commands that modify the project when reading from a git ref."""
+        if self.ref is not None:
+            raise click.ClickException(f"Cannot {action} while reading from --ref {self.ref}.")
+
     def has_modules(self) -> bool:
         """Return True if modules are configured."""
         return self.ensure_config().modules is not None
@@ -634,9 +695,24 @@ class CLIContext:
         """
         if self._modules is None:
             config = self.ensure_config()
-            self._modules = discover_modules_from_config(self.project_root, config)
+            with span("modules.discover"):
+                self._modules = discover_modules_from_config(self.project_root, config)
         return self._modules
 
+    def snapshot(self, root: Path | None = None) -> ProjectSnapshot:
+        """Return the cached release snapshot for the project or a module root."""
+        key = root if root is not None else self.project_root
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = ProjectSnapshot(key)
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    def reset_snapshots(self) -> None:
+        """Drop cached release snapshots after releases changed on disk."""
+        self._snapshots.clear()
+        invalidate_discovery()
+
 
 def _default_project_id(project_root: Path) -> str:
     slug = slugify(project_root.name)
@@ -662,14 +738,14 @@ def _resolve_project_root(value: Path, *, bootstrap_in_subdir: bool = False) ->
     resolved = value.resolve()
 
     def _has_config(path: Path) -> bool:
-        return default_config_path(path).exists()
+        return storage.path_exists(default_config_path(path))
 
     def _is_package_root(path: Path) -> bool:
         metadata = path / PACKAGE_METADATA_FILENAME
-        if not metadata.is_file():
+        if not storage.is_file(metadata):
             return False
         changelog_dir = path / CHANGELOG_DIRECTORY_NAME
-        if changelog_dir.exists() and not changelog_dir.is_dir():
+        if storage.path_exists(changelog_dir) and not storage.is_dir(changelog_dir):
             return False
         return True
 
@@ -677,20 +753,20 @@ def _resolve_project_root(value: Path, *, bootstrap_in_subdir: bool = False) ->
         if path.name != CHANGELOG_DIRECTORY_NAME:
             return False
         metadata = package_metadata_path(path)
-        return metadata.is_file()
+        return storage.is_file(metadata)
 
-    if resolved.is_dir():
+    if storage.is_dir(resolved):
         if _has_config(resolved) or _is_package_changelog(resolved):
             return resolved
         if _is_package_root(resolved):
             return (resolved / CHANGELOG_DIRECTORY_NAME).resolve()
         # Check if a changelog/ subdirectory exists with a valid config.
         changelog_subdir = resolved / CHANGELOG_DIRECTORY_NAME
-        if changelog_subdir.is_dir() and _has_config(changelog_subdir):
+        if storage.is_dir(changelog_subdir) and _has_config(changelog_subdir):
             return changelog_subdir.resolve()
 
     for candidate in [resolved] + list(resolved.parents):
-        if not candidate.is_dir():
+        if not storage.is_dir(candidate):
             continue
         if _has_config(candidate) or _is_package_changelog(candidate):
             return candidate
@@ -773,10 +849,22 @@ def create_cli_context(
     root: Path | None = None,
     config: Optional[Path] = None,
     debug: bool = False,
+    cache: bool = True,
+    jobs: Optional[int] = None,
+    discovery: Optional[str] = None,
+    ref: Optional[str] = None,
 ) -> CLIContext:
-    """Return a CLIContext using the same resolution logic as the CLI entry point."""
+    """Return a CLIContext using the same resolution logic as the CLI entry point.
+
+    With `ref`, the project is read from that git commit-ish instead of the
+    working tree, and persistent caches are bypassed.
+    """
 
     configure_logging(debug)
+    configure_cache(enabled=cache and ref is None)
+    configure_jobs(jobs)
+    configure_discovery(discovery)
+    storage.configure_storage(ref, start=root if root is not None else Path("."))
 
     if root is None:
         # No explicit --root: bootstrap into changelog/ subdirectory if needed.
@@ -788,7 +876,7 @@ def create_cli_context(
     config_path = config.resolve() if config else default_config_path(resolved_root)
     log_debug(f"resolved project root: {resolved_root}")
     log_debug(f"using config path: {config_path}")
-    return CLIContext(project_root=resolved_root, config_path=config_path)
+    return CLIContext(project_root=resolved_root, config_path=config_path, ref=ref)
 
 
 @click.group(invoke_without_command=True, context_settings={"help_option_names": ["-h", "--help"]})
@@ -808,17 +896,120 @@ def create_cli_context(
     is_flag=True,
     help="Enable debug logging.",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the persistent cache of parsed entries.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=0),
+    help=(
+        "Load entry files and validate modules with this many parallel workers "
+        "(0 = one per CPU). "
+        f"Defaults to ${JOBS_ENV} or sequential loading."
+    ),
+)
+@click.option(
+    "--discovery",
+    type=click.Choice(DISCOVERY_MODES),
+    help=(
+        "Find changelog files by globbing the filesystem or by listing tracked and "
+        f"untracked, non-ignored files with git. Defaults to ${DISCOVERY_ENV} or filesystem."
+    ),
+)
+@click.option(
+    "--ref",
+    metavar="COMMIT-ISH",
+    help="Read the changelog from a git ref (branch, tag, or commit) without a checkout.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print a per-phase timing breakdown to stderr on exit.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(path_type=Path, dir_okay=False),
+    help="Write a JSON timing trace (Chrome trace format) to this file.",
+)
 @click.pass_context
-def cli(ctx: click.Context, root: Path | None, config: Optional[Path], debug: bool) -> None:
+def cli(
+    ctx: click.Context,
+    root: Path | None,
+    config: Optional[Path],
+    debug: bool,
+    no_cache: bool,
+    jobs: Optional[int],
+    discovery: Optional[str],
+    ref: Optional[str],
+    profile: bool,
+    profile_output: Optional[Path],
+) -> None:
     """Manage changelog entries and release manifests."""
 
-    ctx.obj = create_cli_context(root=root, config=config, debug=debug)
+    if profile or profile_output is not None:
+        profiler = enable_profiling()
+        ctx.call_on_close(
+            lambda: _finish_profiling(profiler, summary=profile, output=profile_output)
+        )
+    ctx.obj = create_cli_context(
+        root=root,
+        config=config,
+        debug=debug,
+        cache=not no_cache,
+        jobs=jobs,
+        discovery=discovery,
+        ref=ref,
+    )
+    ctx.call_on_close(flush_caches)
 
     if ctx.invoked_subcommand is None:
         ctx.invoke(show_entries)
 
 
-cli = click.version_option(version=_resolve_cli_version())(cli)
+def _print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"{ctx.find_root().info_name}, version {_resolve_cli_version()}")
+    ctx.exit()
+
+
+cli = click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)(cli)
+
+
+def _finish_profiling(profiler: Profiler, *, summary: bool, output: Optional[Path]) -> None:
+    from rich.table import Table
+
+    disable_profiling()
+    if output is not None:
+        profiler.write_trace(output)
+    if not summary:
+        return
+    wall = profiler.elapsed()
+    table = Table(title="Profile", title_justify="left", box=None, padding=(0, 2, 0, 0))
+    table.add_column("Phase")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("% Wall", justify="right")
+    for phase in profiler.summary():
+        table.add_row(
+            phase.name,
+            str(phase.calls),
+            f"{phase.total * 1000:.1f}",
+            f"{phase.self_total * 1000:.1f}",
+            f"{phase.total / wall:.1%}" if wall else "—",
+        )
+    table.add_row("wall", "", f"{wall * 1000:.1f}", "", "", style="bold")
+    console.print(table)
 
 
 def _filter_entries_by_project(
@@ -870,11 +1061,9 @@ def _filter_entries_by_component(entries: Iterable[Entry], components: set[str])
     return filtered
 
 
-def _build_release_sort_order(project_root: Path) -> dict[str, int]:
+def _build_release_sort_order(snapshot: ProjectSnapshot) -> dict[str, int]:
     """Return a mapping from release version to display order rank."""
-    manifests = list(iter_release_manifests(project_root))
-    manifests.sort(key=lambda manifest: (manifest.created, manifest.version))
-    return {manifest.version: index for index, manifest in enumerate(manifests)}
+    return dict(snapshot.release_order)
 
 
 def _sort_entries_for_display(
@@ -886,15 +1075,14 @@ def _sort_entries_for_display(
     entries_list = list(entries)
     unreleased_rank = len(release_order) + 1
 
-    def sort_key(entry: Entry) -> tuple[int, datetime, str]:
+    def sort_key(entry: Entry) -> tuple[int, tuple[int, str]]:
         versions = release_index.get(entry.entry_id) or []
         if versions:
             ranks = [release_order.get(version, unreleased_rank) for version in versions]
             release_rank = min(ranks)
         else:
             release_rank = unreleased_rank  # unreleased entries last
-        created = entry.created_at or datetime.min.replace(tzinfo=timezone.utc)
-        return (release_rank, created, entry.entry_id)
+        return (release_rank, entry.sort_key)
 
     # Sort ascending by (release_rank, created, entry_id): oldest entries first
     return sorted(entries_list, key=sort_key)
@@ -918,15 +1106,18 @@ def _entry_release_group(
     return sorted(versions)[0]
 
 
-def _collect_unused_entries_for_release(project_root: Path, config: Config) -> list[Entry]:
-    all_entries = list(iter_entries(project_root))
-    used = used_entry_ids(project_root)
+def _collect_unused_entries_for_release(snapshot: ProjectSnapshot, config: Config) -> list[Entry]:
+    all_entries = list(iter_entries(snapshot.project_root))
+    used = set(snapshot.used_entry_ids)
     unused = unused_entries(all_entries, used)
     filtered = [entry for entry in unused if entry.project is None or entry.project == config.id]
     return filtered
 
 
 def _render_project_header(config: Config) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
     legend = "  ".join(
         f"{ENTRY_TYPE_EMOJIS.get(entry_type, '•')} {entry_type}"
         for entry_type in ENTRY_EXPORT_ORDER
@@ -952,7 +1143,11 @@ def _render_entries(
     release_order: dict[str, int] | None = None,
     *,
     include_emoji: bool = True,
+    row_offset: int = 0,
 ) -> None:
+    from rich.table import Table
+    from rich.text import Text
+
     if show_banner:
         _render_project_header(config)
 
@@ -1080,9 +1275,9 @@ def _render_entries(
         row: list[RenderableType] = []
         if "num" in visible_columns:
             if release_order is not None:
-                display_row_num = total_rows - index
+                display_row_num = total_rows - index + row_offset
             else:
-                display_row_num = index + 1
+                display_row_num = index + 1 + row_offset
             row.append(str(display_row_num))
         if "date" in visible_columns:
             row.append(created_display)
@@ -1131,6 +1326,11 @@ def _render_release(
     *,
     project_id: str,
 ) -> None:
+    from rich.panel import Panel
+    from rich.rule import Rule
+    from rich.table import Table
+    from rich.text import Text
+
     _print_renderable(Rule(f"Release {manifest.version}"))
     header = Text.assemble(
         ("Title: ", "bold"),
@@ -1201,6 +1401,11 @@ def _render_single_entry(
     include_emoji: bool = True,
 ) -> None:
     """Display a single changelog entry with formatted output."""
+    from rich.console import Group
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.text import Text
+
     # Build title with emoji and type color
     type_color = ENTRY_TYPE_STYLES.get(entry.type, "white")
 
@@ -1266,23 +1471,58 @@ def _render_single_entry(
     )
 
 
+def _page_multi_project_entries(
+    entries: list[MultiProjectEntry],
+    projects: list[tuple[Path, Config]],
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> tuple[list[MultiProjectEntry], int]:
+    """Return entries oldest first and the row number of the first one.
+
+    With `limit` or `offset`, only the newest entries after skipping `offset`
+    are returned, and the row number is that of the full table.
+    """
+    project_order = {config.id: index for index, (_, config) in enumerate(projects)}
+
+    def sort_key(item: MultiProjectEntry) -> tuple[int, int, str]:
+        entry = item.entry
+        project_idx = project_order.get(item.project_id, len(project_order))
+        created_key, entry_id = entry.sort_key
+        # Sort by date first for global chronological order (oldest first, newest last)
+        return (created_key, project_idx, entry_id)
+
+    if limit is None and not offset:
+        return sorted(entries, key=sort_key), 1
+    count = len(entries) if limit is None else offset + limit
+    selected = heapq.nlargest(count, entries, key=sort_key)[offset:]
+    return selected[::-1], len(entries) - offset - len(selected) + 1
+
+
 def _render_entries_multi_project(
     entries: list[MultiProjectEntry],
     projects: list[tuple[Path, Config]],
+    snapshots: Mapping[Path, ProjectSnapshot],
     *,
     include_emoji: bool = True,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> None:
-    """Render entries from multiple projects with a Project column."""
+    """Render entries from multiple projects with a Project column.
+
+    With `limit` or `offset`, only the newest entries after skipping `offset`
+    are rendered; row numbers stay those of the full table.
+    """
+    from rich.table import Table
+    from rich.text import Text
+
     if not entries:
         log_info("No entries found across all projects.")
         return
 
-    project_order = {config.id: index for index, (_, config) in enumerate(projects)}
-
     # Build release index for each project
     release_indices: dict[str, dict[str, list[str]]] = {}
     for project_root, config in projects:
-        release_indices[config.id] = build_entry_release_index(project_root, project=config.id)
+        release_indices[config.id] = snapshots[project_root].release_index
 
     # Use the unified layout with project column enabled
     include_component = any(multi.entry.components for multi in entries)
@@ -1343,17 +1583,13 @@ def _render_entries_multi_project(
     if "id" in visible_columns:
         _add_table_column(table, "ID", "id", column_specs, style="cyan", no_wrap_default=True)
 
-    def sort_key(item: MultiProjectEntry) -> tuple[float, int, str]:
-        entry = item.entry
-        project_idx = project_order.get(item.project_id, len(project_order))
-        created = entry.created_at or datetime.min.replace(tzinfo=timezone.utc)
-        # Sort by date first for global chronological order (oldest first, newest last)
-        return (created.timestamp(), project_idx, entry.entry_id)
-
-    sorted_entries = sorted(entries, key=sort_key)
+    sorted_entries, first_row = _page_multi_project_entries(entries, projects, limit, offset)
+    if not sorted_entries:
+        log_info("No entries found across all projects.")
+        return
 
     # Add rows
-    for index, multi_entry in enumerate(sorted_entries, 1):
+    for index, multi_entry in enumerate(sorted_entries, first_row):
         entry = multi_entry.entry
         metadata = entry.metadata
         project_name = multi_entry.project_name
@@ -1416,6 +1652,256 @@ def _component_matches(entry: Entry, normalized_components: set[str]) -> bool:
     )
 
 
+def _entry_release_groups(
+    snapshot: ProjectSnapshot,
+    unreleased: Iterable[Entry],
+    release_order: dict[str, int],
+) -> list[tuple[int, list[Entry], list[str]]]:
+    """Group entries by their display rank without reading released entries.
+
+    Entries rank as in the table view: by the release they first appeared in,
+    with unreleased entries last. Each group holds the rank, the entries that
+    are already loaded, and the ids of released entries still to be read.
+    Groups are ordered oldest first.
+    """
+    release_index = snapshot.release_index
+    unreleased_rank = len(release_order) + 1
+
+    def release_rank(entry_id: str) -> int:
+        versions = release_index.get(entry_id) or []
+        if not versions:
+            return unreleased_rank
+        return min(release_order.get(version, unreleased_rank) for version in versions)
+
+    loaded: dict[int, list[Entry]] = {}
+    pending: dict[int, list[str]] = {}
+    unreleased_ids: set[str] = set()
+    for entry in unreleased:
+        unreleased_ids.add(entry.entry_id)
+        loaded.setdefault(release_rank(entry.entry_id), []).append(entry)
+    for entry_id in release_index:
+        if entry_id not in unreleased_ids:
+            pending.setdefault(release_rank(entry_id), []).append(entry_id)
+    return [
+        (rank, loaded.get(rank, []), pending.get(rank, []))
+        for rank in sorted(loaded.keys() | pending.keys())
+    ]
+
+
+def _select_newest_entries(
+    snapshot: ProjectSnapshot,
+    unreleased: Iterable[Entry],
+    release_order: dict[str, int],
+    *,
+    count: Optional[int],
+    keep: Callable[[Entry], bool],
+) -> list[Entry]:
+    """Return up to `count` of the newest entries passing `keep`, newest first.
+
+    Entries rank as in the table view: by release, then by creation time. The
+    release of every entry is known from the manifests alone, so releases are
+    visited newest first and their entry files are only read until `count`
+    entries have been kept. A heap then picks the newest among those.
+    """
+    candidates: list[tuple[int, Entry]] = []
+    for rank, loaded, pending in reversed(
+        _entry_release_groups(snapshot, unreleased, release_order)
+    ):
+        group = loaded + list(snapshot.load_released_entries(pending).values())
+        candidates.extend((rank, entry) for entry in group if keep(entry))
+        if count is not None and len(candidates) >= count:
+            break
+    limit = len(candidates) if count is None else count
+    newest = heapq.nlargest(limit, candidates, key=lambda item: (item[0], item[1].sort_key))
+    return [entry for _, entry in newest]
+
+
+def _collect_multi_project_entries(
+    ctx: CLIContext,
+    modules: list[Module],
+    project_filter: tuple[str, ...],
+    component_filter: tuple[str, ...],
+) -> tuple[list[MultiProjectEntry], list[tuple[Path, Config]], dict[Path, ProjectSnapshot]]:
+    """Return the filtered entries of the project and its modules."""
+    config = ctx.ensure_config()
+    # Build combined project list: parent + modules
+    combined_projects: list[tuple[Path, Config]] = [(ctx.project_root, config)]
+    combined_projects.extend((m.root, m.config) for m in modules)
+
+    project_filters = {value.strip() for value in project_filter if value.strip()}
+    available_projects = {cfg.id for _, cfg in combined_projects}
+    unknown_filters = sorted(project_filters - available_projects)
+    if unknown_filters:
+        available_display = ", ".join(sorted(available_projects))
+        raise click.ClickException(
+            f"Unknown project filter(s): {', '.join(unknown_filters)}. "
+            f"Available projects: {available_display or 'none'}."
+        )
+
+    normalized_components = {
+        value.strip().lower() for value in component_filter if value and value.strip()
+    }
+
+    snapshots = {root: ctx.snapshot(root) for root, _ in combined_projects}
+    multi_entries = [
+        multi_entry
+        for multi_entry in iter_multi_project_entries(combined_projects, snapshots=snapshots)
+        if (
+            (not project_filters or multi_entry.project_id in project_filters)
+            and _component_matches(multi_entry.entry, normalized_components)
+        )
+    ]
+    return multi_entries, combined_projects, snapshots
+
+
+def _plain_field(value: str) -> str:
+    """Collapse whitespace so that a value fits into one tab-separated field."""
+    return " ".join(value.split())
+
+
+def _plain_entry_row(
+    row_num: int, entry: Entry, version: str, *, project: Optional[str] = None
+) -> str:
+    """Return the plain-text row of an entry, with fields separated by tabs."""
+    metadata = entry.metadata
+    fields = [str(row_num)]
+    if project is not None:
+        fields.append(project)
+    fields.extend(
+        [
+            entry.created_date.isoformat() if entry.created_date else "",
+            version,
+            str(metadata.get("title", "Untitled")),
+            str(metadata.get("type", "change")),
+            ", ".join(entry.components),
+            ", ".join(f"#{pr}" for pr in _parse_pr_numbers(metadata)),
+            ", ".join(metadata.get("authors") or []),
+            entry.entry_id,
+        ]
+    )
+    return "\t".join(_plain_field(field) for field in fields)
+
+
+def _show_entries_plain(
+    ctx: CLIContext,
+    identifiers: tuple[str, ...],
+    project_filter: tuple[str, ...],
+    component_filter: tuple[str, ...],
+    *,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> None:
+    """Write the table view as tab-separated rows to stdout.
+
+    Rows carry the same numbers and order as the table view. Without
+    identifiers, filters, or paging, releases are read and written one at a
+    time, so output starts before the whole history has been loaded.
+    """
+    written = 0
+
+    def write(rows: list[str]) -> None:
+        nonlocal written
+        if rows:
+            emit_output("\n".join(rows))
+            written += len(rows)
+
+    modules = ctx.get_modules()
+    if modules:
+        multi_entries, combined_projects, snapshots = _collect_multi_project_entries(
+            ctx, modules, project_filter, component_filter
+        )
+        page, first_row = _page_multi_project_entries(
+            multi_entries, combined_projects, limit, offset
+        )
+        release_indices = {cfg.id: snapshots[root].release_index for root, cfg in combined_projects}
+        rows: list[str] = []
+        for row_num, multi_entry in enumerate(page, first_row):
+            project_index = release_indices.get(multi_entry.project_id, {})
+            versions = project_index.get(multi_entry.entry.entry_id, [])
+            rows.append(
+                _plain_entry_row(
+                    row_num,
+                    multi_entry.entry,
+                    versions[-1] if versions else "",
+                    project=multi_entry.project_name,
+                )
+            )
+        write(rows)
+        if not written:
+            log_info("No entries found across all projects.")
+        return
+
+    config = ctx.ensure_config()
+    snapshot = ctx.snapshot()
+    projects = set(project_filter)
+    components = _normalize_component_filters(component_filter, config)
+    unreleased = list(iter_entries(ctx.project_root))
+    release_index = snapshot.release_index
+    release_order = _build_release_sort_order(snapshot)
+
+    def version_of(entry: Entry) -> str:
+        return ", ".join(release_index.get(entry.entry_id) or [])
+
+    def keep(entry: Entry) -> bool:
+        return bool(
+            _filter_entries_by_project([entry], projects, config.id)
+            and _filter_entries_by_component([entry], components)
+        )
+
+    if identifiers:
+        entry_map = {entry.entry_id: entry for entry in unreleased}
+        for entry_id, entry in snapshot.released_entries.items():
+            entry_map.setdefault(entry_id, entry)
+        resolutions = _resolve_identifiers_sequence(
+            identifiers,
+            snapshot=snapshot,
+            config=config,
+            sorted_entries=_sort_entries_for_display(
+                entry_map.values(), release_index, release_order
+            ),
+            entry_map=entry_map,
+        )
+        resolved = [entry for resolution in resolutions for entry in resolution.entries]
+        selected = sort_entries_desc([entry for entry in resolved if keep(entry)])
+        selected = selected[offset : None if limit is None else offset + limit]
+        write(
+            [
+                _plain_entry_row(offset + index, entry, version_of(entry))
+                for index, entry in enumerate(selected, 1)
+            ]
+        )
+    elif limit is not None or offset or projects or components:
+        newest = _select_newest_entries(
+            snapshot,
+            unreleased,
+            release_order,
+            count=None if limit is None else offset + limit,
+            keep=keep,
+        )
+        numbered = list(enumerate(newest, 1))[offset:]
+        write(
+            [_plain_entry_row(row, entry, version_of(entry)) for row, entry in reversed(numbered)]
+        )
+    else:
+        # Rows count down to 1, so the number of entries must be known before
+        # the first row is written. Entries without a file are not shown.
+        available = snapshot.released_entry_ids_with_files()
+        groups = [
+            (rank, loaded, [entry_id for entry_id in pending if entry_id in available])
+            for rank, loaded, pending in _entry_release_groups(snapshot, unreleased, release_order)
+        ]
+        remaining = sum(len(loaded) + len(pending) for _, loaded, pending in groups)
+        for _, loaded, pending in groups:
+            group = loaded + list(snapshot.load_released_entries(pending).values())
+            rows = []
+            for entry in sorted(group, key=lambda item: item.sort_key):
+                rows.append(_plain_entry_row(remaining, entry, version_of(entry)))
+                remaining -= 1
+            write(rows)
+    if not written:
+        log_info("no entries found.")
+
+
 def _show_entries_table(
     ctx: CLIContext,
     identifiers: tuple[str, ...],
@@ -1424,65 +1910,68 @@ def _show_entries_table(
     banner: bool,
     *,
     include_emoji: bool,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> None:
     # Build list of projects (including modules if configured)
     modules = ctx.get_modules()
 
     # Single-project with modules mode
     if modules:
-        config = ctx.ensure_config()
-        # Build combined project list: parent + modules
-        combined_projects: list[tuple[Path, Config]] = [(ctx.project_root, config)]
-        combined_projects.extend((m.root, m.config) for m in modules)
-
-        project_filters = {value.strip() for value in project_filter if value.strip()}
-        available_projects = {cfg.id for _, cfg in combined_projects}
-        unknown_filters = sorted(project_filters - available_projects)
-        if unknown_filters:
-            available_display = ", ".join(sorted(available_projects))
-            raise click.ClickException(
-                f"Unknown project filter(s): {', '.join(unknown_filters)}. "
-                f"Available projects: {available_display or 'none'}."
-            )
-
-        normalized_components = {
-            value.strip().lower() for value in component_filter if value and value.strip()
-        }
-
-        def filtered_with_modules(
-            entries: Iterable[MultiProjectEntry],
-        ) -> list[MultiProjectEntry]:
-            return [
-                multi_entry
-                for multi_entry in entries
-                if (
-                    (not project_filters or multi_entry.project_id in project_filters)
-                    and _component_matches(multi_entry.entry, normalized_components)
-                )
-            ]
-
-        multi_entries = filtered_with_modules(iter_multi_project_entries(combined_projects))
-        _render_entries_multi_project(multi_entries, combined_projects, include_emoji=include_emoji)
+        multi_entries, combined_projects, snapshots = _collect_multi_project_entries(
+            ctx, modules, project_filter, component_filter
+        )
+        _render_entries_multi_project(
+            multi_entries,
+            combined_projects,
+            snapshots,
+            include_emoji=include_emoji,
+            limit=limit,
+            offset=offset,
+        )
         return
 
     # Single-project mode (existing logic)
     config = ctx.ensure_config()
     project_root = ctx.project_root
+    snapshot = ctx.snapshot()
     projects = set(project_filter)
     components = _normalize_component_filters(component_filter, config)
 
-    # Collect all entries (unreleased and released)
+    # Collect unreleased entries; released ones are loaded as needed
     entries = list(iter_entries(project_root))
+
+    # Build release index
+    release_index = snapshot.release_index
+    release_order = _build_release_sort_order(snapshot)
+
+    if not identifiers and (limit is not None or offset):
+        selected = _select_newest_entries(
+            snapshot,
+            entries,
+            release_order,
+            count=None if limit is None else offset + limit,
+            keep=lambda entry: bool(
+                _filter_entries_by_project([entry], projects, config.id)
+                and _filter_entries_by_component([entry], components)
+            ),
+        )
+        _render_entries(
+            selected[offset:][::-1],
+            release_index,
+            config,
+            show_banner=banner,
+            release_order=release_order,
+            include_emoji=include_emoji,
+            row_offset=offset,
+        )
+        return
+
     entry_map = {entry.entry_id: entry for entry in entries}
-    released_entries = collect_release_entries(project_root)
-    for entry_id, entry in released_entries.items():
+    for entry_id, entry in snapshot.released_entries.items():
         if entry_id not in entry_map:
             entry_map[entry_id] = entry
 
-    # Build release index
-    release_index = build_entry_release_index(project_root, project=config.id)
-    release_order = _build_release_sort_order(project_root)
-
     # Sort entries to match display order
     sorted_entries = _sort_entries_for_display(entry_map.values(), release_index, release_order)
 
@@ -1490,7 +1979,7 @@ def _show_entries_table(
     if identifiers:
         resolutions = _resolve_identifiers_sequence(
             identifiers,
-            project_root=project_root,
+            snapshot=snapshot,
             config=config,
             sorted_entries=sorted_entries,
             entry_map=entry_map,
@@ -1512,6 +2001,8 @@ def _show_entries_table(
     entries = _filter_entries_by_project(entries, projects, config.id)
     entries = _filter_entries_by_component(entries, components)
     render_release_order = release_order if not identifiers else None
+    if limit is not None or offset:
+        entries = sort_entries_desc(entries)[offset : None if limit is None else offset + limit]
     _render_entries(
         entries,
         release_index,
@@ -1519,29 +2010,40 @@ def _show_entries_table(
         show_banner=banner,
         release_order=render_release_order,
         include_emoji=include_emoji,
+        row_offset=offset,
     )
 
 
 def _load_release_entries_for_display(
-    project_root: Path,
+    snapshot: ProjectSnapshot,
     release_version: str,
     entry_map: dict[str, Entry],
 ) -> tuple[ReleaseManifest, list[Entry]]:
-    normalized_version = release_version.strip()
-    manifests = [
-        manifest
-        for manifest in iter_release_manifests(project_root)
-        if manifest.version == normalized_version
-    ]
-    if not manifests:
+    manifest = snapshot.find_manifest(release_version)
+    if manifest is None:
         raise click.ClickException(f"Release '{release_version}' not found.")
-    manifest = manifests[0]
+    return manifest, _load_manifest_entries(snapshot, manifest, entry_map)
+
+
+def _load_manifest_entries(
+    snapshot: ProjectSnapshot,
+    manifest: ReleaseManifest,
+    entry_map: dict[str, Entry],
+) -> list[Entry]:
+    project_root = snapshot.project_root
+    to_load = [entry_id for entry_id in manifest.entries if entry_id not in entry_map]
+    loaded = dict(
+        zip(
+            to_load,
+            parallel_map(
+                lambda entry_id: load_release_entry(project_root, manifest, entry_id), to_load
+            ),
+        )
+    )
     missing_entries: list[str] = []
     release_entries: list[Entry] = []
     for entry_id in manifest.entries:
-        entry = entry_map.get(entry_id)
-        if entry is None:
-            entry = load_release_entry(project_root, manifest, entry_id)
+        entry = entry_map.get(entry_id) or loaded.get(entry_id)
         if entry is None:
             missing_entries.append(entry_id)
             continue
@@ -1552,13 +2054,13 @@ def _load_release_entries_for_display(
         raise click.ClickException(
             f"Release '{manifest.version}' is missing entry files for: {missing_list}"
         )
-    return manifest, release_entries
+    return release_entries
 
 
 def _resolve_identifier(
     identifier: str,
     *,
-    project_root: Path,
+    snapshot: ProjectSnapshot,
     config: Config,
     sorted_entries: list[Entry],
     entry_map: dict[str, Entry],
@@ -1584,7 +2086,7 @@ def _resolve_identifier(
             raise click.ClickException(
                 "The 'unreleased' identifier is not supported by this command."
             )
-        entries = sort_entries_desc(_collect_unused_entries_for_release(project_root, config))
+        entries = sort_entries_desc(_collect_unused_entries_for_release(snapshot, config))
         return IdentifierResolution(kind="unreleased", entries=entries, identifier=token)
 
     try:
@@ -1611,9 +2113,7 @@ def _resolve_identifier(
             raise click.ClickException(
                 f"Release identifiers such as '{token}' are not supported by this command."
             )
-        manifest, release_entries = _load_release_entries_for_display(
-            project_root, token, entry_map
-        )
+        manifest, release_entries = _load_release_entries_for_display(snapshot, token, entry_map)
         return IdentifierResolution(
             kind="release",
             entries=release_entries,
@@ -1645,7 +2145,7 @@ def _resolve_identifier(
 def _resolve_identifiers_sequence(
     identifiers: Iterable[str],
     *,
-    project_root: Path,
+    snapshot: ProjectSnapshot,
     config: Config,
     sorted_entries: list[Entry],
     entry_map: dict[str, Entry],
@@ -1656,7 +2156,7 @@ def _resolve_identifiers_sequence(
     return [
         _resolve_identifier(
             identifier,
-            project_root=project_root,
+            snapshot=snapshot,
             config=config,
             sorted_entries=sorted_entries,
             entry_map=entry_map,
@@ -1666,7 +2166,7 @@ def _resolve_identifiers_sequence(
     ]
 
 
-ShowView = Literal["table", "card", "markdown", "json"]
+ShowView = Literal["table", "plain", "card", "markdown", "json"]
 
 
 def run_show_entries(
@@ -1680,6 +2180,10 @@ def run_show_entries(
     compact: Optional[bool] = None,
     include_emoji: bool = True,
     explicit_links: bool = False,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> None:
     """Python-friendly wrapper around the ``show`` command."""
 
@@ -1687,6 +2191,47 @@ def run_show_entries(
     project_filters = tuple(project_filter or ())
     component_filters = tuple(component_filter or ())
 
+    if limit is not None and limit < 1:
+        raise click.ClickException("--limit must be at least 1.")
+    if offset < 0:
+        raise click.ClickException("--offset cannot be negative.")
+
+    if since or until:
+        if identifier_values:
+            raise click.ClickException("Use either identifiers or --since/--until, not both.")
+        if limit is not None or offset:
+            raise click.ClickException("--limit/--offset cannot be combined with --since/--until.")
+        _show_release_range(
+            ctx,
+            since=since,
+            until=until,
+            view=view,
+            project_filter=project_filters,
+            component_filter=component_filters,
+            banner=banner,
+            compact=compact,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
+        )
+        return
+
+    if view == "plain":
+        if compact is not None:
+            raise click.ClickException(
+                "--compact/--no-compact only apply to markdown and json views."
+            )
+        if banner:
+            raise click.ClickException("--banner is only available in table view.")
+        _show_entries_plain(
+            ctx,
+            identifier_values,
+            project_filters,
+            component_filters,
+            limit=limit,
+            offset=offset,
+        )
+        return
+
     if view == "table":
         if compact is not None:
             raise click.ClickException(
@@ -1699,6 +2244,8 @@ def run_show_entries(
             component_filters,
             banner,
             include_emoji=include_emoji,
+            limit=limit,
+            offset=offset,
         )
         return
 
@@ -1715,6 +2262,8 @@ def run_show_entries(
             identifier_values,
             component_filters,
             include_emoji=include_emoji,
+            limit=limit,
+            offset=offset,
         )
         return
 
@@ -1727,71 +2276,157 @@ def run_show_entries(
             include_emoji=include_emoji,
             explicit_links=explicit_links,
             component_filter=component_filters,
+            limit=limit,
+            offset=offset,
         )
         return
 
     raise click.ClickException(f"Unsupported view '{view}'.")
 
 
-def _gather_entry_context(
-    project_root: Path,
-    modules: list[Module] | None = None,
-) -> tuple[dict[str, Entry], dict[str, list[str]], dict[str, int], list[Entry]]:
-    # Collect entries from main project
-    entries = list(iter_entries(project_root))
-    entry_map = {entry.entry_id: entry for entry in entries}
-    released_entries = collect_release_entries(project_root)
-    for entry_id, entry in released_entries.items():
-        entry_map.setdefault(entry_id, entry)
-    release_index_all = build_entry_release_index(project_root, project=None)
-    release_order = _build_release_sort_order(project_root)
+def _show_release_range(
+    ctx: CLIContext,
+    *,
+    since: Optional[str],
+    until: Optional[str],
+    view: ShowView,
+    project_filter: tuple[str, ...],
+    component_filter: tuple[str, ...],
+    banner: bool,
+    compact: Optional[bool],
+    include_emoji: bool,
+    explicit_links: bool,
+) -> None:
+    """Show the entries of the releases between `since` and `until`, by release."""
 
-    # Include module entries if provided
-    if modules:
-        for module in modules:
-            module_entries = list(iter_entries(module.root))
-            for entry in module_entries:
-                entry_map.setdefault(entry.entry_id, entry)
-            module_released = collect_release_entries(module.root)
-            for entry_id, entry in module_released.items():
-                entry_map.setdefault(entry_id, entry)
-            # Merge release index from module
-            module_release_index = build_entry_release_index(module.root, project=None)
-            for entry_id, versions in module_release_index.items():
-                if entry_id in release_index_all:
-                    release_index_all[entry_id].extend(versions)
-                else:
-                    release_index_all[entry_id] = versions
-            # Merge release order from module
-            module_release_order = _build_release_sort_order(module.root)
-            for version, order in module_release_order.items():
-                release_order.setdefault(version, order)
+    config = ctx.ensure_config()
+    snapshot = ctx.snapshot()
+    if view not in {"table", "plain"} and project_filter:
+        raise click.ClickException("--project/--banner are only available in table view.")
+    if view != "table" and banner:
+        raise click.ClickException("--project/--banner are only available in table view.")
+    if view in {"table", "plain", "card"} and compact is not None:
+        raise click.ClickException("--compact/--no-compact only apply to markdown and json views.")
 
-    sorted_entries = _sort_entries_for_display(entry_map.values(), release_index_all, release_order)
-    return entry_map, release_index_all, release_order, sorted_entries
+    components = _normalize_component_filters(component_filter, config)
+    manifests = _releases_in_range(snapshot, since, until)
+    sources = _release_range_sources(ctx, snapshot, config, manifests, components)
+
+    if view == "plain":
+        entries = _sort_entries_for_display(
+            _filter_entries_by_project(
+                [entry for source in sources for entry in source.entries],
+                set(project_filter),
+                config.id,
+            ),
+            snapshot.release_index,
+            _build_release_sort_order(snapshot),
+        )
+        rows = [
+            _plain_entry_row(
+                len(entries) - index,
+                entry,
+                ", ".join(snapshot.release_index.get(entry.entry_id) or []),
+            )
+            for index, entry in enumerate(entries)
+        ]
+        if rows:
+            emit_output("\n".join(rows))
+        else:
+            log_info("no entries found.")
+        return
+
+    if view == "table":
+        entries = _filter_entries_by_project(
+            [entry for source in sources for entry in source.entries],
+            set(project_filter),
+            config.id,
+        )
+        _render_entries(
+            entries,
+            snapshot.release_index,
+            config,
+            show_banner=banner,
+            release_order=_build_release_sort_order(snapshot),
+            include_emoji=include_emoji,
+        )
+        return
+
+    if view == "card":
+        from rich.rule import Rule
+
+        for source in sources:
+            if not source.entries:
+                continue
+            _print_renderable(Rule(f"Release {source.identifier}"))
+            for entry in source.entries:
+                versions = snapshot.release_index.get(entry.entry_id) or [source.identifier]
+                _render_single_entry(entry, versions, include_emoji=include_emoji)
+        return
+
+    if view not in {"markdown", "json"}:
+        raise click.ClickException(f"Unsupported view '{view}'.")
+    compact_flag = config.export_style == EXPORT_STYLE_COMPACT if compact is None else compact
+    emit_output(
+        _format_release_range(
+            sources,
+            view,
+            since=since,
+            until=until,
+            compact=compact_flag,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
+        )
+    )
+
+
+def _gather_entry_context(
+    ctx: CLIContext,
+    modules: list[Module] | None = None,
+) -> tuple[dict[str, Entry], dict[str, list[str]], dict[str, int], list[Entry]]:
+    # Collect entries from main project
+    snapshot = ctx.snapshot()
+    entries = list(iter_entries(snapshot.project_root))
+    entry_map = {entry.entry_id: entry for entry in entries}
+    for entry_id, entry in snapshot.released_entries.items():
+        entry_map.setdefault(entry_id, entry)
+    release_index_all = {
+        entry_id: list(versions) for entry_id, versions in snapshot.release_index.items()
+    }
+    release_order = _build_release_sort_order(snapshot)
 
+    # Include module entries if provided
+    if modules:
+        for module in modules:
+            module_snapshot = ctx.snapshot(module.root)
+            module_entries = list(iter_entries(module.root))
+            for entry in module_entries:
+                entry_map.setdefault(entry.entry_id, entry)
+            for entry_id, entry in module_snapshot.released_entries.items():
+                entry_map.setdefault(entry_id, entry)
+            # Merge release index from module
+            for entry_id, versions in module_snapshot.release_index.items():
+                release_index_all.setdefault(entry_id, []).extend(versions)
+            # Merge release order from module
+            for version, order in module_snapshot.release_order.items():
+                release_order.setdefault(version, order)
 
-def _get_module_latest_version(module_root: Path) -> str | None:
+    sorted_entries = _sort_entries_for_display(entry_map.values(), release_index_all, release_order)
+    return entry_map, release_index_all, release_order, sorted_entries
+
+
+def _get_module_latest_version(snapshot: ProjectSnapshot) -> str | None:
     """Get the latest release version for a module."""
-    versions: list[tuple[Version, str]] = []
-    for manifest in iter_release_manifests(module_root):
-        label = manifest.version
-        prefix = ""
-        if label.startswith("v"):
-            prefix = "v"
-            label = label[1:]
-        try:
-            versions.append((Version(label), prefix))
-        except InvalidVersion:
-            continue
-    if not versions:
+    latest = snapshot.semver_index.latest()
+    if latest is None:
         return None
-    versions.sort(key=lambda x: x[0], reverse=True)
-    latest_version, prefix = versions[0]
+    latest_version, manifest = latest
+    prefix = "v" if manifest.version.startswith("v") else ""
     return f"{prefix}{latest_version}"
 
 
 def _gather_module_released_entries(
+    ctx: CLIContext,
     modules: list[Module],
     previous_module_versions: dict[str, str] | None = None,
     target_module_versions: dict[str, str] | None = None,
@@ -1799,6 +2434,7 @@ def _gather_module_released_entries(
     """Gather released entries from all modules, keyed by module ID.
 
     Args:
+        ctx: Command context providing cached release snapshots
         modules: List of discovered modules
         previous_module_versions: Dict mapping module ID to version from previous
             parent release. Acts as a lower bound (exclusive).
@@ -1813,6 +2449,8 @@ def _gather_module_released_entries(
 
     Includes entries from releases in range (previous, target].
     """
+    from packaging.version import InvalidVersion, Version
+
     result: dict[str, tuple[Config, list[Entry]]] = {}
     current_versions: dict[str, str] = {}
     previous_versions = previous_module_versions or {}
@@ -1820,11 +2458,12 @@ def _gather_module_released_entries(
 
     for module in modules:
         module_id = module.config.id
+        module_snapshot = ctx.snapshot(module.root)
         previous_version_str = previous_versions.get(module_id)
         target_version_str = target_versions.get(module_id)
 
         # Get current latest version
-        latest_version = _get_module_latest_version(module.root)
+        latest_version = _get_module_latest_version(module_snapshot)
         if latest_version:
             current_versions[module_id] = latest_version
 
@@ -1848,7 +2487,7 @@ def _gather_module_released_entries(
 
         # Collect entries from releases in range (previous, target]
         new_entries: list[Entry] = []
-        for manifest in iter_release_manifests(module.root):
+        for manifest in module_snapshot.manifests:
             # Parse this release's version
             release_version_str = manifest.version.lstrip("v")
             try:
@@ -1887,6 +2526,8 @@ def _show_entries_card(
     component_filter: tuple[str, ...],
     *,
     include_emoji: bool,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> None:
     if not identifiers:
         raise click.ClickException(
@@ -1894,13 +2535,12 @@ def _show_entries_card(
         )
 
     config = ctx.ensure_config()
-    project_root = ctx.project_root
     modules = ctx.get_modules()
-    entry_map, release_index_all, _, sorted_entries = _gather_entry_context(project_root, modules)
+    entry_map, release_index_all, _, sorted_entries = _gather_entry_context(ctx, modules)
     components = _normalize_component_filters(component_filter, config)
     resolutions = _resolve_identifiers_sequence(
         identifiers,
-        project_root=project_root,
+        snapshot=ctx.snapshot(),
         config=config,
         sorted_entries=sorted_entries,
         entry_map=entry_map,
@@ -1908,11 +2548,20 @@ def _show_entries_card(
 
     release_index = release_index_all
     rendered = False
+    skip = offset
+    remaining = limit
     for resolution in resolutions:
         if resolution.kind == "unreleased" and not resolution.entries:
             console.print("[yellow]No unreleased entries found.[/yellow]")
             continue
         filtered_entries = _filter_entries_by_component(resolution.entries, components)
+        if skip:
+            dropped = min(skip, len(filtered_entries))
+            filtered_entries = filtered_entries[dropped:]
+            skip -= dropped
+        if remaining is not None:
+            filtered_entries = filtered_entries[:remaining]
+            remaining -= len(filtered_entries)
         if not filtered_entries:
             continue
         for entry in filtered_entries:
@@ -1938,20 +2587,22 @@ def _show_entries_export(
     include_emoji: bool,
     explicit_links: bool,
     component_filter: tuple[str, ...],
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> None:
     config = ctx.ensure_config()
-    project_root = ctx.project_root
+    snapshot = ctx.snapshot()
     components = _normalize_component_filters(component_filter, config)
-    entry_map, _, _, sorted_entries = _gather_entry_context(project_root)
+    entry_map, _, _, sorted_entries = _gather_entry_context(ctx)
 
     compact_flag = config.export_style == EXPORT_STYLE_COMPACT if compact is None else compact
-    release_index_export = build_entry_release_index(project_root, project=config.id)
+    release_index_export = snapshot.release_index
     manifest_for_export: ReleaseManifest | None = None
 
     if identifiers:
         resolutions = _resolve_identifiers_sequence(
             identifiers,
-            project_root=project_root,
+            snapshot=snapshot,
             config=config,
             sorted_entries=sorted_entries,
             entry_map=entry_map,
@@ -1994,6 +2645,8 @@ def _show_entries_export(
         dates = [entry.created_at for entry in export_entries if entry.created_at]
         fallback_created = min(dates) if dates else None
 
+    if limit is not None or offset:
+        export_entries = export_entries[offset : None if limit is None else offset + limit]
     if not export_entries:
         raise click.ClickException(
             "No entries matched the provided identifiers and component filters for export."
@@ -2038,7 +2691,18 @@ def _show_entries_export(
     "--table",
     "view_flags",
     flag_value="table",
-    help="Display entries in a table view (default).",
+    help="Display entries in a table view (default on a terminal).",
+    multiple=True,
+)
+@click.option(
+    "-p",
+    "--plain",
+    "view_flags",
+    flag_value="plain",
+    help=(
+        "Write the table as tab-separated rows of number, date, version, title, "
+        "type, components, PRs, authors, and ID (default when stdout is not a terminal)."
+    ),
     multiple=True,
 )
 @click.option(
@@ -2091,6 +2755,20 @@ def _show_entries_export(
     default=None,
     help="Render @mentions and PR references as explicit Markdown links.",
 )
+@since_until_options()
+@click.option(
+    "-n",
+    "--limit",
+    type=click.IntRange(min=1),
+    help="Show only the newest N entries.",
+)
+@click.option(
+    "--offset",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Skip the newest N entries, for paging together with --limit.",
+)
 @click.pass_obj
 def show_entries(
     ctx: CLIContext,
@@ -2102,12 +2780,22 @@ def show_entries(
     compact: Optional[bool],
     no_emoji: bool,
     explicit_links: Optional[bool],
+    since: Optional[str],
+    until: Optional[str],
+    limit: Optional[int],
+    offset: int,
 ) -> None:
     """Display changelog entries in tables, cards, or export formats."""
 
     config = ctx.ensure_config()
-    view_choice = view_flags[-1] if view_flags else "table"
-    if view_choice not in {"table", "card", "markdown", "json"}:
+    if view_flags:
+        view_choice = view_flags[-1]
+    else:
+        # When the output is piped or redirected, plain rows are both faster
+        # to produce and easier to process than a table. A banner only exists
+        # in the table view, so asking for one keeps the table.
+        view_choice = "table" if banner or sys.stdout.isatty() else "plain"
+    if view_choice not in {"table", "plain", "card", "markdown", "json"}:
         raise click.ClickException(f"Unsupported view '{view_choice}'.")
     # Resolve explicit_links: CLI flag overrides config default
     resolved_explicit_links = config.explicit_links if explicit_links is None else explicit_links
@@ -2121,6 +2809,10 @@ def show_entries(
         compact=compact,
         include_emoji=not no_emoji,
         explicit_links=resolved_explicit_links,
+        since=since,
+        until=until,
+        limit=limit,
+        offset=offset,
     )
 
 
@@ -2182,6 +2874,8 @@ def _normalize_entry_type(value: str) -> Optional[str]:
 
 
 def _prompt_entry_type(default: str = DEFAULT_ENTRY_TYPE) -> str:
+    from rich.text import Text
+
     prompt_text = Text("Type: ", style="bold")
     for idx, (name, key) in enumerate(ENTRY_TYPE_CHOICES):
         prompt_text.append(name)
@@ -2306,6 +3000,7 @@ def create_entry(
 ) -> Path:
     """Python wrapper for creating entries that mirrors the CLI behavior."""
 
+    ctx.ensure_writable("add entries")
     config = ctx.ensure_config(create_if_missing=True)
     project_root = ctx.project_root
 
@@ -2501,6 +3196,60 @@ def add(
     )
 
 
+def _group_entries_by_type(entries: Sequence[Entry]) -> dict[str, list[Entry]]:
+    entries_by_type: dict[str, list[Entry]] = {}
+    for entry in entries:
+        entry_type = entry.metadata.get("type", DEFAULT_ENTRY_TYPE)
+        entries_by_type.setdefault(entry_type, []).append(entry)
+    return entries_by_type
+
+
+def _render_entry_section(
+    entry: Entry, config: Config, *, explicit_links: bool = False, normalize: bool = True
+) -> str:
+    """Render one entry as a section of the detailed release notes.
+
+    Entries are normalized one at a time so that the Markdown cache only
+    formats entries whose rendered source changed since the last run. With
+    `normalize=False`, the unformatted source is returned instead.
+    """
+
+    lines = [f"### {entry.metadata.get('title', 'Untitled')}", ""]
+    body = entry.body.strip()
+    if body:
+        lines.append(body)
+        lines.append("")
+    author_line = _format_author_line(entry, config, explicit_links=explicit_links)
+    if author_line:
+        lines.append(author_line)
+    source = "\n".join(lines).strip()
+    return normalize_markdown(source) if normalize else source
+
+
+def _render_entry_bullet(
+    entry: Entry, config: Config, *, explicit_links: bool = False, normalize: bool = True
+) -> str:
+    """Render one entry as a bullet of the compact release notes."""
+
+    excerpt = extract_excerpt(entry.body)
+    bullet_text = excerpt or entry.metadata.get("title", "Untitled")
+    component_labels = entry.components
+    if component_labels:
+        components_display = ", ".join(component_labels)
+        bullet = f"- **{components_display}**: {bullet_text}"
+    else:
+        bullet = f"- {bullet_text}"
+    author_text, pr_text = _collect_author_pr_text(entry, config, explicit_links=explicit_links)
+    suffix_parts: list[str] = []
+    if author_text:
+        suffix_parts.append(f"by {author_text}")
+    if pr_text:
+        suffix_parts.append(f"in {pr_text}")
+    if suffix_parts:
+        bullet = f"{bullet} ({' '.join(suffix_parts)})"
+    return normalize_markdown(bullet) if normalize else bullet
+
+
 def _render_release_notes(
     entries: list[Entry],
     config: Config,
@@ -2510,39 +3259,23 @@ def _render_release_notes(
 ) -> str:
     """Render Markdown sections for the provided entries."""
 
-    if not entries:
-        return ""
-
-    entries_by_type: dict[str, list[Entry]] = {}
-    for entry in entries:
-        entry_type = entry.metadata.get("type", DEFAULT_ENTRY_TYPE)
-        entries_by_type.setdefault(entry_type, []).append(entry)
-
-    lines: list[str] = []
+    # Link references may cross entries, so their definitions need the
+    # whole document to resolve and to end up after the last section.
+    whole = any(defines_link_references(entry.body) for entry in entries)
+    entries_by_type = _group_entries_by_type(entries)
+    sections: list[str] = []
     for type_key in ENTRY_EXPORT_ORDER:
         type_entries = entries_by_type.get(type_key) or []
         if not type_entries:
             continue
         section_title = _format_section_title(type_key, include_emoji)
-        lines.append(f"## {section_title}")
-        lines.append("")
-        for entry in type_entries:
-            title = entry.metadata.get("title", "Untitled")
-            lines.append(f"### {title}")
-            lines.append("")
-            body = entry.body.strip()
-            if body:
-                lines.append(body)
-                lines.append("")
-            author_line = _format_author_line(entry, config, explicit_links=explicit_links)
-            if author_line:
-                lines.append(author_line)
-                lines.append("")
-
-    if not lines:
-        return ""
-    raw = "\n".join(lines).strip()
-    return normalize_markdown(raw)
+        fragments = [
+            _render_entry_section(entry, config, explicit_links=explicit_links, normalize=not whole)
+            for entry in type_entries
+        ]
+        sections.append("\n\n".join([f"## {section_title}", *fragments]))
+    notes = "\n\n".join(sections)
+    return normalize_markdown(notes) if whole else notes
 
 
 def _render_release_notes_compact(
@@ -2554,48 +3287,21 @@ def _render_release_notes_compact(
 ) -> str:
     """Render compact Markdown bullet list for the provided entries."""
 
-    if not entries:
-        return ""
-
-    entries_by_type: dict[str, list[Entry]] = {}
-    for entry in entries:
-        entry_type = entry.metadata.get("type", DEFAULT_ENTRY_TYPE)
-        entries_by_type.setdefault(entry_type, []).append(entry)
-
-    lines: list[str] = []
+    whole = any(defines_link_references(entry.body) for entry in entries)
+    entries_by_type = _group_entries_by_type(entries)
+    sections: list[str] = []
     for type_key in ENTRY_EXPORT_ORDER:
         type_entries = entries_by_type.get(type_key) or []
         if not type_entries:
             continue
         section_title = _format_section_title(type_key, include_emoji)
-        lines.append(f"## {section_title}")
-        lines.append("")
-        for entry in type_entries:
-            excerpt = extract_excerpt(entry.body)
-            bullet_text = excerpt or entry.metadata.get("title", "Untitled")
-            component_labels = entry.components
-            if component_labels:
-                components_display = ", ".join(component_labels)
-                bullet = f"- **{components_display}**: {bullet_text}"
-            else:
-                bullet = f"- {bullet_text}"
-            author_text, pr_text = _collect_author_pr_text(
-                entry, config, explicit_links=explicit_links
-            )
-            suffix_parts: list[str] = []
-            if author_text:
-                suffix_parts.append(f"by {author_text}")
-            if pr_text:
-                suffix_parts.append(f"in {pr_text}")
-            if suffix_parts:
-                bullet = f"{bullet} ({' '.join(suffix_parts)})"
-            lines.append(bullet)
-        lines.append("")
-
-    if not lines:
-        return ""
-    raw = "\n".join(lines).strip()
-    return normalize_markdown(raw)
+        bullets = [
+            _render_entry_bullet(entry, config, explicit_links=explicit_links, normalize=not whole)
+            for entry in type_entries
+        ]
+        sections.append(f"## {section_title}\n\n" + "\n".join(bullets))
+    notes = "\n\n".join(sections)
+    return normalize_markdown(notes) if whole else notes
 
 
 def _render_module_entries_compact(
@@ -2626,47 +3332,87 @@ def _render_module_entries_compact(
 
     sorted_entries = sorted(entries, key=sort_key)
 
-    lines: list[str] = []
-    for entry in sorted_entries:
-        entry_type = entry.metadata.get("type", DEFAULT_ENTRY_TYPE)
-        title = entry.metadata.get("title", "Untitled")
-        emoji = ENTRY_TYPE_EMOJIS.get(entry_type, "•") if include_emoji else ""
-        author_text, pr_text = _collect_author_pr_text(entry, config, explicit_links=explicit_links)
-        # Build attribution suffix
-        suffix_parts: list[str] = []
-        if author_text:
-            suffix_parts.append(f"*{author_text}*")
-        if pr_text:
-            suffix_parts.append(f"({pr_text})")
-        if suffix_parts:
-            attribution = " ".join(suffix_parts)
-            bullet = f"- {emoji} {title} — {attribution}" if emoji else f"- {title} — {attribution}"
-        else:
-            bullet = f"- {emoji} {title}" if emoji else f"- {title}"
-        lines.append(bullet)
+    return "\n".join(
+        _render_module_entry_bullet(
+            entry, config, include_emoji=include_emoji, explicit_links=explicit_links
+        )
+        for entry in sorted_entries
+    )
 
-    if not lines:
-        return ""
-    raw = "\n".join(lines)
-    return normalize_markdown(raw)
+
+def _render_module_entry_bullet(
+    entry: Entry,
+    config: Config,
+    *,
+    include_emoji: bool = True,
+    explicit_links: bool = False,
+) -> str:
+    """Render one module entry as a normalized bullet without its body."""
+
+    entry_type = entry.metadata.get("type", DEFAULT_ENTRY_TYPE)
+    title = entry.metadata.get("title", "Untitled")
+    emoji = ENTRY_TYPE_EMOJIS.get(entry_type, "•") if include_emoji else ""
+    author_text, pr_text = _collect_author_pr_text(entry, config, explicit_links=explicit_links)
+    # Build attribution suffix
+    suffix_parts: list[str] = []
+    if author_text:
+        suffix_parts.append(f"*{author_text}*")
+    if pr_text:
+        suffix_parts.append(f"({pr_text})")
+    if suffix_parts:
+        attribution = " ".join(suffix_parts)
+        bullet = f"- {emoji} {title} — {attribution}" if emoji else f"- {title} — {attribution}"
+    else:
+        bullet = f"- {emoji} {title}" if emoji else f"- {title}"
+    return normalize_markdown(bullet)
 
 
 def _compose_release_document(
     intro: Optional[str],
     release_notes: str,
 ) -> str:
+    # Release notes arrive normalized; only the intro still needs formatting,
+    # unless link reference definitions require a pass over the whole document.
+    notes = release_notes.strip()
+    if intro and (defines_link_references(intro) or defines_link_references(notes)):
+        return normalize_markdown("\n\n".join(part for part in (intro.strip(), notes) if part))
     parts: list[str] = []
     if intro:
-        intro_text = intro.strip()
+        intro_text = normalize_markdown(intro)
         if intro_text:
             parts.append(intro_text)
-    notes = release_notes.strip()
     if notes:
         parts.append(notes)
-    if not parts:
-        return ""
-    raw = "\n\n".join(parts)
-    return normalize_markdown(raw)
+    return "\n\n".join(parts)
+
+
+def _detect_release_notes_style(notes: str) -> Optional[ExportStyle]:
+    """Return the export style an existing release document was written in.
+
+    Looks at the first entry-type section: detailed notes open it with a
+    `###` entry heading, compact notes with a bullet. Returns None when the
+    document has no recognizable section, e.g., because it only has an intro.
+    """
+
+    section_headings = {
+        f"## {_format_section_title(type_key, include_emoji)}"
+        for type_key in ENTRY_EXPORT_ORDER
+        for include_emoji in (True, False)
+    }
+    lines = iter(notes.splitlines())
+    for line in lines:
+        if line.rstrip() not in section_headings:
+            continue
+        for content in lines:
+            if not content.strip():
+                continue
+            if content.startswith("### "):
+                return EXPORT_STYLE_STANDARD
+            if content.startswith(("- ", "* ")):
+                return EXPORT_STYLE_COMPACT
+            return None
+        return None
+    return None
 
 
 def _release_entry_sort_key(entry: Entry) -> tuple[str, str]:
@@ -2674,12 +3420,8 @@ def _release_entry_sort_key(entry: Entry) -> tuple[str, str]:
     return (title_value.lower(), entry.entry_id)
 
 
-def _find_release_manifest(project_root: Path, version: str) -> Optional[ReleaseManifest]:
-    normalized_version = version.strip()
-    for manifest in iter_release_manifests(project_root):
-        if manifest.version == normalized_version:
-            return manifest
-    return None
+def _find_release_manifest(snapshot: ProjectSnapshot, version: str) -> Optional[ReleaseManifest]:
+    return snapshot.find_manifest(version)
 
 
 def _github_release_exists(repository: str, version: str, gh_path: str) -> bool:
@@ -2698,68 +3440,32 @@ def _github_release_exists(repository: str, version: str, gh_path: str) -> bool:
         return False
 
 
-def _latest_semver(project_root: Path) -> tuple[Version, str] | None:
-    versions: list[tuple[Version, str]] = []
-    for manifest in iter_release_manifests(project_root):
-        label = manifest.version
-        prefix = ""
-        value = label
-        if label.startswith(("v", "V")):
-            prefix = label[0]
-            value = label[1:]
-        try:
-            parsed = Version(value)
-        except InvalidVersion:
-            continue
-        versions.append((parsed, prefix))
-    if not versions:
+def _latest_semver(snapshot: ProjectSnapshot) -> tuple[Version, str] | None:
+    latest = snapshot.semver_index.latest()
+    if latest is None:
         return None
-    versions.sort(key=lambda item: item[0])
-    return versions[-1]
+    parsed, manifest = latest
+    label = manifest.version
+    prefix = label[0] if label.startswith(("v", "V")) else ""
+    return parsed, prefix
 
 
-def _get_latest_release_manifest(project_root: Path) -> ReleaseManifest | None:
+def _get_latest_release_manifest(snapshot: ProjectSnapshot) -> ReleaseManifest | None:
     """Get the latest release manifest by semver ordering."""
-    manifests = _get_sorted_release_manifests(project_root)
-    if not manifests:
-        return None
-    return manifests[-1][1]
-
-
-def _get_sorted_release_manifests(
-    project_root: Path,
-) -> list[tuple[Version, ReleaseManifest]]:
-    """Get all release manifests sorted by semver."""
-    manifests: list[tuple[Version, ReleaseManifest]] = []
-    for manifest in iter_release_manifests(project_root):
-        label = manifest.version
-        value = label.lstrip("vV")
-        try:
-            parsed = Version(value)
-        except InvalidVersion:
-            continue
-        manifests.append((parsed, manifest))
-    manifests.sort(key=lambda item: item[0])
-    return manifests
+    latest = snapshot.semver_index.latest()
+    return latest[1] if latest is not None else None
 
 
-def _get_release_manifest_before(project_root: Path, target_version: str) -> ReleaseManifest | None:
+def _get_release_manifest_before(
+    snapshot: ProjectSnapshot, target_version: str
+) -> ReleaseManifest | None:
     """Get the release manifest immediately before the target version."""
-    target_value = target_version.lstrip("vV")
-    try:
-        target_parsed = Version(target_value)
-    except InvalidVersion:
-        return None
-    manifests = _get_sorted_release_manifests(project_root)
-    previous: ReleaseManifest | None = None
-    for parsed, manifest in manifests:
-        if parsed >= target_parsed:
-            break
-        previous = manifest
-    return previous
+    return snapshot.semver_index.before(target_version)
 
 
 def _bump_version_value(base: Version, bump: str) -> Version:
+    from packaging.version import Version
+
     major, minor, micro = (list(base.release) + [0, 0, 0])[:3]
     if bump == "major":
         major += 1
@@ -2774,6 +3480,8 @@ def _bump_version_value(base: Version, bump: str) -> Version:
 
 
 def _validate_semver_label(version: str) -> None:
+    from packaging.version import InvalidVersion, Version
+
     value = version
     if value.startswith(("v", "V")):
         value = value[1:]
@@ -2786,7 +3494,7 @@ def _validate_semver_label(version: str) -> None:
 
 
 def _resolve_release_version(
-    project_root: Path,
+    snapshot: ProjectSnapshot,
     explicit: Optional[str],
     bump: Optional[str],
 ) -> str:
@@ -2802,7 +3510,7 @@ def _resolve_release_version(
         raise click.ClickException(
             "Provide a version argument or specify one of --patch/--minor/--major."
         )
-    latest = _latest_semver(project_root)
+    latest = _latest_semver(snapshot)
     if latest is None:
         raise click.ClickException(
             "No existing release found to bump from. Supply an explicit version instead."
@@ -2837,12 +3545,16 @@ def create_release(
 ) -> None:
     """Python wrapper for release creation that mirrors CLI behavior."""
 
+    from rich.table import Table
+
+    ctx.ensure_writable("create releases")
     config = ctx.ensure_config()
     project_root = ctx.project_root
+    snapshot = ctx.snapshot()
 
-    version = _resolve_release_version(project_root, version, version_bump)
+    version = _resolve_release_version(snapshot, version, version_bump)
 
-    existing_manifest = _find_release_manifest(project_root, version)
+    existing_manifest = _find_release_manifest(snapshot, version)
     if version_bump and existing_manifest is not None:
         raise click.ClickException(
             f"Release '{version}' already exists. Supply a different bump flag or explicit version."
@@ -2864,7 +3576,7 @@ def create_release(
             existing_entries.append(entry)
             existing_entry_ids.add(entry.entry_id)
 
-    unused_entries = _collect_unused_entries_for_release(project_root, config)
+    unused_entries = _collect_unused_entries_for_release(snapshot, config)
     if not unused_entries and not existing_entries:
         raise click.ClickException("No unused entries available for release creation.")
 
@@ -2886,9 +3598,7 @@ def create_release(
     new_entry_ids = {entry.entry_id for entry in new_entries}
     for entry in entries_sorted:
         status = "new" if entry.entry_id in new_entry_ids else "existing"
-        status_cell = STATUS_TABLE_CELLS.get(status, Text("•"))
-        if isinstance(status_cell, Text):
-            status_cell = status_cell.copy()
+        status_cell = _status_table_cell(status)
         type_value = entry.metadata.get("type", "change")
         type_emoji = ENTRY_TYPE_EMOJIS.get(type_value, "•")
         table.add_row(
@@ -2929,40 +3639,25 @@ def create_release(
         else date.today()
     )
 
-    release_notes_standard = _render_release_notes(
-        entries_sorted, config, include_emoji=True, explicit_links=explicit_links
-    )
-    release_notes_compact = _render_release_notes_compact(
-        entries_sorted, config, include_emoji=True, explicit_links=explicit_links
-    )
-
+    existing_notes_payload = notes_path.read_text(encoding="utf-8") if notes_path.exists() else None
     if compact_explicit:
         compact_flag = bool(compact)
-        existing_notes_payload = (
-            notes_path.read_text(encoding="utf-8") if notes_path.exists() else None
-        )
     else:
-        prefer_compact = config.export_style == EXPORT_STYLE_COMPACT
-        existing_notes_payload = (
-            notes_path.read_text(encoding="utf-8") if notes_path.exists() else None
-        )
-        if existing_notes_payload is not None:
-            normalized_existing = existing_notes_payload.rstrip("\n")
-            doc_standard = _compose_release_document(
-                manifest_intro,
-                release_notes_standard,
-            ).rstrip("\n")
-            doc_compact = _compose_release_document(
-                manifest_intro,
-                release_notes_compact,
-            ).rstrip("\n")
-            if normalized_existing == doc_compact:
-                prefer_compact = True
-            elif normalized_existing == doc_standard:
-                prefer_compact = False
-        compact_flag = prefer_compact
-
-    release_notes = release_notes_compact if compact_flag else release_notes_standard
+        detected_style = (
+            _detect_release_notes_style(existing_notes_payload)
+            if existing_notes_payload is not None
+            else None
+        )
+        compact_flag = (
+            detected_style == EXPORT_STYLE_COMPACT
+            if detected_style is not None
+            else config.export_style == EXPORT_STYLE_COMPACT
+        )
+
+    render_notes = _render_release_notes_compact if compact_flag else _render_release_notes
+    release_notes = render_notes(
+        entries_sorted, config, include_emoji=True, explicit_links=explicit_links
+    )
 
     manifest = ReleaseManifest(
         version=version,
@@ -2978,11 +3673,11 @@ def create_release(
     modules = ctx.get_modules()
     if modules:
         # Get previous release to determine which module entries are new
-        previous_release = _get_latest_release_manifest(project_root)
+        previous_release = _get_latest_release_manifest(snapshot)
         previous_module_versions = previous_release.modules if previous_release else None
 
         module_entries, current_module_versions = _gather_module_released_entries(
-            modules, previous_module_versions
+            ctx, modules, previous_module_versions
         )
 
         # Record current module versions in manifest
@@ -3066,6 +3761,7 @@ def create_release(
         readme_content,
         overwrite=manifest_exists,
     )
+    ctx.reset_snapshots()
 
     log_success(f"release manifest written: {manifest_path_result.relative_to(project_root)}")
     if new_entries:
@@ -3168,7 +3864,7 @@ def release_create_cmd(
 def release_version_cmd(ctx: CLIContext, bare: bool) -> None:
     """Print the latest released version."""
 
-    manifest = _get_latest_release_manifest(ctx.project_root)
+    manifest = _get_latest_release_manifest(ctx.snapshot())
     if manifest is None:
         raise click.ClickException(
             "No releases found. Create a release first with 'release create'."
@@ -3181,6 +3877,141 @@ def release_version_cmd(ctx: CLIContext, bare: bool) -> None:
     emit_output(version)
 
 
+@dataclass
+class _ReleaseNotesSource:
+    """Entries and module summaries that make up one release notes document."""
+
+    identifier: str
+    manifest: Optional[ReleaseManifest]
+    entries: list[Entry]
+    config: Config
+    module_entries: dict[str, tuple[Config, list[Entry]]] = field(default_factory=dict)
+    module_versions: dict[str, str] = field(default_factory=dict)
+
+
+def _release_notes_source(
+    ctx: CLIContext,
+    snapshot: ProjectSnapshot,
+    config: Config,
+    resolution: IdentifierResolution,
+) -> _ReleaseNotesSource:
+    manifest = resolution.manifest if resolution.kind == "release" else None
+    source = _ReleaseNotesSource(
+        identifier=resolution.identifier,
+        manifest=manifest,
+        entries=sorted(resolution.entries, key=_release_entry_sort_key),
+        config=config,
+    )
+    modules = ctx.get_modules()
+    if modules:
+        # Use the release before this one as baseline for filtering
+        if manifest:
+            previous_release = _get_release_manifest_before(snapshot, manifest.version)
+            target_module_versions = manifest.modules or None
+        else:
+            previous_release = _get_latest_release_manifest(snapshot)
+            target_module_versions = None
+        previous_module_versions = previous_release.modules if previous_release else None
+        module_entries, current_versions = _gather_module_released_entries(
+            ctx, modules, previous_module_versions, target_module_versions
+        )
+        source.module_entries = module_entries
+        # Use target versions if rendering a specific release, else current versions
+        source.module_versions = target_module_versions or current_versions
+    return source
+
+
+def _release_notes_payload(source: _ReleaseNotesSource, *, compact: bool) -> dict[str, object]:
+    """Return the JSON payload of the release notes for `source`."""
+
+    manifest = source.manifest
+    fallback_heading = manifest.title if manifest and manifest.title else source.identifier
+    fallback_created = manifest.created if manifest else None
+    payload = _export_json_payload(
+        manifest,
+        source.entries,
+        source.config,
+        compact=compact,
+        fallback_heading=fallback_heading,
+        fallback_created=fallback_created,
+    )
+    # Add module summaries to JSON output
+    if source.module_entries:
+        modules_data: list[dict[str, object]] = []
+        for module_id in sorted(source.module_entries.keys()):
+            module_config, entries = source.module_entries[module_id]
+            module_payload: dict[str, object] = {
+                "id": module_id,
+                "name": module_config.name,
+                "entries": [_entry_to_dict(e, module_config, compact=True) for e in entries],
+            }
+            modules_data.append(module_payload)
+        payload["modules"] = modules_data
+    return payload
+
+
+def _format_release_notes(
+    source: _ReleaseNotesSource,
+    view: Literal["markdown", "json"],
+    *,
+    compact: bool,
+    include_emoji: bool,
+    explicit_links: bool,
+) -> str:
+    """Return the release notes document for `source` in the requested view."""
+
+    manifest = source.manifest
+    config = source.config
+    if view == "json":
+        return json.dumps(_release_notes_payload(source, compact=compact), indent=2)
+
+    if manifest is not None:
+        release_body = (
+            _render_release_notes_compact(
+                source.entries,
+                config,
+                include_emoji=include_emoji,
+                explicit_links=explicit_links,
+            )
+            if compact
+            else _render_release_notes(
+                source.entries,
+                config,
+                include_emoji=include_emoji,
+                explicit_links=explicit_links,
+            )
+        )
+        output = _compose_release_document(manifest.intro, release_body)
+    else:
+        export_markdown = _export_markdown_compact if compact else _export_markdown_release
+        output = export_markdown(
+            None,
+            source.entries,
+            config,
+            {},
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
+        ).rstrip("\n")
+
+    # Append module summaries if modules are configured
+    module_sections: list[str] = []
+    for module_id in sorted(source.module_entries.keys()):
+        module_config, entries = source.module_entries[module_id]
+        module_body = _render_module_entries_compact(
+            entries,
+            module_config,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
+        )
+        if module_body:
+            version = source.module_versions.get(module_id, "")
+            header = f"## {module_config.name} {version}" if version else f"## {module_config.name}"
+            module_sections.append(f"{header}\n\n{module_body}")
+    if module_sections:
+        output = output + "\n\n---\n\n" + "\n\n".join(module_sections)
+    return output
+
+
 def render_release_notes(
     ctx: CLIContext,
     *,
@@ -3194,22 +4025,38 @@ def render_release_notes(
     """Python wrapper to display release notes in code contexts."""
 
     config = ctx.ensure_config()
-    project_root = ctx.project_root
+    snapshot = ctx.snapshot()
 
     if not identifier.strip():
         raise click.ClickException("Provide a release version or '-' for unreleased notes.")
 
-    entry_map, _, _, sorted_entries = _gather_entry_context(project_root)
-    resolutions = _resolve_identifiers_sequence(
-        [identifier],
-        project_root=project_root,
-        config=config,
-        sorted_entries=sorted_entries,
-        entry_map=entry_map,
-        allowed_kinds={"release", "unreleased"},
-    )
-    resolution = resolutions[0]
-    manifest = resolution.manifest if resolution.kind == "release" else None
+    # A release resolves against its manifest and entries directory alone, so
+    # look it up by its label before anything else. Only identifiers that are
+    # neither a release nor unreleased need the whole history.
+    token = identifier.strip()
+    unreleased = token.lower() in {UNRELEASED_IDENTIFIER, DASH_IDENTIFIER}
+    manifest = None if unreleased else snapshot.find_manifest(token)
+    if manifest is not None:
+        release_entries = _load_manifest_entries(snapshot, manifest, {})
+        resolution = IdentifierResolution(
+            kind="release",
+            entries=release_entries,
+            identifier=manifest.version,
+            manifest=manifest,
+        )
+    else:
+        entry_map: dict[str, Entry] = {}
+        sorted_entries: list[Entry] = []
+        if not unreleased and not token.startswith(("v", "V")):
+            entry_map, _, _, sorted_entries = _gather_entry_context(ctx)
+        resolution = _resolve_identifier(
+            identifier,
+            snapshot=snapshot,
+            config=config,
+            sorted_entries=sorted_entries,
+            entry_map=entry_map,
+            allowed_kinds={"release", "unreleased"},
+        )
 
     compact_flag = (
         bool(compact) if compact_explicit else config.export_style == EXPORT_STYLE_COMPACT
@@ -3217,134 +4064,247 @@ def render_release_notes(
     if view not in {"markdown", "json"}:
         raise click.ClickException(f"Unsupported notes format '{view}'.")
 
-    entries_for_output = sorted(resolution.entries, key=_release_entry_sort_key)
-    release_index_export = build_entry_release_index(project_root, project=config.id)
-
-    if resolution.kind == "release" and manifest is None:
+    if resolution.kind == "release" and resolution.manifest is None:
         raise click.ClickException(f"Release '{identifier}' not found.")
 
-    if view == "json":
-        fallback_heading = manifest.title if manifest and manifest.title else resolution.identifier
-        fallback_created = manifest.created if manifest else None
-        payload = _export_json_payload(
-            manifest,
-            entries_for_output,
-            config,
+    source = _release_notes_source(ctx, snapshot, config, resolution)
+    emit_output(
+        _format_release_notes(
+            source,
+            view,
             compact=compact_flag,
-            fallback_heading=fallback_heading,
-            fallback_created=fallback_created,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
         )
-        # Add module summaries to JSON output
-        modules = ctx.get_modules()
-        if modules:
-            # Use the release before this one as baseline for filtering
-            if manifest:
-                previous_release = _get_release_manifest_before(project_root, manifest.version)
-                target_module_versions = manifest.modules or None
-            else:
-                previous_release = _get_latest_release_manifest(project_root)
-                target_module_versions = None
-            previous_module_versions = previous_release.modules if previous_release else None
-            module_entries, _ = _gather_module_released_entries(
-                modules, previous_module_versions, target_module_versions
-            )
-            if module_entries:
-                modules_data: list[dict[str, object]] = []
-                for module_id in sorted(module_entries.keys()):
-                    module_config, entries = module_entries[module_id]
-                    module_payload: dict[str, object] = {
-                        "id": module_id,
-                        "name": module_config.name,
-                        "entries": [
-                            _entry_to_dict(e, module_config, compact=True) for e in entries
-                        ],
-                    }
-                    modules_data.append(module_payload)
-                payload["modules"] = modules_data
-        emit_output(json.dumps(payload, indent=2))
-        return
+    )
 
-    if resolution.kind == "release":
-        release_body = (
-            _render_release_notes_compact(
-                entries_for_output,
-                config,
-                include_emoji=include_emoji,
-                explicit_links=explicit_links,
-            )
-            if compact_flag
-            else _render_release_notes(
-                entries_for_output,
-                config,
-                include_emoji=include_emoji,
-                explicit_links=explicit_links,
-            )
+
+def _parse_range_bound(value: str, option: str) -> Version | date:
+    from packaging.version import InvalidVersion, Version
+
+    token = value.strip()
+    try:
+        return date.fromisoformat(token)
+    except ValueError:
+        pass
+    try:
+        return Version(token.lstrip("vV"))
+    except InvalidVersion:
+        raise click.ClickException(
+            f"Invalid {option} value '{value}': expected a release version such as "
+            "v1.2.0 or a date (YYYY-MM-DD)."
+        ) from None
+
+
+def _releases_in_range(
+    snapshot: ProjectSnapshot, since: Optional[str], until: Optional[str]
+) -> list[ReleaseManifest]:
+    """Return the releases from `since` through `until`, oldest first.
+
+    Bounds are inclusive and may be versions or dates; a missing bound leaves
+    that side of the range open.
+    """
+    lower = _parse_range_bound(since, "--since") if since else None
+    upper = _parse_range_bound(until, "--until") if until else None
+    manifests = snapshot.semver_index.between(
+        None if isinstance(lower, date) else lower,
+        None if isinstance(upper, date) else upper,
+    )
+    if isinstance(lower, date):
+        manifests = [manifest for manifest in manifests if manifest.created >= lower]
+    if isinstance(upper, date):
+        manifests = [manifest for manifest in manifests if manifest.created <= upper]
+    if not manifests:
+        bounds = " ".join(
+            f"{option} {value}"
+            for option, value in (("--since", since), ("--until", until))
+            if value
         )
-        output = _compose_release_document(
-            manifest.intro if manifest else None,
-            release_body,
+        raise click.ClickException(f"No releases match {bounds}.")
+    return manifests
+
+
+def _release_range_sources(
+    ctx: CLIContext,
+    snapshot: ProjectSnapshot,
+    config: Config,
+    manifests: Sequence[ReleaseManifest],
+    components: Optional[set[str]] = None,
+) -> list[_ReleaseNotesSource]:
+    """Load the entries of the given releases only, one notes source each."""
+
+    sources: list[_ReleaseNotesSource] = []
+    for manifest in manifests:
+        entries = _load_manifest_entries(snapshot, manifest, {})
+        if components:
+            entries = _filter_entries_by_component(entries, components)
+        resolution = IdentifierResolution(
+            kind="release", entries=entries, identifier=manifest.version, manifest=manifest
         )
-    else:
-        fallback_heading = "Unreleased Changes"
-        release_body = (
-            _export_markdown_compact(
-                None,
-                entries_for_output,
-                config,
-                release_index_export,
-                include_emoji=include_emoji,
-                explicit_links=explicit_links,
-            )
-            if compact_flag
-            else _export_markdown_release(
-                None,
-                entries_for_output,
-                config,
-                release_index_export,
-                explicit_links=explicit_links,
-                include_emoji=include_emoji,
-            )
+        sources.append(_release_notes_source(ctx, snapshot, config, resolution))
+    return sources
+
+
+def _format_release_range(
+    sources: Sequence[_ReleaseNotesSource],
+    view: Literal["markdown", "json"],
+    *,
+    since: Optional[str],
+    until: Optional[str],
+    compact: bool,
+    include_emoji: bool,
+    explicit_links: bool,
+) -> str:
+    """Return one document covering several releases, newest first.
+
+    Markdown output introduces each release with a top-level heading; JSON
+    output wraps the per-release payloads in a single object.
+    """
+
+    ordered = list(reversed(sources))
+    if view == "json":
+        payload = {
+            "since": since,
+            "until": until,
+            "releases": [_release_notes_payload(source, compact=compact) for source in ordered],
+        }
+        return json.dumps(payload, indent=2)
+    sections: list[str] = []
+    for source in ordered:
+        manifest = source.manifest
+        heading = manifest.title if manifest and manifest.title else source.identifier
+        notes = _format_release_notes(
+            source,
+            "markdown",
+            compact=compact,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
         )
-        output = release_body.rstrip("\n")
+        sections.append(f"# {heading}\n\n{notes}" if notes else f"# {heading}")
+    return "\n\n".join(sections)
 
-    # Append module summaries if modules are configured
-    modules = ctx.get_modules()
-    if modules:
-        # Use the release before this one as baseline for filtering
-        if manifest:
-            previous_release = _get_release_manifest_before(project_root, manifest.version)
-            target_module_versions = manifest.modules or None
-        else:
-            previous_release = _get_latest_release_manifest(project_root)
-            target_module_versions = None
-        previous_module_versions = previous_release.modules if previous_release else None
-        module_entries, current_versions = _gather_module_released_entries(
-            modules, previous_module_versions, target_module_versions
+
+def render_release_notes_range(
+    ctx: CLIContext,
+    *,
+    since: Optional[str],
+    until: Optional[str],
+    view: Literal["markdown", "json"],
+    compact: Optional[bool],
+    include_emoji: bool,
+    compact_explicit: bool,
+    explicit_links: bool = False,
+) -> None:
+    """Display the notes of every release between `since` and `until`."""
+
+    config = ctx.ensure_config()
+    snapshot = ctx.snapshot()
+    compact_flag = (
+        bool(compact) if compact_explicit else config.export_style == EXPORT_STYLE_COMPACT
+    )
+    manifests = _releases_in_range(snapshot, since, until)
+    sources = _release_range_sources(ctx, snapshot, config, manifests)
+    emit_output(
+        _format_release_range(
+            sources,
+            view,
+            since=since,
+            until=until,
+            compact=compact_flag,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
         )
-        # Use target versions if rendering a specific release, else current versions
-        version_map = target_module_versions or current_versions
-        if module_entries:
-            module_sections: list[str] = []
-            for module_id in sorted(module_entries.keys()):
-                module_config, entries = module_entries[module_id]
-                module_body = _render_module_entries_compact(
-                    entries,
-                    module_config,
-                    include_emoji=include_emoji,
-                    explicit_links=explicit_links,
-                )
-                if module_body:
-                    version = version_map.get(module_id, "")
-                    header = (
-                        f"## {module_config.name} {version}"
-                        if version
-                        else f"## {module_config.name}"
-                    )
-                    module_sections.append(f"{header}\n\n{module_body}")
-            if module_sections:
-                output = output + "\n\n---\n\n" + "\n\n".join(module_sections)
+    )
+
+
+_NOTES_FILE_SUFFIXES = {"markdown": ".md", "json": ".json"}
+
+
+def _render_release_notes_files(
+    source: _ReleaseNotesSource,
+    *,
+    views: tuple[Literal["markdown", "json"], ...],
+    compact: bool,
+    include_emoji: bool,
+    explicit_links: bool,
+) -> dict[str, str]:
+    return {
+        _NOTES_FILE_SUFFIXES[view]: _format_release_notes(
+            source,
+            view,
+            compact=compact,
+            include_emoji=include_emoji,
+            explicit_links=explicit_links,
+        )
+        for view in views
+    }
+
+
+def render_all_release_notes(
+    ctx: CLIContext,
+    *,
+    output_dir: Path,
+    views: Sequence[Literal["markdown", "json"]] = ("markdown",),
+    compact: Optional[bool],
+    include_emoji: bool,
+    compact_explicit: bool,
+    explicit_links: bool = False,
+) -> list[Path]:
+    """Write the notes of every release to `output_dir`, one file per release and view.
+
+    Files are named after the release directory rather than the manifest
+    version, which is free-form and need not be unique. The project is
+    loaded once and releases render in worker processes when
+    more than one job is configured. Files whose content is unchanged are not
+    rewritten; the paths that were written are returned.
+    """
+
+    config = ctx.ensure_config()
+    snapshot = ctx.snapshot()
+    if not snapshot.manifests:
+        raise click.ClickException("No releases found.")
+    compact_flag = (
+        bool(compact) if compact_explicit else config.export_style == EXPORT_STYLE_COMPACT
+    )
+
+    entry_map, _, _, _ = _gather_entry_context(ctx)
+    names: list[str] = []
+    sources: list[_ReleaseNotesSource] = []
+    for manifest in snapshot.manifests:
+        names.append(manifest.path.parent.name if manifest.path else manifest.version)
+        entries = _load_manifest_entries(snapshot, manifest, entry_map)
+        resolution = IdentifierResolution(
+            kind="release", entries=entries, identifier=manifest.version, manifest=manifest
+        )
+        sources.append(_release_notes_source(ctx, snapshot, config, resolution))
 
-    emit_output(output)
+    render = functools.partial(
+        _render_release_notes_files,
+        views=tuple(dict.fromkeys(views)),
+        compact=compact_flag,
+        include_emoji=include_emoji,
+        explicit_links=explicit_links,
+    )
+    with span("release.notes.render"):
+        documents = process_map(render, sources)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    unchanged = 0
+    for name, rendered in zip(names, documents, strict=True):
+        for suffix, content in rendered.items():
+            path = output_dir / f"{name}{suffix}"
+            payload = f"{content}\n"
+            if path.is_file() and path.read_text(encoding="utf-8") == payload:
+                unchanged += 1
+                continue
+            path.write_text(payload, encoding="utf-8")
+            written.append(path)
+    log_success(
+        f"rendered {len(sources)} releases to {output_dir}: "
+        f"{len(written)} files written, {unchanged} unchanged"
+    )
+    return written
 
 
 @release_group.command("notes")
@@ -3352,17 +4312,21 @@ def render_release_notes(
 @click.option(
     "-m",
     "--markdown",
-    "format_choice",
+    "format_flags",
     flag_value="markdown",
-    default="markdown",
+    multiple=True,
     help="Render notes as Markdown (default).",
 )
 @click.option(
     "-j",
     "--json",
-    "format_choice",
+    "format_flags",
     flag_value="json",
-    help="Render notes as JSON.",
+    multiple=True,
+    help=(
+        "Render notes as JSON. Together with --markdown, the last one wins, "
+        "except with --all, which writes both."
+    ),
 )
 # Options shared with `release create`
 @compact_option()
@@ -3372,38 +4336,98 @@ def render_release_notes(
     help="Disable type emoji in Markdown output.",
 )
 @explicit_links_option()
+@click.option(
+    "--all",
+    "all_releases",
+    is_flag=True,
+    help="Render every release into --output-dir instead of printing one.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(path_type=Path, file_okay=False),
+    help="Directory receiving one file per release and format with --all.",
+)
+@since_until_options()
 @click.pass_obj
 def release_notes_cmd(
     ctx: CLIContext,
     identifier: Optional[str],
-    format_choice: str,
+    format_flags: tuple[str, ...],
     compact: Optional[bool],
     no_emoji: bool,
     explicit_links: Optional[bool],
+    all_releases: bool,
+    output_dir: Optional[Path],
+    since: Optional[str],
+    until: Optional[str],
 ) -> None:
     """Display release notes for a release or the unreleased bucket.
 
-    If no identifier is provided, shows notes for the latest release.
+    If no identifier is provided, shows notes for the latest release. With
+    --all, writes the notes of every release to --output-dir, named after the
+    release directory, and leaves files with unchanged content untouched. With
+    --since and/or --until, shows the notes of every release in that range
+    as one document.
     """
 
     config = ctx.ensure_config()
+    click_ctx = click.get_current_context()
+    compact_explicit = click_ctx.get_parameter_source("compact") != ParameterSource.DEFAULT
+    # Resolve explicit_links: CLI flag overrides config default
+    resolved_explicit_links = config.explicit_links if explicit_links is None else explicit_links
+    views = [
+        cast(Literal["markdown", "json"], value)
+        for value in dict.fromkeys(format_flags or ("markdown",))
+    ]
+
+    if all_releases:
+        if identifier is not None:
+            raise click.ClickException("Use either a release identifier or --all, not both.")
+        if since or until:
+            raise click.ClickException("Use either --all or --since/--until, not both.")
+        if output_dir is None:
+            raise click.ClickException("--all requires --output-dir.")
+        render_all_release_notes(
+            ctx,
+            output_dir=output_dir,
+            views=views,
+            compact=compact,
+            include_emoji=not no_emoji,
+            explicit_links=resolved_explicit_links,
+            compact_explicit=compact_explicit,
+        )
+        return
+    if output_dir is not None:
+        raise click.ClickException("--output-dir only applies together with --all.")
+    # Outside of --all, the last format flag wins.
+    view = cast(Literal["markdown", "json"], format_flags[-1] if format_flags else "markdown")
+    if since or until:
+        if identifier is not None:
+            raise click.ClickException("Use either a release identifier or --since/--until.")
+        render_release_notes_range(
+            ctx,
+            since=since,
+            until=until,
+            view=view,
+            compact=compact,
+            include_emoji=not no_emoji,
+            explicit_links=resolved_explicit_links,
+            compact_explicit=compact_explicit,
+        )
+        return
+
     resolved_identifier = identifier
     if resolved_identifier is None:
-        latest = _latest_semver(ctx.project_root)
+        latest = _latest_semver(ctx.snapshot())
         if latest is None:
             raise click.ClickException("No releases found. Provide a version explicitly.")
         version, prefix = latest
         resolved_identifier = f"{prefix}{version}"
 
-    click_ctx = click.get_current_context()
-    compact_explicit = click_ctx.get_parameter_source("compact") != ParameterSource.DEFAULT
-    # Resolve explicit_links: CLI flag overrides config default
-    resolved_explicit_links = config.explicit_links if explicit_links is None else explicit_links
-    view_choice = cast(Literal["markdown", "json"], format_choice or "markdown")
     render_release_notes(
         ctx,
         identifier=resolved_identifier,
-        view=view_choice,
+        view=view,
         compact=compact,
         include_emoji=not no_emoji,
         explicit_links=resolved_explicit_links,
@@ -3425,6 +4449,7 @@ def publish_release(
 ) -> None:
     """Python wrapper around the ``release publish`` command."""
 
+    ctx.ensure_writable("publish releases")
     config = ctx.ensure_config()
     project_root = ctx.project_root
 
@@ -3437,7 +4462,7 @@ def publish_release(
     if gh_path is None:
         raise click.ClickException("The 'gh' CLI is required but was not found in PATH.")
 
-    manifest = _find_release_manifest(project_root, version)
+    manifest = _find_release_manifest(ctx.snapshot(), version)
     if manifest is None:
         raise click.ClickException(f"Release '{version}' not found.")
 
@@ -3615,7 +4640,7 @@ def release_publish_cmd(
 
     resolved_version = version
     if resolved_version is None:
-        manifest = _get_latest_release_manifest(ctx.project_root)
+        manifest = _get_latest_release_manifest(ctx.snapshot())
         if manifest is None:
             raise click.ClickException(
                 "No releases found. Create a release first with 'release create'."
@@ -3635,16 +4660,47 @@ def release_publish_cmd(
     )
 
 
-def run_validate(ctx: CLIContext) -> None:
-    """Python wrapper for validating changelog files."""
+def run_validate(ctx: CLIContext, *, changed: bool = False, since: str | None = None) -> None:
+    """Python wrapper for validating changelog files.
 
+    With `changed`, only files that differ from the last clean `--changed`
+    run are re-checked; with `since`, only files that differ from a git ref.
+    Cross-file checks always cover every project.
+    """
+
+    if changed and since is not None:
+        raise click.ClickException("Use either --changed or --since, not both.")
     config = ctx.ensure_config()
     modules = ctx.get_modules()
+    only: set[Path] | None = None
+    state: ValidationState | None = None
+    hashes: dict[str, str] = {}
+    if changed or since is not None:
+        roots = [ctx.project_root, *(module.root for module in modules)]
+        inputs = [path for root in roots for path in validation_inputs(root)]
+        if since is not None:
+            try:
+                only = git_changed_files(ctx.project_root, since) & set(inputs)
+            except RuntimeError as exc:
+                raise click.ClickException(str(exc)) from exc
+        else:
+            state = ValidationState.for_project(ctx.project_root)
+            if state is not None:
+                hashes = hash_files(inputs)
+                previous = state.load()
+                if previous:
+                    only = {
+                        Path(key) for key, digest in hashes.items() if previous.get(key) != digest
+                    }
+        if only is not None:
+            log_info(f"checking {len(only)} changed file(s)")
     if modules:
-        issues = run_validation_with_modules(ctx.project_root, config, modules)
+        issues = run_validation_with_modules(ctx.project_root, config, modules, only=only)
     else:
-        issues = run_validation(ctx.project_root, config)
+        issues = run_validation(ctx.project_root, config, only=only)
     if not issues:
+        if state is not None:
+            state.save(hashes)
         log_success("all changelog files look good")
         return
 
@@ -3655,11 +4711,78 @@ def run_validate(ctx: CLIContext) -> None:
 
 
 @cli.command("validate")
+@click.option(
+    "--changed",
+    is_flag=True,
+    help="Only check files changed since the last clean run with --changed.",
+)
+@click.option(
+    "--since",
+    metavar="REF",
+    help="Only check files changed since the given git ref.",
+)
 @click.pass_obj
-def validate_cmd(ctx: CLIContext) -> None:
-    """Validate entries and release manifests."""
+def validate_cmd(ctx: CLIContext, changed: bool, since: str | None) -> None:
+    """Validate entries and release manifests.
+
+    Cross-file checks, such as release manifests referencing missing entries,
+    always run against the whole project.
+    """
 
-    run_validate(ctx)
+    run_validate(ctx, changed=changed, since=since)
+
+
+def run_backfill_created(ctx: CLIContext, *, write: bool = False) -> dict[str, datetime]:
+    """Python wrapper for dating entries that lack `created` from git history.
+
+    Returns the first-add commit date of every unreleased or released entry
+    without a `created` field, keyed by entry id. With `write`, the dates are
+    also stored in the entry files.
+    """
+
+    if write:
+        ctx.ensure_writable("backfill created dates")
+    ctx.ensure_config()
+    entries = [*iter_entries(ctx.project_root), *ctx.snapshot().released_entries.values()]
+    missing = [entry for entry in entries if entry.created_at is None]
+    if not missing:
+        log_success("all entries have a created date")
+        return {}
+    try:
+        first_added = git_first_added(ctx.project_root, [entry.path for entry in missing])
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    dated: list[tuple[Entry, datetime]] = []
+    for entry in missing:
+        created = first_added.get(entry.path)
+        if created is None:
+            log_warning(f"no git history for entry '{entry.entry_id}'")
+            continue
+        dated.append((entry, created))
+        emit_output(f"{entry.entry_id}\t{created.isoformat()}")
+    if write and dated:
+        for entry, created in dated:
+            write_entry_created(entry.path, created)
+        ctx.reset_snapshots()
+        log_success(f"wrote created dates to {len(dated)} entries")
+    elif dated:
+        log_info("run with --write to store these dates in the entry files")
+    return {entry.entry_id: created for entry, created in dated}
+
+
+@cli.command("backfill-created")
+@click.option("--write", is_flag=True, help="Store the dates in the entry files.")
+@click.pass_obj
+def backfill_created_cmd(ctx: CLIContext, write: bool) -> None:
+    """Date entries without a created field from git history.
+
+    Every entry gets the date of the commit that first added it, following
+    renames into release directories. One `git log` pass covers the whole
+    project.
+    """
+
+    run_backfill_created(ctx, write=write)
 
 
 @cli.command("modules")
@@ -3667,6 +4790,8 @@ def validate_cmd(ctx: CLIContext) -> None:
 def modules_cmd(ctx: CLIContext) -> None:
     """List discovered modules."""
 
+    from rich.table import Table
+
     config = ctx.ensure_config()
     if not config.modules:
         log_info("No modules configured.")
@@ -3693,7 +4818,7 @@ def modules_cmd(ctx: CLIContext) -> None:
             str(unreleased_count),
         )
 
-    console.print(table)
+    _print_renderable(table)
 
 
 def _export_markdown_release(
@@ -3705,43 +4830,12 @@ def _export_markdown_release(
     include_emoji: bool = True,
     explicit_links: bool = False,
 ) -> str:
-    lines: list[str] = []
-
     if not entries:
-        lines.append("No changes found.")
-        return "\n".join(lines).strip() + "\n"
-
-    entries_by_type: dict[str, list[Entry]] = {}
-    for entry in entries:
-        entry_type = entry.metadata.get("type", DEFAULT_ENTRY_TYPE)
-        entries_by_type.setdefault(entry_type, []).append(entry)
-
-    for type_key in ENTRY_EXPORT_ORDER:
-        type_entries = entries_by_type.get(type_key) or []
-        if not type_entries:
-            continue
-        section_title = _format_section_title(type_key, include_emoji)
-        lines.append(f"## {section_title}")
-        lines.append("")
-        for entry in type_entries:
-            metadata = entry.metadata
-            title = metadata.get("title", "Untitled")
-            lines.append(f"### {title}")
-            lines.append("")
-            body = entry.body.strip()
-            if body:
-                lines.append(body)
-                lines.append("")
-            author_line = _format_author_line(entry, config, explicit_links=explicit_links)
-            if author_line:
-                lines.append(author_line)
-                lines.append("")
-
-    if not lines:
-        return ""
-    raw = "\n".join(lines).strip()
-    normalized = normalize_markdown(raw)
-    return f"{normalized}\n"
+        return "No changes found.\n"
+    notes = _render_release_notes(
+        entries, config, include_emoji=include_emoji, explicit_links=explicit_links
+    )
+    return f"{notes}\n" if notes else ""
 
 
 def _export_markdown_compact(
@@ -3753,52 +4847,12 @@ def _export_markdown_compact(
     include_emoji: bool = True,
     explicit_links: bool = False,
 ) -> str:
-    lines: list[str] = []
-
     if not entries:
-        lines.append("No changes found.")
-        return "\n".join(lines).strip() + "\n"
-
-    entries_by_type: dict[str, list[Entry]] = {}
-    for entry in entries:
-        entry_type = entry.metadata.get("type", DEFAULT_ENTRY_TYPE)
-        entries_by_type.setdefault(entry_type, []).append(entry)
-
-    for type_key in ENTRY_EXPORT_ORDER:
-        type_entries = entries_by_type.get(type_key) or []
-        if not type_entries:
-            continue
-        section_title = _format_section_title(type_key, include_emoji)
-        lines.append(f"## {section_title}")
-        lines.append("")
-        for entry in type_entries:
-            metadata = entry.metadata
-            excerpt = extract_excerpt(entry.body)
-            bullet_text = excerpt or metadata.get("title", "Untitled")
-            component_labels = entry.components
-            if component_labels:
-                components_display = ", ".join(component_labels)
-                bullet = f"- **{components_display}**: {bullet_text}"
-            else:
-                bullet = f"- {bullet_text}"
-            author_text, pr_text = _collect_author_pr_text(
-                entry, config, explicit_links=explicit_links
-            )
-            suffix_parts: list[str] = []
-            if author_text:
-                suffix_parts.append(f"by {author_text}")
-            if pr_text:
-                suffix_parts.append(f"in {pr_text}")
-            if suffix_parts:
-                bullet = f"{bullet} ({' '.join(suffix_parts)})"
-            lines.append(bullet)
-        lines.append("")
-
-    if not lines:
-        return ""
-    raw = "\n".join(lines).strip()
-    normalized = normalize_markdown(raw)
-    return f"{normalized}\n"
+        return "No changes found.\n"
+    notes = _render_release_notes_compact(
+        entries, config, include_emoji=include_emoji, explicit_links=explicit_links
+    )
+    return f"{notes}\n" if notes else ""
 
 
 def _export_json_payload(
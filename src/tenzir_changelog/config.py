@@ -6,8 +6,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, MutableMapping, cast
 
-import yaml
-
+from .frontmatter import dump_yaml, load_yaml
+from .storage import path_exists, read_text
 from .utils import parse_components
 
 ExportStyle = Literal["standard", "compact"]
@@ -60,8 +60,7 @@ class Config:
 
 def load_config(path: Path) -> Config:
     """Load the configuration from disk."""
-    with path.open("r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+    raw = load_yaml(read_text(path)) or {}
     if not isinstance(raw, MutableMapping):
         raise ValueError("Config root must be a mapping")
 
@@ -140,8 +139,7 @@ def load_config(path: Path) -> Config:
 def load_package_config(path: Path) -> Config:
     """Load configuration metadata from a package manifest."""
 
-    with path.open("r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+    raw = load_yaml(read_text(path)) or {}
     if not isinstance(raw, MutableMapping):
         raise ValueError("Package metadata must be a mapping")
 
@@ -220,11 +218,11 @@ def load_project_config(project_root: Path) -> Config:
     """Load a project config, falling back to package metadata when needed."""
 
     config_path = default_config_path(project_root)
-    if config_path.exists():
+    if path_exists(config_path):
         return load_config(config_path)
 
     package_path = package_metadata_path(project_root)
-    if package_path.exists():
+    if path_exists(package_path):
         return load_package_config(package_path)
 
     raise FileNotFoundError(
@@ -263,4 +261,4 @@ def save_config(config: Config, path: Path) -> None:
     """Write the configuration to disk."""
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(dump_config(config), handle, sort_keys=False)
+        handle.write(dump_yaml(dump_config(config), sort_keys=False))
@@ -0,0 +1,125 @@
+"""File discovery through filesystem globbing or git's index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from click import ClickException
+
+from .storage import GitTree, active_storage
+from .utils import git_output, log_debug
+
+DISCOVERY_ENV = "TENZIR_CHANGELOG_DISCOVERY"
+DISCOVERY_MODES = ("filesystem", "git")
+
+# `git ls-files -t` tags: H = tracked, M = unmerged, R = deleted, ? = untracked.
+_PRESENT_TAGS = frozenset("HM?")
+
+_mode = "filesystem"
+_trees: list[GitTree] = []
+_outside_git: set[Path] = set()
+
+
+def configure_discovery(mode: Optional[str] = None) -> None:
+    """Select how changelog files are found.
+
+    `None` falls back to the `TENZIR_CHANGELOG_DISCOVERY` environment variable
+    and then to globbing the filesystem.
+    """
+    global _mode
+    if mode is None:
+        mode = os.environ.get(DISCOVERY_ENV, "").strip() or "filesystem"
+        if mode not in DISCOVERY_MODES:
+            choices = ", ".join(DISCOVERY_MODES)
+            raise ClickException(f"{DISCOVERY_ENV} must be one of {choices}, got '{mode}'.")
+    _mode = mode
+    invalidate_discovery()
+
+
+def discovery_mode() -> str:
+    """Return the active discovery mode."""
+    return _mode
+
+
+def invalidate_discovery() -> None:
+    """Forget git listings so that files written since are found."""
+    _trees.clear()
+    _outside_git.clear()
+
+
+def _load_tree(directory: Path) -> Optional[GitTree]:
+    try:
+        toplevel = git_output(
+            directory, ["rev-parse", "--show-toplevel"], "not a git repository"
+        ).strip()
+        root = Path(toplevel)
+        listing = git_output(
+            root,
+            [
+                "ls-files",
+                "-z",
+                "-t",
+                "--cached",
+                "--deleted",
+                "--others",
+                "--exclude-standard",
+            ],
+            "failed to list repository files",
+        )
+    except RuntimeError as exc:
+        log_debug(f"falling back to filesystem discovery for {directory}: {exc}")
+        return None
+    paths: set[str] = set()
+    deleted: set[str] = set()
+    for record in listing.split("\0"):
+        if not record:
+            continue
+        tag, path = record[0], record[2:]
+        if tag == "R":
+            deleted.add(path)
+        elif tag in _PRESENT_TAGS:
+            paths.add(path)
+    return GitTree(root, paths - deleted)
+
+
+def _locate(directory: Path) -> Optional[tuple[GitTree, str]]:
+    """Return the repository listing containing `directory` and its relative path."""
+    resolved = directory.resolve()
+    if resolved in _outside_git:
+        return None
+    tree = next(
+        (tree for tree in _trees if resolved == tree.root or tree.root in resolved.parents),
+        None,
+    )
+    if tree is None:
+        tree = _load_tree(resolved)
+        if tree is None:
+            _outside_git.add(resolved)
+            return None
+        _trees.append(tree)
+    relative = resolved.relative_to(tree.root)
+    return tree, "" if relative == Path(".") else relative.as_posix()
+
+
+def glob_paths(directory: Path, pattern: str) -> list[Path]:
+    """Return the sorted paths below `directory` that match a relative glob.
+
+    In git mode, tracked and untracked-but-not-ignored files come from a
+    single `git ls-files` call per repository and are matched in memory, so
+    ignored trees such as build directories are never walked. Directories
+    outside a repository and recursive `**` patterns use the filesystem.
+    With `--ref`, paths are listed from the tree at that ref instead.
+    """
+    storage = active_storage()
+    if storage is not None:
+        return storage.glob(directory, pattern)
+    if _mode != "git" or "**" in pattern or not directory.is_dir():
+        return sorted(directory.glob(pattern))
+    located = _locate(directory)
+    if located is None:
+        return sorted(directory.glob(pattern))
+    tree, prefix = located
+    offset = len(prefix) + 1 if prefix else 0
+    return sorted(directory / match[offset:] for match in tree.glob(prefix, pattern))
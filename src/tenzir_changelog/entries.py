@@ -2,62 +2,144 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime, timezone
+import functools
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, Sequence, cast
 
-import yaml
 from click import ClickException
 
+from .cache import EntryCache, FileFingerprint, entry_cache_for
+from .discovery import glob_paths
+from .frontmatter import dump_yaml, load_frontmatter, yaml_error
+from .parallel import parallel_map
+from .profiling import profiled, span
+from .storage import is_dir, open_binary, read_text
 from .utils import coerce_datetime, slugify
 
+if TYPE_CHECKING:
+    import yaml
+
 UNRELEASED_DIR = Path("unreleased")
 ENTRY_TYPES = ("breaking", "feature", "bugfix", "change")
 
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _epoch_microseconds(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+# Entries without a created timestamp sort before all others.
+_MISSING_CREATED_KEY = _epoch_microseconds(datetime.min.replace(tzinfo=timezone.utc))
+
+
+def _coerce_components(value: object) -> tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, list):
+        return tuple(str(item).strip() for item in value if str(item).strip())
+    return (str(value).strip(),) if str(value).strip() else ()
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Entry:
-    """Representation of a changelog entry file."""
+    """Representation of a changelog entry file.
+
+    Entries are immutable records whose derived fields (title, type,
+    components, project, creation time, and sort key) are computed once at
+    load time. `metadata` is a read-only copy of the mapping passed in, so
+    the derived fields cannot go stale; to change an entry, build a new one
+    from edited metadata. Entries read from disk only parse their YAML frontmatter up
+    front; the Markdown body is read on first access to `body`.
+    """
 
     entry_id: str
-    metadata: dict[str, Any]
-    body: str
+    metadata: Mapping[str, Any]
     path: Path
+    title: str = field(compare=False)
+    type: str = field(compare=False)
+    created_at: Optional[datetime] = field(compare=False)
+    sort_key: tuple[int, str] = field(repr=False, compare=False)
+    _components: tuple[str, ...] = field(repr=False, compare=False)
+    _project: Optional[str] = field(repr=False, compare=False)
+    _project_error: Optional[str] = field(repr=False, compare=False)
+    _body: Optional[str] = field(repr=False, compare=False)
+    _body_offset: int = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        entry_id: str,
+        metadata: Mapping[str, Any],
+        body: Optional[str],
+        path: Path,
+        *,
+        body_offset: int = 0,
+    ) -> None:
+        values = dict(metadata)
+        project: Optional[str] = None
+        project_error: Optional[str] = None
+        try:
+            project = normalize_project(values)
+        except ValueError as exc:
+            # Surface invalid project metadata when it is used, not on load.
+            project_error = str(exc)
+        metadata = MappingProxyType(values)
+        created_at = coerce_datetime(metadata.get("created"))
+        created_key = (
+            _epoch_microseconds(created_at) if created_at is not None else _MISSING_CREATED_KEY
+        )
+        assign = object.__setattr__
+        assign(self, "entry_id", entry_id)
+        assign(self, "metadata", metadata)
+        assign(self, "path", path)
+        assign(self, "title", str(metadata.get("title", "Untitled")))
+        assign(self, "type", str(metadata.get("type", "change")))
+        assign(self, "created_at", created_at)
+        assign(self, "sort_key", (created_key, entry_id))
+        assign(self, "_components", _coerce_components(metadata.get("components")))
+        assign(self, "_project", project)
+        assign(self, "_project_error", project_error)
+        assign(self, "_body", body)
+        assign(self, "_body_offset", body_offset)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Mapping proxies cannot be pickled, and entries cross process
+        # boundaries when rendering in parallel.
+        return (
+            _restore_entry,
+            (self.entry_id, dict(self.metadata), self._body, self.path, self._body_offset),
+        )
 
     @property
-    def title(self) -> str:
-        return str(self.metadata.get("title", "Untitled"))
-
-    @property
-    def type(self) -> str:
-        return str(self.metadata.get("type", "change"))
+    def body(self) -> str:
+        """Return the Markdown body, loading it from disk if still deferred."""
+        if self._body is None:
+            object.__setattr__(self, "_body", _read_entry_body(self.path, self._body_offset))
+        return cast(str, self._body)
 
     @property
     def components(self) -> list[str]:
         """Return the list of components for the entry."""
-        value = self.metadata.get("components")
-        if value is None:
-            return []
-        if isinstance(value, list):
-            return [str(item).strip() for item in value if str(item).strip()]
-        return [str(value).strip()] if str(value).strip() else []
+        return list(self._components)
 
     @property
     def component(self) -> Optional[str]:
         """Return the first component (for backwards compatibility)."""
-        components = self.components
-        return components[0] if components else None
+        return self._components[0] if self._components else None
 
     @property
     def project(self) -> Optional[str]:
         """Return the single project an entry belongs to."""
-        try:
-            return normalize_project(self.metadata)
-        except ValueError as exc:
+        if self._project_error is not None:
             raise ValueError(
-                f"Entry '{self.entry_id}' has invalid project metadata: {exc}"
-            ) from exc
+                f"Entry '{self.entry_id}' has invalid project metadata: {self._project_error}"
+            )
+        return self._project
 
     @property
     def projects(self) -> list[str]:
@@ -68,10 +150,6 @@ class Entry:
     def products(self) -> list[str]:  # backwards compatibility
         return self.projects
 
-    @property
-    def created_at(self) -> Optional[datetime]:
-        return coerce_datetime(self.metadata.get("created"))
-
     @property
     def created_date(self) -> Optional[date]:
         """Return just the date portion of created_at for display."""
@@ -79,64 +157,160 @@ class Entry:
         return dt.date() if dt else None
 
 
+def _restore_entry(
+    entry_id: str, metadata: dict[str, Any], body: Optional[str], path: Path, body_offset: int
+) -> Entry:
+    return Entry(entry_id, metadata, body, path, body_offset=body_offset)
+
+
 def entry_directory(project_root: Path) -> Path:
     """Return the directory containing unreleased changelog entries."""
     return project_root / UNRELEASED_DIR
 
 
-def read_entry(path: Path) -> Entry:
-    """Parse a markdown entry file with YAML frontmatter."""
-    content = path.read_text(encoding="utf-8")
-    if not content.startswith("---"):
-        raise ValueError(f"Entry {path} missing YAML frontmatter")
+_FRONTMATTER_DELIMITERS = (b"---\n", b"---\r\n")
 
-    _, _, remainder = content.partition("---\n")
-    frontmatter, _, body = remainder.partition("\n---\n")
-    metadata = yaml.safe_load(frontmatter) or {}
+
+def _read_frontmatter(path: Path) -> tuple[str, int] | None:
+    """Return the frontmatter text and the byte offset where the body starts.
+
+    Only the lines up to the closing delimiter are read. Returns None for
+    unusual layouts (no closing delimiter, bare carriage returns) that the
+    full-file parser in `read_entry` handles instead.
+    """
+    lines: list[bytes] = []
+    with open_binary(path) as handle:
+        if handle.readline() not in _FRONTMATTER_DELIMITERS:
+            return None
+        while True:
+            line = handle.readline()
+            if not line:
+                return None
+            if lines and line in _FRONTMATTER_DELIMITERS:
+                break
+            lines.append(line)
+        offset = handle.tell()
+    raw = b"".join(lines)
+    if b"\r" in raw.replace(b"\r\n", b""):
+        return None
+    return raw.decode("utf-8").replace("\r\n", "\n"), offset
+
+
+def _read_entry_body(path: Path, offset: int) -> str:
+    with open_binary(path) as handle:
+        handle.seek(offset)
+        text = handle.read().decode("utf-8")
+    # Match the universal newline handling of Path.read_text.
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def _normalize_entry_metadata(metadata: dict[str, Any]) -> None:
     _normalize_created_metadata(metadata)
     _normalize_prs_metadata(metadata)
     _normalize_authors_metadata(metadata)
     _normalize_components_metadata(metadata)
-    entry_id = path.stem
+
+
+@profiled("entries.parse")
+def read_entry(path: Path, *, cache: EntryCache | None = None) -> Entry:
+    """Parse a markdown entry file with YAML frontmatter.
+
+    Only the frontmatter is read eagerly; the body is loaded on first access.
+    When a cache is provided, unchanged files are served from it without
+    re-parsing their frontmatter.
+    """
+    fingerprint: FileFingerprint | None = None
+    if cache is not None:
+        fingerprint = FileFingerprint.of(path)
+        cached = cache.lookup(path, fingerprint)
+        if cached is not None:
+            cached_metadata, body_offset = cached
+            return Entry(
+                entry_id=path.stem,
+                metadata=cached_metadata,
+                body=None,
+                path=path,
+                body_offset=body_offset,
+            )
+
+    split = _read_frontmatter(path)
+    if split is None:
+        return _read_entry_eagerly(path)
+    frontmatter, body_offset = split
+    metadata = load_frontmatter(frontmatter) or {}
+    _normalize_entry_metadata(metadata)
+    if cache is not None and fingerprint is not None:
+        cache.store(path, fingerprint, metadata, body_offset)
+    return Entry(
+        entry_id=path.stem,
+        metadata=metadata,
+        body=None,
+        path=path,
+        body_offset=body_offset,
+    )
+
+
+def _read_entry_eagerly(path: Path) -> Entry:
+    content = read_text(path)
+    if not content.startswith("---"):
+        raise ValueError(f"Entry {path} missing YAML frontmatter")
+
+    _, _, remainder = content.partition("---\n")
+    frontmatter, _, body = remainder.partition("\n---\n")
+    metadata = load_frontmatter(frontmatter) or {}
+    _normalize_entry_metadata(metadata)
     return Entry(
-        entry_id=entry_id,
+        entry_id=path.stem,
         metadata=metadata,
         body=body.strip(),
         path=path,
     )
 
 
-def iter_entries(project_root: Path) -> Iterable[Entry]:
-    """Yield changelog entries from disk."""
-    directory = entry_directory(project_root)
-    if not directory.exists():
-        return
-    for path in sorted(directory.glob("*.md")):
-        try:
-            yield read_entry(path)
-        except yaml.YAMLError as exc:
-            raise ClickException(
-                f"Failed to parse YAML frontmatter in '{path.name}': {exc}\n\n"
-                "Hint: If your title or other fields contain colons, "
-                "wrap them in quotes."
-            ) from exc
-        except ValueError as exc:
-            raise ClickException(f"Failed to read entry '{path.name}': {exc}") from exc
+def _load_entry_file(path: Path, cache: EntryCache | None) -> Entry:
+    try:
+        return read_entry(path, cache=cache)
+    except yaml_error() as exc:
+        raise ClickException(
+            f"Failed to parse YAML frontmatter in '{path.name}': {exc}\n\n"
+            "Hint: If your title or other fields contain colons, "
+            "wrap them in quotes."
+        ) from exc
+    except ValueError as exc:
+        raise ClickException(f"Failed to read entry '{path.name}': {exc}") from exc
 
 
-def _entry_sort_key(entry: Entry) -> tuple[datetime, str]:
-    """Return a tuple for deterministic entry ordering.
+def iter_entries(project_root: Path) -> Iterable[Entry]:
+    """Yield changelog entries from disk.
 
-    Orders by created datetime (ascending) with entry_id as tie-breaker.
-    Entries without a created datetime sort to the beginning (epoch).
+    Files are read concurrently when parallel loading is enabled; entries are
+    still yielded in path order.
     """
-    created = entry.created_at or datetime.min.replace(tzinfo=timezone.utc)
-    return created, entry.entry_id
+    yield from load_entry_files(project_root, entry_paths(project_root))
+
+
+def entry_paths(project_root: Path) -> list[Path]:
+    """Return the unreleased entry files of a project in path order."""
+    directory = entry_directory(project_root)
+    if not is_dir(directory):
+        return []
+    return glob_paths(directory, "*.md")
+
+
+def load_entry_files(project_root: Path, paths: Sequence[Path]) -> list[Entry]:
+    """Parse entry files of a project, concurrently when enabled."""
+    with span("entries.load"):
+        cache = entry_cache_for(project_root)
+        return parallel_map(lambda path: _load_entry_file(path, cache), paths)
 
 
 def sort_entries_desc(entries: Iterable[Entry]) -> list[Entry]:
-    """Return entries sorted from newest to oldest by created datetime."""
-    return sorted(entries, key=_entry_sort_key, reverse=True)
+    """Return entries sorted from newest to oldest by created datetime.
+
+    Orders by created datetime with entry_id as tie-breaker. Entries without
+    a created datetime sort last.
+    """
+    return sorted(entries, key=attrgetter("sort_key"), reverse=True)
 
 
 def generate_entry_id(title: str) -> str:
@@ -273,12 +447,18 @@ def _normalize_components_metadata(metadata: dict[str, Any]) -> None:
                 metadata.pop("components", None)
 
 
-class _IndentedDumper(yaml.SafeDumper):
-    """Custom YAML dumper that indents list items under their parent key."""
+@functools.cache
+def _indented_dumper() -> type[yaml.SafeDumper]:
+    import yaml
+
+    class _IndentedDumper(yaml.SafeDumper):
+        """Custom YAML dumper that indents list items under their parent key."""
+
+        def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:
+            """Override to always indent sequences."""
+            return super().increase_indent(flow=flow, indentless=False)
 
-    def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:
-        """Override to always indent sequences."""
-        return super().increase_indent(flow=flow, indentless=False)
+    return _IndentedDumper
 
 
 def format_frontmatter(metadata: dict[str, Any]) -> str:
@@ -288,9 +468,9 @@ def format_frontmatter(metadata: dict[str, Any]) -> str:
         if value is None:
             continue
         cleaned[key] = value
-    yaml_block = yaml.dump(
+    yaml_block = dump_yaml(
         cleaned,
-        Dumper=_IndentedDumper,
+        dumper=_indented_dumper(),
         sort_keys=False,
         default_flow_style=False,
         indent=2,
@@ -342,6 +522,29 @@ def write_entry(
     return path
 
 
+def write_entry_created(path: Path, created: datetime) -> None:
+    """Set the `created` field of an entry file, leaving everything else untouched."""
+    with path.open(encoding="utf-8", newline="") as handle:
+        content = handle.read()
+    lines = content.splitlines(keepends=True)
+    if not lines or lines[0].strip() != "---":
+        raise ValueError(f"Entry {path} missing YAML frontmatter")
+    newline = "\r\n" if lines[0].endswith("\r\n") else "\n"
+    stamp = created.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    value = f"created: {stamp}{newline}"
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            lines.insert(index, value)
+            break
+        if line.startswith("created:"):
+            lines[index] = value
+            break
+    else:
+        raise ValueError(f"Entry {path} has unterminated YAML frontmatter")
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write("".join(lines))
+
+
 @dataclass
 class MultiProjectEntry:
     """An entry with its associated project information."""
@@ -352,25 +555,31 @@ class MultiProjectEntry:
     project_name: str
 
 
-def iter_multi_project_entries(projects: list[tuple[Path, Any]]) -> Iterable[MultiProjectEntry]:
+def iter_multi_project_entries(
+    projects: list[tuple[Path, Any]],
+    snapshots: Optional[Mapping[Path, Any]] = None,
+) -> Iterable[MultiProjectEntry]:
     """Yield entries from multiple projects with project context.
 
     Args:
         projects: List of (project_root, config) tuples
+        snapshots: Optional mapping from project root to an already loaded
+            `ProjectSnapshot`, so release manifests are not parsed again
 
     Yields:
         MultiProjectEntry instances with entry and project information
     """
-    from .releases import collect_release_entries
+    from .releases import ProjectSnapshot
 
     for project_root, config in projects:
+        snapshot = (snapshots or {}).get(project_root) or ProjectSnapshot(project_root)
         project_id = getattr(config, "id", slugify(project_root.name))
         project_name = getattr(config, "name", str(project_root.name))
         # Collect all entries (unreleased and released), avoiding duplicates
         entry_map: dict[str, Entry] = {}
         for entry in iter_entries(project_root):
             entry_map[entry.entry_id] = entry
-        for entry_id, entry in collect_release_entries(project_root).items():
+        for entry_id, entry in snapshot.released_entries.items():
             if entry_id not in entry_map:
                 entry_map[entry_id] = entry
         for entry in entry_map.values():
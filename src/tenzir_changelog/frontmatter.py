@@ -0,0 +1,216 @@
+"""Fast YAML loading for entry frontmatter and release manifests, plus dumping."""
+
+from __future__ import annotations
+
+import functools
+import re
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import yaml
+    from yaml.constructor import SafeConstructor
+    from yaml.nodes import Node, ScalarNode
+    from yaml.resolver import Resolver
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_KEY_PATTERN = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?")
+_ITEM_PATTERN = re.compile(r"( *)- +(.*)")
+_PLAIN_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+
+
+class _Yaml(NamedTuple):
+    loader: type[yaml.SafeLoader]
+    resolver: Resolver
+    constructor: SafeConstructor
+    scalar_node: type[ScalarNode]
+    non_printable: re.Pattern[str]
+
+
+@functools.cache
+def _yaml() -> _Yaml:
+    # PyYAML is imported on first use so that starting the CLI does not pay
+    # for it. The libyaml-backed loader shares its resolver and constructor
+    # with the pure-Python one, so both produce identical objects.
+    import yaml
+    from yaml.constructor import SafeConstructor
+    from yaml.nodes import ScalarNode
+    from yaml.reader import Reader
+    from yaml.resolver import Resolver
+
+    return _Yaml(
+        loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        resolver=Resolver(),
+        constructor=SafeConstructor(),
+        scalar_node=ScalarNode,
+        non_printable=Reader.NON_PRINTABLE,
+    )
+
+
+def yaml_error() -> type[Exception]:
+    """Return the base class of PyYAML's errors.
+
+    Meant for `except` clauses, which only evaluate it once an exception
+    propagates, so that catching parse errors does not import PyYAML early.
+    """
+    import yaml
+
+    return yaml.YAMLError
+
+
+def load_yaml(text: str) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    import yaml
+
+    return yaml.load(text, Loader=_yaml().loader)
+
+
+def load_frontmatter(text: str) -> Any:
+    """Parse frontmatter, trying the flat-mapping fast path before full YAML."""
+    parsed = parse_flat_mapping(text)
+    if parsed is not None:
+        return parsed
+    return load_yaml(text)
+
+
+def _scalar(raw: str) -> tuple[str, bool] | None:
+    """Return the scalar value and whether it is plain, or None if unsupported."""
+    value = raw.rstrip(" ")
+    if not value:
+        return None
+    first = value[0]
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+            return None
+        return inner.replace("''", "'"), False
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or "\\" in inner:
+            return None
+        return inner, False
+    if first in _PLAIN_INDICATORS or ": " in value or " #" in value or value.endswith(":"):
+        return None
+    return value, True
+
+
+class _Unsupported(Exception):
+    """Raised when a scalar resolves to a tag the safe constructor rejects."""
+
+
+def _construct(value: str, plain: bool) -> Any:
+    tools = _yaml()
+    tag = tools.resolver.resolve(tools.scalar_node, value, (plain, not plain))
+    constructor = tools.constructor.yaml_constructors.get(tag)
+    if constructor is None:
+        raise _Unsupported(tag)
+    return constructor(tools.constructor, tools.scalar_node(tag, value))
+
+
+def parse_flat_mapping(text: str) -> Optional[dict[Any, Any]]:
+    """Parse a flat mapping of scalars and block lists of scalars.
+
+    This covers the shape of nearly all entry frontmatter. Returns None for
+    anything outside that subset (nested mappings, flow collections, block
+    scalars, multi-line values, anchors, tags, escapes, or comments after
+    values), in which case callers must fall back to a full YAML parser.
+    """
+    try:
+        return _parse_flat_mapping(text)
+    except _Unsupported:
+        return None
+
+
+def _parse_flat_mapping(text: str) -> Optional[dict[Any, Any]]:
+    tools = _yaml()
+    if any(char in text for char in "\t\r\ufeff") or tools.non_printable.search(text):
+        return None
+    result: dict[Any, Any] = {}
+    list_key: str | None = None
+    list_indent: int | None = None
+    for line in text.split("\n"):
+        stripped = line.strip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        item = _ITEM_PATTERN.fullmatch(line)
+        if item is not None:
+            if list_key is None:
+                return None
+            indent = len(item.group(1))
+            if list_indent is None:
+                list_indent = indent
+                result[list_key] = []
+            elif indent != list_indent:
+                return None
+            scalar = _scalar(item.group(2))
+            if scalar is None:
+                return None
+            result[list_key].append(_construct(*scalar))
+            continue
+        match = _KEY_PATTERN.fullmatch(line.rstrip(" "))
+        if match is None:
+            return None
+        key = match.group(1)
+        if tools.resolver.resolve(tools.scalar_node, key, (True, False)) != _STR_TAG:
+            return None
+        list_key = None
+        list_indent = None
+        raw_value = match.group(2)
+        if raw_value is None:
+            # Either null or the start of a block list on the following lines.
+            result[key] = None
+            list_key = key
+            continue
+        scalar = _scalar(raw_value)
+        if scalar is None:
+            return None
+        result[key] = _construct(*scalar)
+    # Leave empty documents to YAML so the result matches exactly.
+    return result or None
+
+
+class FoldedString(str):
+    """Marker type for YAML folded (>) scalars."""
+
+
+def _represent_date(dumper: yaml.SafeDumper, data: date) -> Node:
+    return dumper.represent_scalar("tag:yaml.org,2002:timestamp", data.isoformat())
+
+
+def _represent_datetime(dumper: yaml.SafeDumper, data: datetime) -> Node:
+    # Use Z suffix for UTC, otherwise use the offset format
+    if data.tzinfo is not None and data.utcoffset() == timezone.utc.utcoffset(None):
+        # Format as ISO with Z suffix for UTC
+        iso_str = data.strftime("%Y-%m-%dT%H:%M:%S")
+        if data.microsecond:
+            iso_str += f".{data.microsecond:06d}".rstrip("0")
+        iso_str += "Z"
+    else:
+        iso_str = data.isoformat()
+    return dumper.represent_scalar("tag:yaml.org,2002:timestamp", iso_str)
+
+
+def _represent_folded_string(dumper: yaml.SafeDumper, data: FoldedString) -> Node:
+    return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style=">")
+
+
+@functools.cache
+def _register_representers() -> None:
+    import yaml
+
+    yaml.SafeDumper.add_representer(date, _represent_date)
+    yaml.SafeDumper.add_representer(datetime, _represent_datetime)
+    yaml.SafeDumper.add_representer(FoldedString, _represent_folded_string)
+
+
+def dump_yaml(data: Any, *, dumper: Optional[type[yaml.SafeDumper]] = None, **options: Any) -> str:
+    """Serialize `data` with PyYAML's safe dumper or a subclass of it.
+
+    Dates and datetimes are written in ISO 8601, with a `Z` suffix for UTC,
+    and `FoldedString` values as folded block scalars.
+    """
+    import yaml
+
+    _register_representers()
+    text: str = yaml.dump(data, Dumper=dumper or yaml.SafeDumper, **options)
+    return text
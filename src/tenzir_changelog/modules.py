@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import glob
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator
-
-from .config import load_project_config
+from typing import Iterator
+
+from .cache import (
+    FileFingerprint,
+    cache_enabled,
+    project_cache_path,
+    read_cache_file,
+    write_cache_file,
+)
+from .config import Config, default_config_path, load_project_config, package_metadata_path
+from .discovery import discovery_mode, glob_paths
+from .storage import is_dir, path_exists
 from .utils import log_warning
 
-if TYPE_CHECKING:
-    from .config import Config
-
 
 @dataclass
 class Module:
@@ -22,48 +29,83 @@ class Module:
     relative_path: str  # Path relative to parent (for display)
 
 
-def discover_modules(parent_root: Path, glob_pattern: str) -> Iterator[Module]:
-    """Discover modules matching glob pattern relative to parent.
+@dataclass
+class _DiscoveryRecord:
+    """Cached outcome of globbing a module pattern.
 
-    The glob pattern is resolved relative to the parent changelog root.
-    Each matched directory must contain a valid config.yaml.
+    `results` holds one `(match, relative_path, config_or_error)` tuple per
+    matched directory, where a string marks a skipped module.
+    """
 
-    Args:
-        parent_root: The parent changelog project root directory.
-        glob_pattern: Glob pattern for finding module directories.
+    pattern: str
+    watched: dict[str, FileFingerprint | None]
+    results: list[tuple[str, str, "Config | str"]]
 
-    Yields:
-        Module instances for each valid discovered module.
-    """
-    # Resolve the base path for globbing
+    def is_current(self, pattern: str) -> bool:
+        return self.pattern == pattern and all(
+            FileFingerprint.of_optional(Path(path)) == fingerprint
+            for path, fingerprint in self.watched.items()
+        )
+
+
+def _split_pattern(parent_root: Path, glob_pattern: str) -> tuple[Path, tuple[str, ...]]:
     # Handle patterns like "../packages/*/changelog" by resolving relative to parent_root
     base_path = parent_root
-
-    # Split the pattern to handle leading ../ components
     pattern_parts = Path(glob_pattern).parts
     while pattern_parts and pattern_parts[0] == "..":
         base_path = base_path.parent
         pattern_parts = pattern_parts[1:]
+    return base_path, pattern_parts or ("*",)
 
-    # Reconstruct the remaining pattern
-    remaining_pattern = str(Path(*pattern_parts)) if pattern_parts else "*"
 
-    # Find all matching directories
-    for match in sorted(base_path.glob(remaining_pattern)):
-        if not match.is_dir():
+def _glob_levels(base_path: Path, parts: tuple[str, ...]) -> tuple[list[Path], list[Path]]:
+    """Expand a glob one segment at a time.
+
+    Returns the matches plus every directory whose listing decided them, so
+    that the modification times of those directories can validate a cache.
+    """
+    directories: list[Path] = []
+    current = [base_path]
+    for index, part in enumerate(parts):
+        directories.extend(current)
+        last = index == len(parts) - 1
+        candidates: list[Path] = []
+        for directory in current:
+            if glob.has_magic(part) or discovery_mode() == "git":
+                candidates.extend(glob_paths(directory, part))
+            elif path_exists(directory / part):
+                candidates.append(directory / part)
+        current = [path for path in candidates if last or is_dir(path)]
+    return sorted(current), directories
+
+
+def _config_paths(root: Path) -> list[Path]:
+    return [default_config_path(root), package_metadata_path(root)]
+
+
+def _discover(parent_root: Path, glob_pattern: str) -> _DiscoveryRecord:
+    base_path, parts = _split_pattern(parent_root, glob_pattern)
+    matches, directories = _glob_levels(base_path, parts)
+    watched = list(directories)
+    results: list[tuple[str, str, Config | str]] = []
+    parent_resolved = parent_root.resolve()
+    for match in matches:
+        if not is_dir(match):
             continue
 
         # Skip if this is the parent itself
         resolved_match = match.resolve()
-        if resolved_match == parent_root.resolve():
+        if resolved_match == parent_resolved:
             continue
 
+        watched.extend(_config_paths(resolved_match))
+
         # Try to load the config
+        config: Config | str
         try:
             config = load_project_config(resolved_match)
         except (FileNotFoundError, ValueError) as exc:
-            log_warning(f"Skipping {match}: {exc}")
-            continue
+            config = f"Skipping {match}: {exc}"
 
         # Calculate relative path for display
         try:
@@ -76,8 +118,54 @@ def discover_modules(parent_root: Path, glob_pattern: str) -> Iterator[Module]:
                 prefix = "../" * glob_pattern.count("../")
                 relative_path = prefix + relative_path
 
+        results.append((str(resolved_match), relative_path, config))
+    return _DiscoveryRecord(
+        pattern=glob_pattern,
+        watched={str(path.absolute()): FileFingerprint.of_optional(path) for path in watched},
+        results=results,
+    )
+
+
+def _cached_discovery(parent_root: Path, glob_pattern: str) -> _DiscoveryRecord:
+    """Return discovery results, reusing the persistent cache when current."""
+    # Recursive patterns can match at any depth, so there is no finite set of
+    # directories to watch. Git discovery depends on the index rather than on
+    # directory modification times.
+    if not cache_enabled() or "**" in glob_pattern or discovery_mode() == "git":
+        return _discover(parent_root, glob_pattern)
+    path = project_cache_path(parent_root.resolve(), "modules", ".pickle")
+    record = read_cache_file(path)
+    if isinstance(record, _DiscoveryRecord) and record.is_current(glob_pattern):
+        return record
+    record = _discover(parent_root, glob_pattern)
+    fingerprints = [fingerprint for fingerprint in record.watched.values() if fingerprint]
+    if not any(fingerprint.is_racy() for fingerprint in fingerprints):
+        write_cache_file(path, record)
+    return record
+
+
+def discover_modules(parent_root: Path, glob_pattern: str) -> Iterator[Module]:
+    """Discover modules matching glob pattern relative to parent.
+
+    The glob pattern is resolved relative to the parent changelog root.
+    Each matched directory must contain a valid config.yaml.
+
+    Results are cached persistently and reused while the modification times
+    of the globbed directories and of every module's config file are unchanged.
+
+    Args:
+        parent_root: The parent changelog project root directory.
+        glob_pattern: Glob pattern for finding module directories.
+
+    Yields:
+        Module instances for each valid discovered module.
+    """
+    for root, relative_path, config in _cached_discovery(parent_root, glob_pattern).results:
+        if isinstance(config, str):
+            log_warning(config)
+            continue
         yield Module(
-            root=resolved_match,
+            root=Path(root),
             config=config,
             relative_path=relative_path,
         )
@@ -0,0 +1,122 @@
+"""Bounded worker pools for I/O-heavy loading and CPU-bound validation."""
+
+from __future__ import annotations
+
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence, TypeVar
+
+from click import ClickException
+
+from .cache import (
+    CacheChanges,
+    cache_directory,
+    cache_enabled,
+    configure_cache,
+    merge_cache_changes,
+    take_cache_changes,
+)
+from .storage import active_storage, configure_storage
+
+JOBS_ENV = "TENZIR_CHANGELOG_JOBS"
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_jobs = 1
+
+
+def _parse_jobs(value: str) -> int:
+    try:
+        jobs = int(value.strip())
+    except ValueError as exc:
+        raise ClickException(f"{JOBS_ENV} must be an integer, got '{value}'.") from exc
+    if jobs < 0:
+        raise ClickException(f"{JOBS_ENV} must not be negative, got '{value}'.")
+    return jobs
+
+
+def configure_jobs(jobs: Optional[int] = None) -> None:
+    """Set the worker count used for parallel loading.
+
+    `None` falls back to the `TENZIR_CHANGELOG_JOBS` environment variable and
+    then to sequential loading. `0` selects one worker per available CPU.
+    """
+    global _jobs
+    if jobs is None:
+        raw = os.environ.get(JOBS_ENV, "")
+        jobs = _parse_jobs(raw) if raw.strip() else 1
+    if jobs < 0:
+        raise ClickException(f"--jobs must not be negative, got {jobs}.")
+    _jobs = jobs or (os.cpu_count() or 1)
+
+
+def configured_jobs() -> int:
+    """Return the number of workers used for parallel loading."""
+    return _jobs
+
+
+def parallel_map(function: Callable[[_T], _R], items: Iterable[_T]) -> list[_R]:
+    """Apply `function` to every item, preserving input order.
+
+    Work runs on a thread pool when more than one job is configured. The first
+    exception in input order propagates, exactly as in a sequential loop.
+    """
+    values: Sequence[_T] = items if isinstance(items, Sequence) else list(items)
+    workers = min(_jobs, len(values))
+    if workers <= 1:
+        return [function(item) for item in values]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, values))
+
+
+def _initialize_worker(
+    enabled: bool, directory: Path, ref: Optional[str], repository: Optional[Path]
+) -> None:
+    configure_cache(enabled=enabled, directory=directory)
+    configure_storage(ref, start=repository or Path("."))
+    # Each worker process is already one unit of parallelism.
+    configure_jobs(1)
+
+
+def _run_in_worker(function: Callable[[_T], _R], item: _T) -> tuple[_R, CacheChanges]:
+    # Worker processes exit without running atexit handlers, and flushing
+    # from every worker would rewrite the cache files once per item. The
+    # parent merges the changes instead and flushes them once.
+    result = function(item)
+    return result, take_cache_changes()
+
+
+def process_map(function: Callable[[_T], _R], items: Iterable[_T]) -> list[_R]:
+    """Apply `function` to every item in worker processes, preserving input order.
+
+    Use this for CPU-bound work that threads cannot speed up. `function` and
+    the items must be picklable. Workers inherit the cache and storage
+    settings and load files sequentially. With one job or a single item, the
+    work runs inline.
+    """
+    values: Sequence[_T] = items if isinstance(items, Sequence) else list(items)
+    workers = min(_jobs, len(values))
+    if workers <= 1:
+        return [function(item) for item in values]
+    # Importing the process pool pulls in multiprocessing; defer it.
+    from concurrent.futures import ProcessPoolExecutor
+
+    storage = active_storage()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(
+            cache_enabled(),
+            cache_directory(),
+            storage.ref if storage is not None else None,
+            storage.root if storage is not None else None,
+        ),
+    ) as executor:
+        results: list[_R] = []
+        for result, changes in executor.map(functools.partial(_run_in_worker, function), values):
+            merge_cache_changes(changes)
+            results.append(result)
+        return results
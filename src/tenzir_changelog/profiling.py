@@ -0,0 +1,180 @@
+"""Timing spans for the `--profile` option."""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass(frozen=True)
+class Span:
+    """A completed timing span."""
+
+    name: str
+    start: float
+    duration: float
+    self_duration: float
+    depth: int
+    thread_id: int
+
+
+@dataclass(frozen=True)
+class PhaseSummary:
+    """Aggregated timings of all spans sharing a name."""
+
+    name: str
+    calls: int
+    total: float
+    self_total: float
+
+
+class Profiler:
+    """Collects nested timing spans from all threads."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.spans: list[Span] = []
+        self._local = threading.local()
+
+    def _stack(self) -> list[list[float]]:
+        stack: list[list[float]] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and record it under `name`."""
+        stack = self._stack()
+        # Each frame accumulates the duration of its direct children.
+        frame = [0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += duration
+            self.spans.append(
+                Span(
+                    name=name,
+                    start=start - self.origin,
+                    duration=duration,
+                    self_duration=duration - frame[0],
+                    depth=len(stack),
+                    thread_id=threading.get_ident(),
+                )
+            )
+
+    def elapsed(self) -> float:
+        """Return the wall-clock time since profiling started."""
+        return time.perf_counter() - self.origin
+
+    def summary(self) -> list[PhaseSummary]:
+        """Return per-phase totals ordered by descending total time."""
+        phases: dict[str, list[float]] = {}
+        for span in list(self.spans):
+            totals = phases.setdefault(span.name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += span.duration
+            totals[2] += span.self_duration
+        result = [
+            PhaseSummary(name=name, calls=int(calls), total=total, self_total=self_total)
+            for name, (calls, total, self_total) in phases.items()
+        ]
+        result.sort(key=lambda phase: phase.total, reverse=True)
+        return result
+
+    def to_trace(self) -> dict[str, Any]:
+        """Return the spans in Chrome trace event format plus a summary."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": round(span.start * 1_000_000, 3),
+                "dur": round(span.duration * 1_000_000, 3),
+                "pid": pid,
+                "tid": span.thread_id,
+            }
+            for span in sorted(self.spans, key=lambda span: span.start)
+        ]
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "wallTime": self.elapsed(),
+            "summary": [
+                {
+                    "name": phase.name,
+                    "calls": phase.calls,
+                    "total": phase.total,
+                    "self": phase.self_total,
+                }
+                for phase in self.summary()
+            ],
+        }
+
+    def write_trace(self, path: Path) -> None:
+        """Write the JSON trace to `path`."""
+        path.write_text(json.dumps(self.to_trace(), indent=2) + "\n", encoding="utf-8")
+
+
+_profiler: Optional[Profiler] = None
+
+
+def enable_profiling() -> Profiler:
+    """Start collecting spans, replacing any previous profiler."""
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+def disable_profiling() -> None:
+    """Stop collecting spans."""
+    global _profiler
+    _profiler = None
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Return the running profiler, if any."""
+    return _profiler
+
+
+def span(name: str) -> AbstractContextManager[None]:
+    """Return a timing span, or a shared no-op context when profiling is off."""
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name)
+
+
+def profiled(name: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Decorate a function so each call is recorded as a span."""
+
+    def decorate(function: Callable[_P, _R]) -> Callable[_P, _R]:
+        @functools.wraps(function)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            profiler = _profiler
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
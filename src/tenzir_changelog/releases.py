@@ -2,48 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import date, datetime, timezone
+import bisect
+from dataclasses import dataclass, field, replace
+from datetime import date
 from pathlib import Path
-from typing import Iterable, Optional
-
-import yaml
-from yaml.nodes import Node
-
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .cache import (
+    FileFingerprint,
+    cache_enabled,
+    entry_cache_for,
+    project_cache_path,
+    read_cache_file,
+    write_cache_file,
+)
+from .discovery import glob_paths, invalidate_discovery
 from .entries import Entry, read_entry
+from .frontmatter import FoldedString, dump_yaml, load_frontmatter
+from .parallel import parallel_map
+from .profiling import span
+from .storage import is_dir, path_exists, read_text
 
-
-def _represent_date(dumper: yaml.SafeDumper, data: date) -> Node:
-    return dumper.represent_scalar("tag:yaml.org,2002:timestamp", data.isoformat())
-
-
-def _represent_datetime(dumper: yaml.SafeDumper, data: datetime) -> Node:
-    # Use Z suffix for UTC, otherwise use the offset format
-    if data.tzinfo is not None and data.utcoffset() == timezone.utc.utcoffset(None):
-        # Format as ISO with Z suffix for UTC
-        iso_str = data.strftime("%Y-%m-%dT%H:%M:%S")
-        if data.microsecond:
-            iso_str += f".{data.microsecond:06d}".rstrip("0")
-        iso_str += "Z"
-    else:
-        iso_str = data.isoformat()
-    return dumper.represent_scalar("tag:yaml.org,2002:timestamp", iso_str)
-
-
-yaml.SafeDumper.add_representer(date, _represent_date)
-yaml.SafeDumper.add_representer(datetime, _represent_datetime)
-
-
-class _FoldedString(str):
-    """Marker type for YAML folded (>) scalars."""
-
-
-def _represent_folded_string(dumper: yaml.SafeDumper, data: _FoldedString) -> Node:
-    return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style=">")
-
-
-# Register custom representation for folded strings.
-yaml.SafeDumper.add_representer(_FoldedString, _represent_folded_string)
+if TYPE_CHECKING:
+    from packaging.version import Version
 
 NOTES_FILENAME = "notes.md"
 RELEASE_DIR = Path("releases")
@@ -82,58 +63,143 @@ def _parse_created_date(raw_value: object | None) -> date:
     return date.fromisoformat(str(raw_value))
 
 
-def iter_release_manifests(project_root: Path) -> Iterable[ReleaseManifest]:
-    """Yield release manifests from disk."""
+def _manifest_from_data(
+    path: Path, data: dict[str, object], entry_ids: list[str]
+) -> ReleaseManifest:
+    # Prefer `intro`; fall back to legacy `description` if present.
+    raw_intro = str(data.get("intro", "") or "").strip()
+    if not raw_intro:
+        raw_intro = str(data.get("description", "") or "").strip()
+    created_value = _parse_created_date(data.get("created"))
+
+    version_value = data.get("version") or path.parent.name
+
+    title_value = str(data.get("title", ""))
+    if not title_value:
+        title_value = str(version_value)
+
+    entry_values = data.get("entries")
+    raw_modules = data.get("modules")
+    modules: dict[str, str] = {}
+    if isinstance(raw_modules, dict):
+        modules = {str(k): str(v) for k, v in raw_modules.items()}
+
+    manifest = ReleaseManifest(
+        version=str(version_value),
+        created=created_value,
+        title=title_value,
+        intro=raw_intro or None,
+        modules=modules,
+        path=path,
+    )
+    if isinstance(entry_values, list) and entry_values:
+        manifest.entries = [str(entry_id) for entry_id in entry_values]
+    else:
+        manifest.entries = list(entry_ids)
+    return manifest
+
+
+def _read_release_manifest(path: Path) -> ReleaseManifest:
+    data = load_frontmatter(read_text(path)) or {}
+    entry_files = glob_paths(path.parent / "entries", "*.md")
+    return _manifest_from_data(path, data, [entry_file.stem for entry_file in entry_files])
+
+
+def release_catalog_path(project_root: Path) -> Path:
+    """Return the cache file holding the release catalog of a project."""
+    return project_cache_path(project_root, "releases", ".pickle")
+
+
+_ReleaseSignature = tuple[FileFingerprint, Optional[FileFingerprint]]
+
+
+def _release_signature(manifest_path: Path) -> _ReleaseSignature | None:
+    """Identify the state of a release directory without reading it.
+
+    The manifest's fingerprint covers edits to it. The fingerprint of the
+    `entries/` directory changes whenever entry files are added, removed, or
+    renamed, which is all that the entry IDs of a manifest depend on. Returns
+    None when either changed too recently for its timestamp to be trusted.
+    """
+    try:
+        manifest = FileFingerprint.of(manifest_path)
+    except OSError:
+        return None
+    entries = FileFingerprint.of_optional(manifest_path.parent / "entries")
+    if manifest.is_racy() or (entries is not None and entries.is_racy()):
+        return None
+    return manifest, entries
+
+
+def read_release_catalog(
+    project_root: Path,
+) -> dict[str, tuple[_ReleaseSignature, ReleaseManifest]]:
+    """Return the cataloged manifests with their signatures, keyed by release directory name.
+
+    A missing or unreadable catalog yields no records, so readers fall back
+    to parsing the manifests themselves.
+    """
+    records = read_cache_file(release_catalog_path(project_root))
+    return records if isinstance(records, dict) else {}
+
+
+def _scan_release_manifests(project_root: Path) -> list[ReleaseManifest]:
+    """Return every release manifest, parsing only those changed since the last scan.
+
+    Unless caching is disabled, manifests are kept in a per-project release
+    catalog in the cache directory. A manifest is taken from the catalog as
+    long as its signature is unchanged, so unchanged releases are neither
+    read nor globbed. The catalog is rewritten when any release changed.
+    """
     directory = release_directory(project_root)
-    if not directory.exists():
-        return
-
-    manifest_paths = sorted(directory.glob("*/manifest.yaml"))
-
-    for path in manifest_paths:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-
-        # Prefer `intro`; fall back to legacy `description` if present.
-        raw_intro = str(data.get("intro", "") or "").strip()
-        if not raw_intro:
-            raw_intro = str(data.get("description", "") or "").strip()
-        created_value = _parse_created_date(data.get("created"))
-
-        version_value = data.get("version") or path.parent.name
-
-        title_value = str(data.get("title", ""))
-        if not title_value:
-            title_value = str(version_value)
-
-        entry_values = data.get("entries")
-        raw_modules = data.get("modules")
-        modules: dict[str, str] = {}
-        if isinstance(raw_modules, dict):
-            modules = {str(k): str(v) for k, v in raw_modules.items()}
-
-        manifest = ReleaseManifest(
-            version=str(version_value),
-            created=created_value,
-            title=title_value,
-            intro=raw_intro or None,
-            modules=modules,
-            path=path,
-        )
-        if isinstance(entry_values, list) and entry_values:
-            manifest.entries = [str(entry_id) for entry_id in entry_values]
+    if not is_dir(directory):
+        return []
+    catalog = read_release_catalog(project_root) if cache_enabled() else None
+    updated: dict[str, tuple[_ReleaseSignature, ReleaseManifest]] = {}
+    manifests: list[ReleaseManifest] = []
+    for path in glob_paths(directory, "*/manifest.yaml"):
+        name = path.parent.name
+        signature = _release_signature(path) if catalog is not None else None
+        cached = catalog.get(name) if catalog is not None else None
+        if signature is not None and cached is not None and cached[0] == signature:
+            manifest = replace(cached[1], path=path)
+            updated[name] = cached
         else:
-            entries_dir = path.parent / "entries"
-            entry_files = sorted(entries_dir.glob("*.md"))
-            manifest.entries = [entry_file.stem for entry_file in entry_files]
-        yield manifest
+            data = load_frontmatter(read_text(path)) or {}
+            entry_files = glob_paths(path.parent / "entries", "*.md")
+            manifest = _manifest_from_data(path, data, [entry.stem for entry in entry_files])
+            # Without a `created` date, the manifest falls back to today.
+            if signature is not None and data.get("created") is not None:
+                updated[name] = (signature, manifest)
+        manifests.append(manifest)
+    if catalog is not None and updated != catalog:
+        write_cache_file(release_catalog_path(project_root), updated)
+    return manifests
+
+
+def iter_release_manifests(project_root: Path) -> Iterable[ReleaseManifest]:
+    """Yield release manifests from disk, using the release catalog if enabled."""
+    yield from _scan_release_manifests(project_root)
+
+
+def load_release_manifest(project_root: Path, version: str) -> ReleaseManifest | None:
+    """Load the manifest stored in the release directory named `version`, if any.
+
+    Only that one manifest is read. Returns None when the directory does not
+    exist or the manifest declares a different version label.
+    """
+    if not version or Path(version).name != version or version in {".", ".."}:
+        return None
+    path = release_directory(project_root) / version / "manifest.yaml"
+    if not path_exists(path):
+        return None
+    manifest = _read_release_manifest(path)
+    return manifest if manifest.version == version else None
 
 
 def used_entry_ids(project_root: Path) -> set[str]:
     """Return a set containing entry IDs that already belong to a release."""
-    used = set()
-    for manifest in iter_release_manifests(project_root):
-        used.update(manifest.entries)
-    return used
+    return set(ProjectSnapshot(project_root).used_entry_ids)
 
 
 def unused_entries(entries: Iterable[Entry], used_ids: set[str]) -> list[Entry]:
@@ -150,11 +216,11 @@ def serialize_release_manifest(manifest: ReleaseManifest) -> str:
         payload["title"] = manifest.title
     if manifest.intro:
         # Emit `intro` using a folded block scalar for readability.
-        payload["intro"] = _FoldedString(manifest.intro)
+        payload["intro"] = FoldedString(manifest.intro)
     if manifest.modules:
         payload["modules"] = manifest.modules
     # Use default wrapping width for readability; preserve key order.
-    return yaml.safe_dump(payload, sort_keys=False)
+    return dump_yaml(payload, sort_keys=False)
 
 
 def write_release_manifest(
@@ -183,6 +249,7 @@ def write_release_manifest(
     notes_path.write_text(notes_payload, encoding="utf-8")
 
     manifest.path = manifest_path
+    invalidate_discovery()
     return manifest_path
 
 
@@ -191,7 +258,7 @@ def _manifest_root(project_root: Path, manifest: ReleaseManifest) -> Path:
     if manifest.path is None:
         return release_directory(project_root) / manifest.version
     path = manifest.path
-    if path.is_dir():
+    if is_dir(path):
         return path
     if path.name.lower() == "manifest.yaml":
         return path.parent
@@ -204,7 +271,7 @@ def resolve_release_entry_path(
     """Return the path to an entry file belonging to a release, if present."""
     root = _manifest_root(project_root, manifest)
     entry_path = root / "entries" / f"{entry_id}.md"
-    if entry_path.exists():
+    if path_exists(entry_path):
         return entry_path
     return None
 
@@ -216,32 +283,272 @@ def load_release_entry(
     entry_path = resolve_release_entry_path(project_root, manifest, entry_id)
     if entry_path is None:
         return None
-    return read_entry(entry_path)
+    return read_entry(entry_path, cache=entry_cache_for(project_root))
 
 
 def collect_release_entries(project_root: Path) -> dict[str, Entry]:
     """Return a mapping of entry ids to entries across all releases."""
-    collected: dict[str, Entry] = {}
-    for manifest in iter_release_manifests(project_root):
-        for entry_id in manifest.entries:
-            if entry_id in collected:
-                continue
-            entry = load_release_entry(project_root, manifest, entry_id)
-            if entry is not None:
-                collected[entry_id] = entry
-    return collected
+    return dict(ProjectSnapshot(project_root).released_entries)
 
 
 def build_entry_release_index(
     project_root: Path, *, project: Optional[str] = None
 ) -> dict[str, list[str]]:
     """Return a mapping from entry id to associated release versions."""
-    index: dict[str, list[str]] = {}
-    for manifest in iter_release_manifests(project_root):
-        for entry_id in manifest.entries:
-            versions = index.setdefault(entry_id, [])
-            if manifest.version not in versions:
-                versions.append(manifest.version)
-    for versions in index.values():
-        versions.sort()
-    return index
+    index = ProjectSnapshot(project_root).release_index
+    return {entry_id: list(versions) for entry_id, versions in index.items()}
+
+
+def _parse_release_version(label: str) -> Version | None:
+    from packaging.version import InvalidVersion, Version
+
+    try:
+        return Version(label.lstrip("vV"))
+    except InvalidVersion:
+        return None
+
+
+class SemverIndex:
+    """Release manifests ordered by semantic version for bisect lookups.
+
+    Version labels are parsed once on construction; manifests whose label is
+    not a valid version are left out. Releases that share a version keep
+    their on-disk order, so the last of them counts as the latest. Lookups
+    accept version labels such as `v1.2.0` as well as parsed versions.
+    """
+
+    def __init__(self, manifests: Iterable[ReleaseManifest]) -> None:
+        parsed: list[tuple[Version, ReleaseManifest]] = []
+        for manifest in manifests:
+            version = _parse_release_version(manifest.version)
+            if version is not None:
+                parsed.append((version, manifest))
+        parsed.sort(key=lambda item: item[0])
+        self._versions = [version for version, _ in parsed]
+        self._manifests = [manifest for _, manifest in parsed]
+
+    def __len__(self) -> int:
+        return len(self._manifests)
+
+    def __iter__(self) -> Iterator[tuple[Version, ReleaseManifest]]:
+        return zip(self._versions, self._manifests)
+
+    @staticmethod
+    def _coerce(version: str | Version) -> Version | None:
+        if isinstance(version, str):
+            return _parse_release_version(version.strip())
+        return version
+
+    def latest(self) -> tuple[Version, ReleaseManifest] | None:
+        """Return the release with the highest version."""
+        if not self._manifests:
+            return None
+        return self._versions[-1], self._manifests[-1]
+
+    def find(self, version: str | Version) -> ReleaseManifest | None:
+        """Return the release whose version equals `version`."""
+        target = self._coerce(version)
+        if target is None:
+            return None
+        index = bisect.bisect_right(self._versions, target)
+        if index and self._versions[index - 1] == target:
+            return self._manifests[index - 1]
+        return None
+
+    def before(self, version: str | Version) -> ReleaseManifest | None:
+        """Return the release immediately preceding `version`."""
+        target = self._coerce(version)
+        if target is None:
+            return None
+        index = bisect.bisect_left(self._versions, target)
+        return self._manifests[index - 1] if index else None
+
+    def after(self, version: str | Version) -> ReleaseManifest | None:
+        """Return the release immediately following `version`."""
+        target = self._coerce(version)
+        if target is None:
+            return None
+        index = bisect.bisect_right(self._versions, target)
+        return self._manifests[index] if index < len(self._manifests) else None
+
+    def between(
+        self, start: str | Version | None = None, end: str | Version | None = None
+    ) -> list[ReleaseManifest]:
+        """Return the releases from `start` through `end`, both inclusive.
+
+        Either bound may be None to leave that side open. An invalid bound
+        matches nothing.
+        """
+        low, high = 0, len(self._manifests)
+        if start is not None:
+            parsed_start = self._coerce(start)
+            if parsed_start is None:
+                return []
+            low = bisect.bisect_left(self._versions, parsed_start)
+        if end is not None:
+            parsed_end = self._coerce(end)
+            if parsed_end is None:
+                return []
+            high = bisect.bisect_right(self._versions, parsed_end)
+        return self._manifests[low:high]
+
+
+class ProjectSnapshot:
+    """Release state of a project, scanned from disk at most once.
+
+    Commands consult release manifests from many places: the entry release
+    index, the display sort order, the set of used entry IDs, and semver
+    lookups. A snapshot parses every manifest exactly once and derives each
+    view lazily on first access. Call `invalidate` after writing releases.
+
+    Views are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Discard all cached state so the next access rescans the disk."""
+        self._manifests: list[ReleaseManifest] | None = None
+        self._manifests_by_version: dict[str, ReleaseManifest] | None = None
+        self._release_index: dict[str, list[str]] | None = None
+        self._release_order: dict[str, int] | None = None
+        self._used_entry_ids: frozenset[str] | None = None
+        self._semver_index: SemverIndex | None = None
+        self._released_entries: dict[str, Entry] | None = None
+        self._entry_manifest_map: dict[str, list[ReleaseManifest]] | None = None
+
+    @property
+    def manifests(self) -> list[ReleaseManifest]:
+        """Return all release manifests ordered by their on-disk path."""
+        if self._manifests is None:
+            with span("releases.manifests"):
+                self._manifests = list(iter_release_manifests(self.project_root))
+        return self._manifests
+
+    def find_manifest(self, version: str) -> ReleaseManifest | None:
+        """Return the manifest whose version label matches exactly.
+
+        Before all manifests have been scanned, the release directory named
+        after the version is tried first so that a single lookup only reads
+        one manifest.
+        """
+        if self._manifests is None:
+            manifest = load_release_manifest(self.project_root, version.strip())
+            if manifest is not None:
+                return manifest
+        if self._manifests_by_version is None:
+            lookup: dict[str, ReleaseManifest] = {}
+            for manifest in self.manifests:
+                lookup.setdefault(manifest.version, manifest)
+            self._manifests_by_version = lookup
+        return self._manifests_by_version.get(version.strip())
+
+    @property
+    def release_index(self) -> dict[str, list[str]]:
+        """Return a mapping from entry id to the sorted versions including it."""
+        if self._release_index is None:
+            index: dict[str, list[str]] = {}
+            for manifest in self.manifests:
+                for entry_id in manifest.entries:
+                    versions = index.setdefault(entry_id, [])
+                    if manifest.version not in versions:
+                        versions.append(manifest.version)
+            for versions in index.values():
+                versions.sort()
+            self._release_index = index
+        return self._release_index
+
+    @property
+    def release_order(self) -> dict[str, int]:
+        """Return a mapping from release version to chronological rank."""
+        if self._release_order is None:
+            ordered = sorted(self.manifests, key=lambda m: (m.created, m.version))
+            self._release_order = {manifest.version: rank for rank, manifest in enumerate(ordered)}
+        return self._release_order
+
+    @property
+    def used_entry_ids(self) -> frozenset[str]:
+        """Return entry IDs that already belong to a release."""
+        if self._used_entry_ids is None:
+            self._used_entry_ids = frozenset(
+                entry_id for manifest in self.manifests for entry_id in manifest.entries
+            )
+        return self._used_entry_ids
+
+    @property
+    def semver_index(self) -> SemverIndex:
+        """Return the manifests with valid semantic versions, sorted once."""
+        if self._semver_index is None:
+            self._semver_index = SemverIndex(self.manifests)
+        return self._semver_index
+
+    @property
+    def _entry_manifests(self) -> dict[str, list[ReleaseManifest]]:
+        """Return the manifests listing each entry id, in manifest order."""
+        if self._entry_manifest_map is None:
+            candidates: dict[str, list[ReleaseManifest]] = {}
+            for manifest in self.manifests:
+                for entry_id in manifest.entries:
+                    candidates.setdefault(entry_id, []).append(manifest)
+            self._entry_manifest_map = candidates
+        return self._entry_manifest_map
+
+    def released_entry_ids_with_files(self) -> set[str]:
+        """Return the ids of released entries whose file exists, without reading them.
+
+        This takes one listing of the release entry directories. It tells
+        which ids `load_released_entries` can load before any entry is read.
+        """
+        if self._released_entries is not None:
+            return set(self._released_entries)
+        present = {
+            (path.parent.parent, path.stem)
+            for path in glob_paths(release_directory(self.project_root), "*/entries/*.md")
+        }
+        return {
+            entry_id
+            for entry_id, manifests in self._entry_manifests.items()
+            if any(
+                (_manifest_root(self.project_root, manifest), entry_id) in present
+                for manifest in manifests
+            )
+        }
+
+    def load_released_entries(self, entry_ids: Iterable[str]) -> dict[str, Entry]:
+        """Load the given released entries without reading any others.
+
+        Entries resolve against the first manifest providing their file. Ids
+        that belong to no release or have no entry file are left out.
+        """
+        if self._released_entries is not None:
+            return {
+                entry_id: self._released_entries[entry_id]
+                for entry_id in entry_ids
+                if entry_id in self._released_entries
+            }
+        candidates = self._entry_manifests
+        wanted = [entry_id for entry_id in dict.fromkeys(entry_ids) if entry_id in candidates]
+
+        def load(entry_id: str) -> Entry | None:
+            for manifest in candidates[entry_id]:
+                entry = load_release_entry(self.project_root, manifest, entry_id)
+                if entry is not None:
+                    return entry
+            return None
+
+        loaded = parallel_map(load, wanted)
+        return {
+            entry_id: entry
+            for entry_id, entry in zip(wanted, loaded, strict=True)
+            if entry is not None
+        }
+
+    @property
+    def released_entries(self) -> dict[str, Entry]:
+        """Return a mapping of entry ids to entries across all releases."""
+        if self._released_entries is None:
+            with span("releases.entries"):
+                self._released_entries = self.load_released_entries(self._entry_manifests)
+        return self._released_entries
@@ -0,0 +1,230 @@
+"""Access to changelog files in the working tree or at a git ref."""
+
+from __future__ import annotations
+
+import atexit
+import fnmatch
+import glob
+import io
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import IO, Iterable, Optional
+
+from click import ClickException
+
+from .utils import git_output
+
+
+class GitTree:
+    """Directory listing of a repository reconstructed from git's file list."""
+
+    def __init__(self, root: Path, paths: Iterable[str]) -> None:
+        self.root = root
+        self._children: dict[str, set[str]] = {}
+        for path in paths:
+            parent, _, name = path.rpartition("/")
+            while True:
+                children = self._children.setdefault(parent, set())
+                if name in children:
+                    # The ancestors were registered along with the sibling.
+                    break
+                children.add(name)
+                if not parent:
+                    break
+                parent, _, name = parent.rpartition("/")
+
+    def relative(self, path: Path) -> Optional[str]:
+        """Return `path` relative to the repository root, or None if outside."""
+        for candidate in (Path(os.path.abspath(path)), path.resolve()):
+            try:
+                relative = candidate.relative_to(self.root)
+            except ValueError:
+                continue
+            return "" if relative == Path(".") else relative.as_posix()
+        return None
+
+    def is_dir(self, relative: str) -> bool:
+        return relative in self._children
+
+    def glob(self, directory: str, pattern: str) -> list[str]:
+        """Return paths below `directory` matching `pattern`, segment by segment."""
+        current = [directory]
+        for part in pattern.split("/"):
+            matches: list[str] = []
+            for parent in current:
+                children = self._children.get(parent)
+                if not children:
+                    continue
+                if glob.has_magic(part):
+                    names = fnmatch.filter(children, part)
+                else:
+                    names = [part] if part in children else []
+                matches.extend(f"{parent}/{name}" if parent else name for name in names)
+            current = matches
+        return current
+
+
+class GitRefStorage:
+    """Read-only view of a repository at a fixed commit.
+
+    The tree is listed once with `git ls-tree`; file contents are streamed
+    from a single long-lived `git cat-file --batch` process.
+    """
+
+    def __init__(self, start: Path, ref: str) -> None:
+        try:
+            toplevel = git_output(
+                start, ["rev-parse", "--show-toplevel"], "not a git repository"
+            ).strip()
+            self.root = Path(toplevel)
+            self.commit = git_output(
+                self.root,
+                ["rev-parse", "--verify", "--end-of-options", f"{ref}^{{commit}}"],
+                f"unknown git ref '{ref}'",
+            ).strip()
+            listing = git_output(
+                self.root,
+                ["ls-tree", "-r", "-z", "--full-tree", self.commit],
+                f"failed to list files at '{ref}'",
+            )
+        except RuntimeError as exc:
+            raise ClickException(f"Cannot read --ref {ref}: {exc}") from exc
+        self.ref = ref
+        self._blobs: dict[str, str] = {}
+        for record in listing.split("\0"):
+            if not record:
+                continue
+            info, _, path = record.partition("\t")
+            _, kind, object_id = info.split(" ")
+            if kind == "blob":
+                self._blobs[path] = object_id
+        self.tree = GitTree(self.root, self._blobs)
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._owner = os.getpid()
+        self._lock = threading.Lock()
+
+    def is_file(self, path: Path) -> bool:
+        relative = self.tree.relative(path)
+        return relative is not None and relative in self._blobs
+
+    def is_dir(self, path: Path) -> bool:
+        relative = self.tree.relative(path)
+        return relative is not None and self.tree.is_dir(relative)
+
+    def glob(self, directory: Path, pattern: str) -> list[Path]:
+        if "**" in pattern:
+            raise ClickException(f"Recursive pattern '{pattern}' is not supported with --ref.")
+        prefix = self.tree.relative(directory)
+        if prefix is None or not self.tree.is_dir(prefix):
+            return []
+        offset = len(prefix) + 1 if prefix else 0
+        return sorted(directory / match[offset:] for match in self.tree.glob(prefix, pattern))
+
+    def read_bytes(self, path: Path) -> bytes:
+        relative = self.tree.relative(path)
+        object_id = self._blobs.get(relative) if relative is not None else None
+        if object_id is None:
+            raise FileNotFoundError(f"{path} does not exist at {self.ref}")
+        with self._lock:
+            process = self._batch_process()
+            assert process.stdin is not None and process.stdout is not None
+            process.stdin.write(f"{object_id}\n".encode("ascii"))
+            process.stdin.flush()
+            header = process.stdout.readline().split()
+            if len(header) != 3:
+                raise OSError(f"git cat-file failed to read {path} at {self.ref}")
+            content = process.stdout.read(int(header[2]))
+            process.stdout.read(1)  # trailing newline
+        return content
+
+    def _batch_process(self) -> subprocess.Popen[bytes]:
+        if self._owner != os.getpid():
+            # Forked workers must not share the parent's pipes.
+            self._process = None
+            self._owner = os.getpid()
+        if self._process is None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=str(self.root),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._process
+
+    def close(self) -> None:
+        """Stop the `git cat-file` process."""
+        process, self._process = self._process, None
+        if process is None or self._owner != os.getpid():
+            return
+        assert process.stdin is not None
+        process.stdin.close()
+        process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+
+
+_storage: Optional[GitRefStorage] = None
+
+
+def configure_storage(ref: Optional[str] = None, *, start: Path = Path(".")) -> None:
+    """Read changelog files from the working tree, or from `ref` if given.
+
+    `start` is any directory inside the repository that holds the changelog.
+    """
+    global _storage
+    if _storage is not None:
+        _storage.close()
+    _storage = GitRefStorage(start, ref) if ref is not None else None
+
+
+def active_storage() -> Optional[GitRefStorage]:
+    """Return the git ref backend, or None when reading the working tree."""
+    return _storage
+
+
+def path_exists(path: Path) -> bool:
+    """Return True if `path` exists in the active storage."""
+    if _storage is None:
+        return path.exists()
+    return _storage.is_file(path) or _storage.is_dir(path)
+
+
+def is_file(path: Path) -> bool:
+    """Return True if `path` is a file in the active storage."""
+    if _storage is None:
+        return path.is_file()
+    return _storage.is_file(path)
+
+
+def is_dir(path: Path) -> bool:
+    """Return True if `path` is a directory in the active storage."""
+    if _storage is None:
+        return path.is_dir()
+    return _storage.is_dir(path)
+
+
+def read_bytes(path: Path) -> bytes:
+    """Return the contents of a file in the active storage."""
+    if _storage is None:
+        return path.read_bytes()
+    return _storage.read_bytes(path)
+
+
+def read_text(path: Path) -> str:
+    """Read a UTF-8 file with the universal newline handling of Path.read_text."""
+    if _storage is None:
+        return path.read_text(encoding="utf-8")
+    text = _storage.read_bytes(path).decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def open_binary(path: Path) -> IO[bytes]:
+    """Open a file in the active storage for binary reading."""
+    if _storage is None:
+        return path.open("rb")
+    return io.BytesIO(_storage.read_bytes(path))
+
+
+atexit.register(configure_storage)
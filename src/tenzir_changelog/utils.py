@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -11,13 +12,15 @@ import sys
 from datetime import date, datetime, timezone
 from pathlib import Path
 from collections.abc import Iterable as IterableABC
-from typing import Iterable, Mapping, Optional, cast, NoReturn
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, cast, NoReturn
 
-import mdformat
 import click
-from rich.console import Console, RenderableType
-from rich.style import Style
-from rich.theme import Theme
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+from .cache import cache_enabled, markdown_cache_for
+from .profiling import profiled, span
 
 CHECKMARK = "\033[92;1m✔\033[0m"
 CROSS = "\033[31m✘\033[0m"
@@ -36,15 +39,39 @@ RESET = "\033[0m"
 _LOGGER_NAME = "tenzir_changelog"
 _LOGGER = logging.getLogger(_LOGGER_NAME)
 
-console = Console(
-    stderr=True,
-    theme=Theme(
-        {
-            "markdown.code": Style(bold=True, color="cyan"),
-            "markdown.code_block": Style(color="cyan"),
-        }
-    ),
-)
+
+def _create_console() -> Console:
+    from rich.console import Console
+    from rich.style import Style
+    from rich.theme import Theme
+
+    return Console(
+        stderr=True,
+        theme=Theme(
+            {
+                "markdown.code": Style(bold=True, color="cyan"),
+                "markdown.code_block": Style(color="cyan"),
+            }
+        ),
+    )
+
+
+class _LazyConsole:
+    """Stand-in that creates the shared Rich console on first use.
+
+    Importing Rich is a noticeable share of startup time, and commands that
+    only print plain output never need it.
+    """
+
+    _console: Optional[Console] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if _LazyConsole._console is None:
+            _LazyConsole._console = _create_console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = cast("Console", _LazyConsole())
 
 
 def configure_logging(debug: bool = False) -> logging.Logger:
@@ -109,6 +136,7 @@ def format_bold(text: str) -> str:
     return f"{BOLD}{text}{RESET}"
 
 
+@profiled("render")
 def render_to_text(renderable: RenderableType) -> str:
     """Return the string representation of a Rich renderable."""
     with console.capture() as capture:
@@ -395,12 +423,63 @@ def extract_excerpt(text: str) -> str:
     return collapsed.strip()
 
 
+_MDFORMAT_OPTIONS = {"wrap": "no"}
+
+# Distinct documents normalized per process before the oldest are forgotten.
+_MARKDOWN_MEMO_SIZE = 4096
+# Anything that could be a link reference definition, such as `[docs]: https://...`.
+_LINK_DEFINITION_PATTERN = re.compile(r"\[[^\]\n]+\]:")
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_formatter_signature() -> str:
+    """Identify the formatter configuration that produces normalized Markdown."""
+    from importlib.metadata import version
+
+    return (
+        f"mdformat={version('mdformat')};markdown-it-py={version('markdown-it-py')};"
+        f"options={sorted(_MDFORMAT_OPTIONS.items())}"
+    )
+
+
+@functools.lru_cache(maxsize=_MARKDOWN_MEMO_SIZE)
+def _normalize_markdown_text(text: str) -> str:
+    cache = markdown_cache_for(_markdown_formatter_signature()) if cache_enabled() else None
+    digest = ""
+    if cache is not None:
+        digest = cache.digest(text)
+        cached = cache.lookup(digest)
+        if cached is not None:
+            return cached
+    import mdformat
+
+    with span("markdown.mdformat"):
+        formatted = mdformat.text(text, options=_MDFORMAT_OPTIONS).rstrip("\n")
+    if cache is not None:
+        cache.store(digest, formatted)
+    return formatted
+
+
+@profiled("markdown.normalize")
 def normalize_markdown(text: str) -> str:
-    """Return Markdown with paragraphs normalized to single lines."""
+    """Return Markdown with paragraphs normalized to single lines.
+
+    Results are memoized in-process and, unless caching is disabled, stored
+    in a persistent cache keyed by the input text and formatter version.
+    """
     if not text.strip():
         return ""
-    formatted = mdformat.text(text, options={"wrap": "no"})
-    return formatted.rstrip("\n")
+    return _normalize_markdown_text(text)
+
+
+def defines_link_references(text: str) -> bool:
+    """Return whether Markdown text may contain link reference definitions.
+
+    mdformat resolves references and moves their definitions to the end of
+    the document, so text that defines them has to be formatted as a whole
+    rather than in pieces. The check errs on the side of reporting a match.
+    """
+    return _LINK_DEFINITION_PATTERN.search(text) is not None
 
 
 def create_annotated_git_tag(project_root: Path, tag_name: str, message: str) -> bool:
@@ -454,6 +533,107 @@ def has_staged_changes(project_root: Path) -> bool:
     return result.returncode != 0
 
 
+def git_output(project_root: Path, arguments: list[str], failure: str) -> str:
+    """Run git in `project_root` and return its output, raising RuntimeError on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *arguments],
+            cwd=str(project_root),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError as exc:
+        raise RuntimeError("git is required but was not found in PATH.") from exc
+    except subprocess.CalledProcessError as exc:
+        detail = exc.stderr.strip().splitlines()
+        suffix = f": {detail[-1]}" if detail else "."
+        raise RuntimeError(f"{failure}{suffix}") from exc
+    return result.stdout
+
+
+def git_changed_files(project_root: Path, ref: str) -> set[Path]:
+    """Return files that differ from `ref` in the working tree, plus untracked files.
+
+    Paths are absolute and resolved. Deleted files are included as well.
+    """
+    toplevel = git_output(
+        project_root,
+        ["rev-parse", "--show-toplevel"],
+        "failed to locate the git repository",
+    ).strip()
+    root = Path(toplevel)
+    changed = git_output(
+        root,
+        ["diff", "--name-only", "--no-renames", "-z", ref, "--"],
+        f"git could not compare against '{ref}'",
+    )
+    untracked = git_output(
+        root,
+        ["ls-files", "--others", "--exclude-standard", "-z"],
+        "failed to list untracked files",
+    )
+    names = changed.split("\0") + untracked.split("\0")
+    return {root / name for name in names if name}
+
+
+def git_first_added(project_root: Path, paths: Iterable[Path]) -> dict[Path, datetime]:
+    """Return the author date of the commit that first added each file.
+
+    A single `git log` pass over `project_root` covers all paths. Renames are
+    followed, so entries moved into a release keep the date they were first
+    added as unreleased entries. Paths without history are omitted.
+    """
+    toplevel = Path(
+        git_output(
+            project_root,
+            ["rev-parse", "--show-toplevel"],
+            "failed to locate the git repository",
+        ).strip()
+    )
+    tracked: dict[str, Path] = {}
+    for path in paths:
+        try:
+            tracked[path.resolve().relative_to(toplevel).as_posix()] = path
+        except ValueError:
+            continue
+    if not tracked:
+        return {}
+    output = git_output(
+        toplevel,
+        [
+            "log",
+            "--format=%aI",
+            "-z",
+            "--name-status",
+            "--diff-filter=AR",
+            "-M",
+            "--",
+            str(project_root.resolve()),
+        ],
+        "failed to read the git history",
+    )
+    # Commits arrive newest first, so the last addition seen is the oldest.
+    first_added: dict[Path, datetime] = {}
+    committed: datetime | None = None
+    tokens = iter(output.split("\0"))
+    for token in tokens:
+        field = token.strip("\n")
+        if not field:
+            continue
+        if field[0].isdigit():
+            committed = datetime.fromisoformat(field).astimezone(timezone.utc)
+        elif field[0] == "R":
+            source, destination = next(tokens, ""), next(tokens, "")
+            if destination in tracked:
+                tracked[source] = tracked.pop(destination)
+        elif field == "A":
+            target = tracked.get(next(tokens, ""))
+            if target is not None and committed is not None:
+                first_added[target] = committed
+    return first_added
+
+
 def create_git_commit(project_root: Path, message: str) -> None:
     """Create a git commit with the given message."""
     try:
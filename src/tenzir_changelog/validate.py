@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, AbstractSet, Iterable, Mapping, Optional, Sequence
 
-from .config import Config
-from .entries import ENTRY_TYPES, Entry, iter_entries
+from .cache import cache_enabled, project_cache_path
+from .config import Config, default_config_path, package_metadata_path
+from .discovery import glob_paths
+from .entries import ENTRY_TYPES, Entry, entry_paths, load_entry_files
+from .parallel import parallel_map, process_map
+from .profiling import profiled, span
+from .storage import is_file, path_exists, read_bytes
 from .releases import (
     ReleaseManifest,
     iter_release_manifests,
     load_release_entry,
+    release_directory,
     resolve_release_entry_path,
 )
 
 if TYPE_CHECKING:
     from .modules import Module
 
+# Bump whenever validation rules change so recorded clean runs are discarded.
+_STATE_FORMAT = 1
+
 
 @dataclass
 class ValidationIssue:
@@ -65,7 +77,17 @@ def validate_release_ids(
     issues: list[ValidationIssue],
 ) -> None:
     """Ensure release manifests reference existing entry IDs."""
-    entry_ids = {entry.entry_id for entry in entries}
+    _validate_release_references(
+        {entry.entry_id for entry in entries}, releases, project_root, issues
+    )
+
+
+def _validate_release_references(
+    entry_ids: AbstractSet[str],
+    releases: Iterable[ReleaseManifest],
+    project_root: Path,
+    issues: list[ValidationIssue],
+) -> None:
     for manifest in releases:
         for entry_id in manifest.entries:
             if entry_id in entry_ids:
@@ -80,29 +102,122 @@ def validate_release_ids(
                 )
 
 
-def run_validation(project_root: Path, config: Config) -> list[ValidationIssue]:
-    """Validate entries and releases, returning a list of issues."""
+def project_config_path(project_root: Path) -> Path:
+    """Return the file a project's configuration is loaded from."""
+    config_path = default_config_path(project_root)
+    if path_exists(config_path):
+        return config_path
+    return package_metadata_path(project_root)
+
+
+def validation_inputs(project_root: Path) -> list[Path]:
+    """Return the resolved paths of all files that validation reads."""
+    root = project_root.resolve()
+    paths = [project_config_path(root)]
+    paths.extend(entry_paths(root))
+    releases = release_directory(root)
+    paths.extend(glob_paths(releases, "*/manifest.yaml"))
+    paths.extend(glob_paths(releases, "*/entries/*.md"))
+    return [path for path in paths if is_file(path)]
+
+
+def hash_files(paths: Sequence[Path]) -> dict[str, str]:
+    """Return the content hash of each file keyed by its path."""
+
+    def digest(path: Path) -> str:
+        return hashlib.sha256(read_bytes(path)).hexdigest()
+
+    return dict(zip((str(path) for path in paths), parallel_map(digest, paths)))
+
+
+class ValidationState:
+    """Content hashes of the files covered by the last clean validation run.
+
+    `validate --changed` compares these against the current files to decide
+    which entries need re-checking. The state lives in the cache directory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> Optional["ValidationState"]:
+        """Return the state of a project, or None when caching is disabled."""
+        if not cache_enabled():
+            return None
+        return cls(project_cache_path(project_root.resolve(), "validate", ".json"))
+
+    def load(self) -> dict[str, str]:
+        """Return the recorded hashes, or an empty mapping if there are none."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != _STATE_FORMAT:
+            return {}
+        hashes = data.get("hashes")
+        return dict(hashes) if isinstance(hashes, dict) else {}
+
+    def save(self, hashes: Mapping[str, str]) -> None:
+        """Record the hashes of a clean run."""
+        payload = json.dumps({"format": _STATE_FORMAT, "hashes": dict(hashes)})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temporary.write_text(payload, encoding="utf-8")
+            os.replace(temporary, self.path)
+        except OSError:
+            return
+
+
+@profiled("validate")
+def run_validation(
+    project_root: Path,
+    config: Config,
+    *,
+    only: Optional[AbstractSet[Path]] = None,
+) -> list[ValidationIssue]:
+    """Validate entries and releases, returning a list of issues.
+
+    When `only` is given, per-entry checks are limited to entry files whose
+    resolved path it contains, unless it also contains the project's config
+    file. Cross-file checks such as `validate_release_ids` always cover the
+    whole project.
+    """
+    root = project_root.resolve()
+    if only is not None and project_config_path(root) in only:
+        only = None
+
+    def selected(path: Path) -> bool:
+        return only is None or root / path.relative_to(project_root) in only
+
     issues: list[ValidationIssue] = []
     releases = list(iter_release_manifests(project_root))
-    entries = list(iter_entries(project_root))
+    unreleased_paths = entry_paths(project_root)
+    entry_ids = {path.stem for path in unreleased_paths}
+    entries = load_entry_files(project_root, [path for path in unreleased_paths if selected(path)])
     release_entries: list[Entry] = []
     for manifest in releases:
         for entry_id in manifest.entries:
+            entry_path = resolve_release_entry_path(project_root, manifest, entry_id)
+            if entry_path is None:
+                continue
+            entry_ids.add(entry_id)
+            if not selected(entry_path):
+                continue
             try:
                 entry = load_release_entry(project_root, manifest, entry_id)
             except ValueError as exc:
-                entry_path = resolve_release_entry_path(project_root, manifest, entry_id)
-                issues.append(ValidationIssue(entry_path or manifest.path or Path(""), str(exc)))
+                issues.append(ValidationIssue(entry_path, str(exc)))
                 continue
             if entry is None:
                 continue
             release_entries.append(entry)
 
-    all_entries = entries + release_entries
-    for entry in all_entries:
+    for entry in entries + release_entries:
         issues.extend(validate_entry(entry, config))
 
-    validate_release_ids(all_entries, releases, project_root, issues)
+    _validate_release_references(entry_ids, releases, project_root, issues)
     return issues
 
 
@@ -146,27 +261,42 @@ def validate_modules(
     return issues
 
 
+def _validate_project(
+    task: tuple[Path, Config, Optional[AbstractSet[Path]]],
+) -> list[ValidationIssue]:
+    project_root, config, only = task
+    return run_validation(project_root, config, only=only)
+
+
 def run_validation_with_modules(
     project_root: Path,
     config: Config,
     modules: list["Module"],
+    *,
+    only: Optional[AbstractSet[Path]] = None,
 ) -> list[ValidationIssue]:
     """Validate parent and all modules, returning combined issues.
 
-    Issues from modules are prefixed with the module ID for clarity.
+    Issues from modules are prefixed with the module ID for clarity. The
+    `only` filter is forwarded to `run_validation` for every project. Projects
+    are validated in worker processes when more than one job is configured;
+    issues are still reported in project order.
     """
     issues: list[ValidationIssue] = []
 
     # Validate module configuration itself
     issues.extend(validate_modules(project_root, config, modules))
 
+    tasks = [(project_root, config, only)]
+    tasks.extend((module.root, module.config, only) for module in modules)
+    with span("validate.projects"):
+        parent_issues, *module_results = process_map(_validate_project, tasks)
+
     # Validate parent project
-    parent_issues = run_validation(project_root, config)
     issues.extend(parent_issues)
 
     # Validate each module
-    for module in modules:
-        module_issues = run_validation(module.root, module.config)
+    for module, module_issues in zip(modules, module_results):
         # Prefix issues with module ID for clarity
         for issue in module_issues:
             prefixed_issue = ValidationIssue(
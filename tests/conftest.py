@@ -0,0 +1,87 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from tenzir_changelog.cache import CACHE_DIR_ENV, configure_cache
+from tenzir_changelog.discovery import DISCOVERY_ENV, configure_discovery
+from tenzir_changelog.parallel import JOBS_ENV, configure_jobs
+from tenzir_changelog.storage import configure_storage
+
+
+def write_file(path: Path, content: str) -> Path:
+    """Write `content` to `path`, creating missing parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def write_entry_file(directory: Path, entry_id: str, *, body: str = "Body.") -> Path:
+    """Write a minimal feature entry named `entry_id` into `directory`."""
+    return write_file(
+        directory / f"{entry_id}.md",
+        f"---\ntitle: {entry_id.title()}\ntype: feature\n---\n\n{body}\n",
+    )
+
+
+def git(repo: Path, *arguments: str) -> None:
+    """Run git in `repo` with a fixed identity and commit signing disabled."""
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.email=codex@example.com",
+            "-c",
+            "user.name=Codex",
+            "-c",
+            "commit.gpgsign=false",
+            *arguments,
+        ],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repository(tmp_path: Path) -> Path:
+    """An empty git repository in the test's temporary directory."""
+    git(tmp_path, "init", "-q")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Keep persistent caches out of the user's home directory."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    configure_cache()
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def sequential_loading(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with the default sequential loader."""
+    monkeypatch.delenv(JOBS_ENV, raising=False)
+    configure_jobs()
+
+
+@pytest.fixture(autouse=True)
+def filesystem_discovery(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with filesystem globbing."""
+    monkeypatch.delenv(DISCOVERY_ENV, raising=False)
+    configure_discovery()
+
+
+@pytest.fixture(autouse=True)
+def working_tree_storage() -> Iterator[None]:
+    """Stop any git ref backend a test activated."""
+    yield
+    configure_storage()
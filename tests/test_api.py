@@ -58,6 +58,10 @@ def test_python_api_show_delegates(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
         include_emoji: bool,
         include_modules: bool = True,
         explicit_links: bool = False,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> None:
         captured["ctx"] = ctx
         captured["identifiers"] = identifiers
@@ -69,6 +73,9 @@ def test_python_api_show_delegates(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
         captured["include_emoji"] = include_emoji
         captured["include_modules"] = include_modules
         captured["explicit_links"] = explicit_links
+        captured["since"] = since
+        captured["until"] = until
+        captured["limit"] = limit
 
     monkeypatch.setattr("tenzir_changelog.api.run_show_entries", fake_run_show_entries)
 
@@ -79,6 +86,8 @@ def test_python_api_show_delegates(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
         component_filter=["core"],
         banner=True,
         include_emoji=False,
+        since="v1.0.0",
+        limit=5,
     )
 
     assert captured["ctx"] is client.context
@@ -89,6 +98,9 @@ def test_python_api_show_delegates(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
     assert captured["banner"] is True
     assert captured["compact"] is None
     assert captured["include_emoji"] is False
+    assert captured["since"] == "v1.0.0"
+    assert captured["until"] is None
+    assert captured["limit"] == 5
 
 
 def test_python_api_add_handles_missing_authors(
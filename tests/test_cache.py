@@ -0,0 +1,203 @@
+"""Tests for the persistent entry and Markdown caches."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from tenzir_changelog import entries as entries_module
+from tenzir_changelog import utils
+from tenzir_changelog.cache import (
+    EntryCache,
+    FileFingerprint,
+    MarkdownCache,
+    configure_cache,
+    entry_cache_for,
+    flush_caches,
+    markdown_cache_for,
+)
+from tenzir_changelog.cli import cli
+from tenzir_changelog.config import Config, save_config
+from tenzir_changelog.entries import iter_entries
+from tenzir_changelog.parallel import configure_jobs, process_map
+from tenzir_changelog.releases import collect_release_entries
+from tenzir_changelog.utils import normalize_markdown
+
+
+def _write_entry(path: Path, title: str, *, age_seconds: int = 3600) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\ntitle: {title}\ntype: feature\ncreated: 2025-01-01T00:00:00Z\n---\n\nBody.\n",
+        encoding="utf-8",
+    )
+    # Age the file so it falls outside the racy-timestamp window.
+    timestamp = path.stat().st_mtime - age_seconds
+    os.utime(path, (timestamp, timestamp))
+
+
+def _forbid_yaml(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("entry was parsed despite a valid cache record")
+
+    monkeypatch.setattr(entries_module, "load_frontmatter", fail)
+
+
+def test_cache_hit_skips_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write_entry(tmp_path / "unreleased" / "cached.md", "Cached")
+    assert [entry.title for entry in iter_entries(tmp_path)] == ["Cached"]
+    flush_caches()
+
+    # A fresh process state only sees the on-disk cache.
+    configure_cache()
+    _forbid_yaml(monkeypatch)
+    loaded = list(iter_entries(tmp_path))
+    assert [entry.title for entry in loaded] == ["Cached"]
+    assert loaded[0].created_at is not None
+
+
+def test_cache_invalidates_edited_files(tmp_path: Path) -> None:
+    entry_path = tmp_path / "unreleased" / "edited.md"
+    _write_entry(entry_path, "Before", age_seconds=7200)
+    assert [entry.title for entry in iter_entries(tmp_path)] == ["Before"]
+
+    _write_entry(entry_path, "After!", age_seconds=3600)
+    assert [entry.title for entry in iter_entries(tmp_path)] == ["After!"]
+
+
+def test_cache_does_not_store_racy_files(tmp_path: Path) -> None:
+    _write_entry(tmp_path / "unreleased" / "fresh.md", "Fresh", age_seconds=0)
+    list(iter_entries(tmp_path))
+    cache = entry_cache_for(tmp_path)
+    assert cache is not None
+    cache.flush()
+    assert not cache.path.exists()
+
+
+def test_cache_returns_independent_metadata(tmp_path: Path) -> None:
+    _write_entry(tmp_path / "unreleased" / "shared.md", "Shared")
+    first = next(iter(iter_entries(tmp_path)))
+    with pytest.raises(TypeError):
+        first.metadata["title"] = "Mutated"  # type: ignore[index]
+    second = next(iter(iter_entries(tmp_path)))
+    assert second.title == "Shared"
+
+
+def test_no_cache_flag_bypasses_cache(tmp_path: Path, isolated_cache: Path) -> None:
+    project = tmp_path / "project"
+    save_config(Config(id="project", name="Project"), project / "config.yaml")
+    _write_entry(project / "unreleased" / "entry.md", "Entry")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--root", str(project), "--no-cache", "show", "--json"])
+    assert result.exit_code == 0, result.output
+    assert not (isolated_cache / "entries").exists()
+
+    result = runner.invoke(cli, ["--root", str(project), "show", "--json"])
+    assert result.exit_code == 0, result.output
+    assert list((isolated_cache / "entries").glob("*.pickle"))
+
+
+def test_cached_entries_follow_moves_into_releases(tmp_path: Path) -> None:
+    source = tmp_path / "unreleased" / "moved.md"
+    _write_entry(source, "Moved")
+    list(iter_entries(tmp_path))
+
+    destination = tmp_path / "releases" / "v1.0.0" / "entries" / "moved.md"
+    destination.parent.mkdir(parents=True)
+    source.rename(destination)
+    assert list(iter_entries(tmp_path)) == []
+
+    (tmp_path / "releases" / "v1.0.0" / "manifest.yaml").write_text(
+        yaml.safe_dump({"created": "2025-01-02"}), encoding="utf-8"
+    )
+    released = collect_release_entries(tmp_path)
+    assert released["moved"].path == destination
+    assert released["moved"].title == "Moved"
+
+
+def test_concurrent_entry_caches_keep_each_others_records(tmp_path: Path) -> None:
+    first_path = tmp_path / "unreleased" / "first.md"
+    second_path = tmp_path / "unreleased" / "second.md"
+    _write_entry(first_path, "First")
+    _write_entry(second_path, "Second")
+    cache_path = tmp_path / "entries.pickle"
+    # Two invocations load the same (empty) cache and each parse one entry.
+    first, second = EntryCache(cache_path), EntryCache(cache_path)
+    first.store(first_path, FileFingerprint.of(first_path), {"title": "First"}, 0)
+    second.store(second_path, FileFingerprint.of(second_path), {"title": "Second"}, 0)
+    first.flush()
+    second.flush()
+
+    reloaded = EntryCache(cache_path)
+    assert reloaded.lookup(first_path, FileFingerprint.of(first_path)) == ({"title": "First"}, 0)
+    assert reloaded.lookup(second_path, FileFingerprint.of(second_path)) == (
+        {"title": "Second"},
+        0,
+    )
+
+
+def test_markdown_cache_survives_restarts(
+    isolated_cache: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mdformat
+
+    text = "Some *Markdown*\nwrapped across lines."
+    assert normalize_markdown(text) == "Some *Markdown* wrapped across lines."
+    flush_caches()
+    assert list((isolated_cache / "markdown").glob("*.pickle"))
+
+    # Simulate a new process: drop the in-process memo and reload from disk.
+    utils._normalize_markdown_text.cache_clear()
+    configure_cache()
+
+    def fail(*args: object, **kwargs: object) -> str:
+        raise AssertionError("mdformat ran despite a cached result")
+
+    monkeypatch.setattr(mdformat, "text", fail)
+    assert normalize_markdown(text) == "Some *Markdown* wrapped across lines."
+    utils._normalize_markdown_text.cache_clear()
+    configure_cache(enabled=False)
+    with pytest.raises(AssertionError, match="mdformat ran"):
+        normalize_markdown(text)
+
+
+def test_markdown_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    path = tmp_path / "markdown.pickle"
+    cache = MarkdownCache(path, max_bytes=300)
+    old, used, new = (MarkdownCache.digest(text) for text in ("old", "used", "new"))
+    cache.store(old, "o" * 60)
+    cache.store(used, "u" * 60)
+    cache.flush()
+
+    later = MarkdownCache(path, max_bytes=300)
+    later._session_start = time.time() + 60
+    assert later.lookup(used) == "u" * 60
+    later.store(new, "n" * 60)
+    later.flush()
+
+    reloaded = MarkdownCache(path, max_bytes=300)
+    assert reloaded.lookup(old) is None
+    assert reloaded.lookup(used) == "u" * 60
+    assert reloaded.lookup(new) == "n" * 60
+
+
+def test_worker_changes_are_flushed_once_by_the_parent(isolated_cache: Path) -> None:
+    texts = [f"Release *{index}*\nnotes." for index in range(4)]
+    configure_jobs(2)
+    assert process_map(normalize_markdown, texts) == [
+        f"Release *{index}* notes." for index in range(4)
+    ]
+    # Workers hand their results to the parent instead of writing the cache.
+    assert not list((isolated_cache / "markdown").glob("*.pickle"))
+    flush_caches()
+
+    configure_cache()
+    cache = markdown_cache_for(utils._markdown_formatter_signature())
+    assert cache is not None
+    for index, text in enumerate(texts):
+        assert cache.lookup(MarkdownCache.digest(text)) == f"Release *{index}* notes."
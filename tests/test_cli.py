@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 import subprocess
+import time
 from datetime import date, datetime
 from pathlib import Path
+from typing import Iterable
 
 import click
 import pytest
@@ -258,7 +261,7 @@ def test_add_initializes_and_release(tmp_path: Path) -> None:
 
     release_list = runner.invoke(
         cli,
-        ["--root", str(project_dir), "show", "v1.0.0"],
+        ["--root", str(project_dir), "show", "--table", "v1.0.0"],
     )
     assert release_list.exit_code == 0, release_list.output
     release_plain = click.utils.strip_ansi(release_list.output)
@@ -812,7 +815,7 @@ def test_show_orders_rows_oldest_to_newest(tmp_path: Path) -> None:
         default_project="project",
     )
 
-    result = runner.invoke(cli, ["--root", str(project_dir), "show"])
+    result = runner.invoke(cli, ["--root", str(project_dir), "show", "--table"])
     assert result.exit_code == 0, result.output
 
     plain_output = click.utils.strip_ansi(result.output)
@@ -1284,6 +1287,149 @@ def test_release_create_appends_entries(tmp_path: Path) -> None:
     assert "Gamma Change" in notes_text
 
 
+def test_release_create_keeps_existing_notes_style(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    write_entry(
+        project_dir,
+        {"title": "Alpha Feature", "type": "feature", "authors": ["codex"]},
+        "Ships the alpha feature.",
+        default_project="project",
+    )
+    arguments = ["--root", str(project_dir), "release", "create", "v0.3.0", "--yes"]
+    initial = runner.invoke(cli, [*arguments, "--compact", "--intro", "Intro with\n### heading"])
+    assert initial.exit_code == 0, initial.output
+    notes_path = project_dir / "releases" / "v0.3.0" / "notes.md"
+    assert "- Ships the alpha feature. (by @codex)" in notes_path.read_text(encoding="utf-8")
+
+    write_entry(
+        project_dir,
+        {"title": "Beta Fix", "type": "bugfix", "authors": ["codex"]},
+        "Fixes the beta bug.",
+        default_project="project",
+    )
+
+    def fail(*args: object, **kwargs: object) -> str:
+        raise AssertionError("the detailed notes variant should not be rendered")
+
+    monkeypatch.setattr("tenzir_changelog.cli._render_release_notes", fail)
+    appended = runner.invoke(cli, arguments)
+    assert appended.exit_code == 0, appended.output
+    notes_text = notes_path.read_text(encoding="utf-8")
+    assert "- Fixes the beta bug. (by @codex)" in notes_text
+    assert "### Beta Fix" not in notes_text
+
+
+def test_release_create_formats_only_changed_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mdformat
+
+    from tenzir_changelog import utils
+    from tenzir_changelog.cache import configure_cache
+
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    for title in ("Alpha Feature", "Beta Feature"):
+        write_entry(
+            project_dir,
+            {"title": title, "type": "feature", "authors": ["codex"]},
+            f"Ships {title.lower()}.",
+            default_project="project",
+        )
+    arguments = ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"]
+    initial = runner.invoke(cli, [*arguments, "--intro", "Welcome."])
+    assert initial.exit_code == 0, initial.output
+
+    write_entry(
+        project_dir,
+        {"title": "Gamma Fix", "type": "bugfix", "authors": ["codex"]},
+        "Fixes gamma.",
+        default_project="project",
+    )
+    # Start from the persistent cache only, as a new process would.
+    configure_cache()
+    utils._normalize_markdown_text.cache_clear()
+    formatted: list[str] = []
+    original = mdformat.text
+
+    def record(text: str, **kwargs: object) -> str:
+        formatted.append(text)
+        return original(text, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(mdformat, "text", record)
+    appended = runner.invoke(cli, arguments)
+    assert appended.exit_code == 0, appended.output
+    assert formatted == ["### Gamma Fix\n\nFixes gamma.\n\n*By @codex.*"]
+    notes = (project_dir / "releases" / "v1.0.0" / "notes.md").read_text(encoding="utf-8")
+    assert notes.startswith("Welcome.\n\n## 🚀 Features\n\n### Alpha Feature")
+    assert "## 🐞 Bug fixes\n\n### Gamma Fix\n\nFixes gamma.\n\n*By @codex.*" in notes
+
+
+def test_release_notes_keep_link_definitions_at_end(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    write_entry(
+        project_dir,
+        {"title": "Alpha docs", "type": "feature", "authors": ["codex"], "prs": [12]},
+        "See the [docs] and the [guide][g] for\ndetails.\n\n"
+        "[docs]: https://example.com/docs\n"
+        '[g]: https://example.com/guide "Guide"',
+        default_project="project",
+    )
+    write_entry(
+        project_dir,
+        {"title": "Beta fix", "type": "bugfix", "authors": ["octocat"]},
+        "Also covered by the [docs].\n\n- one\n- two",
+        default_project="project",
+    )
+    arguments = ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"]
+    result = runner.invoke(cli, [*arguments, "--intro", "Read the [guide][g] first."])
+    assert result.exit_code == 0, result.output
+
+    # Definitions resolve across entries and collect at the end of the
+    # document, as they did when notes were formatted in a single pass.
+    notes_path = project_dir / "releases" / "v1.0.0" / "notes.md"
+    assert notes_path.read_text(encoding="utf-8") == (
+        "Read the [guide][g] first.\n\n"
+        "## 🚀 Features\n\n"
+        "### Alpha docs\n\n"
+        "See the [docs] and the [guide][g] for details.\n\n"
+        "*By @codex in #12.*\n\n"
+        "## 🐞 Bug fixes\n\n"
+        "### Beta fix\n\n"
+        "Also covered by the [docs].\n\n"
+        "- one\n"
+        "- two\n\n"
+        "*By @octocat.*\n\n"
+        "[docs]: https://example.com/docs\n"
+        '[g]: https://example.com/guide "Guide"\n'
+    )
+    rerun = runner.invoke(cli, arguments)
+    assert rerun.exit_code == 0, rerun.output
+    assert "already up to date" in rerun.output
+
+    compact = runner.invoke(
+        cli, ["--root", str(project_dir), "release", "notes", "v1.0.0", "--compact"]
+    )
+    assert compact.exit_code == 0, compact.output
+    assert compact.output == (
+        "Read the [guide][g] first.\n\n"
+        "## 🚀 Features\n\n"
+        "- See the [docs] and the [guide][g] for details. (by @codex in #12)\n\n"
+        "## 🐞 Bug fixes\n\n"
+        "- Also covered by the [docs]. (by @octocat)\n"
+    )
+
+
 def test_release_notes_collapse_soft_breaks(tmp_path: Path) -> None:
     runner = CliRunner()
     project_dir = tmp_path / "project"
@@ -1595,6 +1741,196 @@ def test_release_notes_command(tmp_path: Path) -> None:
     assert "Epsilon Fix" in notes_unreleased.output
 
 
+def test_release_commands_scan_manifests_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+
+    for version, title in (("v1.0.0", "Alpha"), ("v1.1.0", "Beta")):
+        added = runner.invoke(
+            cli,
+            [
+                "--root",
+                str(project_dir),
+                "add",
+                "--title",
+                title,
+                "--type",
+                "feature",
+                "--description",
+                f"{title} body.",
+                "--author",
+                "codex",
+            ],
+        )
+        assert added.exit_code == 0, added.output
+        created = runner.invoke(
+            cli,
+            ["--root", str(project_dir), "release", "create", version, "--yes"],
+        )
+        assert created.exit_code == 0, created.output
+
+    from tenzir_changelog import releases as releases_module
+
+    scans: list[Path] = []
+    original = releases_module.iter_release_manifests
+
+    def counting_iter(project_root: Path) -> Iterable[releases_module.ReleaseManifest]:
+        scans.append(project_root)
+        return original(project_root)
+
+    monkeypatch.setattr(releases_module, "iter_release_manifests", counting_iter)
+
+    # Release notes read the requested manifest directly and never scan.
+    for args, expected in (
+        (["release", "notes", "v1.1.0"], 0),
+        (["release", "notes", "-j", "v1.0.0"], 0),
+        (["release", "notes", "-"], 1),
+        (["show"], 1),
+        (["release", "version"], 1),
+    ):
+        scans.clear()
+        result = runner.invoke(cli, ["--root", str(project_dir), *args])
+        assert result.exit_code == 0, result.output
+        assert len(scans) == expected, args
+
+
+def test_release_catalog_skips_unchanged_manifests(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    for version, title in (("v1.0.0", "Alpha"), ("v1.1.0", "Beta")):
+        write_entry(
+            project_dir,
+            {"title": title, "type": "feature", "authors": ["codex"]},
+            f"{title} body.",
+            default_project="project",
+        )
+        created = runner.invoke(
+            cli,
+            ["--root", str(project_dir), "release", "create", version, "--intro", "Hi.", "--yes"],
+        )
+        assert created.exit_code == 0, created.output
+
+    def age(path: Path, seconds: int) -> None:
+        # Move timestamps out of the window in which they cannot be trusted.
+        timestamp = time.time() - seconds
+        os.utime(path, (timestamp, timestamp))
+
+    releases_dir = project_dir / "releases"
+    for release in ("v1.0.0", "v1.1.0"):
+        age(releases_dir / release / "manifest.yaml", 3600)
+        age(releases_dir / release / "entries", 3600)
+
+    from tenzir_changelog import releases as releases_module
+
+    read: list[str] = []
+    original = releases_module.read_text
+
+    def recording_read(path: Path) -> str:
+        read.append(path.parent.name)
+        return original(path)
+
+    monkeypatch.setattr(releases_module, "read_text", recording_read)
+
+    base = ["--root", str(project_dir)]
+    first = runner.invoke(cli, [*base, "show", "--json"])
+    assert first.exit_code == 0, first.output
+    assert sorted(read) == ["v1.0.0", "v1.1.0"]
+    assert releases_module.release_catalog_path(project_dir).is_file()
+    assert not (releases_dir / "catalog.json").exists()
+
+    read.clear()
+    second = runner.invoke(cli, [*base, "show", "--json"])
+    assert second.exit_code == 0, second.output
+    assert second.output == first.output
+    assert read == []
+
+    # Edits show up in the signature, so only that release is read again.
+    manifest_path = releases_dir / "v1.0.0" / "manifest.yaml"
+    manifest_path.write_text(
+        manifest_path.read_text(encoding="utf-8").replace("Hi.", "Edited."), encoding="utf-8"
+    )
+    age(manifest_path, 1800)
+    notes = runner.invoke(cli, [*base, "release", "notes", "v1.0.0"])
+    assert notes.exit_code == 0, notes.output
+    assert "Edited." in notes.output
+    read.clear()
+    version = runner.invoke(cli, [*base, "release", "version"])
+    assert version.exit_code == 0, version.output
+    assert read == ["v1.0.0"]
+
+    read.clear()
+    uncached = runner.invoke(cli, [*base, "--no-cache", "release", "version"])
+    assert uncached.exit_code == 0, uncached.output
+    assert sorted(read) == ["v1.0.0", "v1.1.0"]
+
+
+def test_release_notes_reads_only_requested_release(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    for version, title in (("v1.0.0", "Alpha"), ("v1.1.0", "Beta"), (None, "Gamma")):
+        write_entry(
+            project_dir,
+            {"title": title, "type": "feature", "authors": ["codex"]},
+            f"{title} body.",
+            default_project="project",
+        )
+        if version is not None:
+            created = runner.invoke(
+                cli, ["--root", str(project_dir), "release", "create", version, "--yes"]
+            )
+            assert created.exit_code == 0, created.output
+
+    from tenzir_changelog import entries as entries_module
+    from tenzir_changelog import releases as releases_module
+
+    read: list[str] = []
+    original = entries_module.read_entry
+
+    def recording_read(path: Path, **kwargs: object) -> object:
+        read.append(path.stem)
+        return original(path, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(entries_module, "read_entry", recording_read)
+    monkeypatch.setattr(releases_module, "read_entry", recording_read)
+
+    result = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "v1.0.0"])
+    assert result.exit_code == 0, result.output
+    assert "Alpha" in result.output
+    assert read == ["alpha"]
+
+    read.clear()
+    result = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "-"])
+    assert result.exit_code == 0, result.output
+    assert "Gamma" in result.output
+    assert read == ["gamma"]
+
+    missing = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "v9.0.0"])
+    assert missing.exit_code == 1
+    assert "Release 'v9.0.0' not found." in missing.output
+
+    # Labels without a "v" prefix are found through their manifest as well.
+    custom = runner.invoke(
+        cli, ["--root", str(project_dir), "release", "create", "2025.1", "--yes"]
+    )
+    assert custom.exit_code == 0, custom.output
+    read.clear()
+    result = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "2025.1"])
+    assert result.exit_code == 0, result.output
+    assert "Gamma" in result.output
+    assert read == ["gamma"]
+
+
 def test_release_publish_uses_gh(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     runner = CliRunner()
     project_dir = tmp_path / "project"
@@ -2446,6 +2782,309 @@ def test_explicit_links_flag_in_show_command(tmp_path: Path) -> None:
     assert "[#42](https://github.com/octocat/test-repo/pull/42)" in show_linked_result.output
 
 
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_release_notes_all_writes_every_release(tmp_path: Path, jobs: str) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    for version, title in (("v1.0.0", "Alpha Feature"), ("v1.1.0", "Beta Fix")):
+        write_entry(
+            project_dir,
+            {"title": title, "type": "feature", "authors": ["codex"]},
+            f"Ships {title.lower()}.",
+            default_project="project",
+        )
+        created = runner.invoke(
+            cli,
+            ["--root", str(project_dir), "release", "create", version, "--intro", "Hi.", "--yes"],
+        )
+        assert created.exit_code == 0, created.output
+
+    output_dir = tmp_path / "site"
+    arguments = ["--root", str(project_dir), "--jobs", jobs, "release", "notes", "--all"]
+    arguments += ["--output-dir", str(output_dir), "--markdown", "--json"]
+    first = runner.invoke(cli, arguments)
+    assert first.exit_code == 0, first.output
+    assert "rendered 2 releases" in first.output
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "v1.0.0.json",
+        "v1.0.0.md",
+        "v1.1.0.json",
+        "v1.1.0.md",
+    ]
+    single = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "v1.1.0"])
+    assert (output_dir / "v1.1.0.md").read_text(encoding="utf-8") == single.output
+    payload = json.loads((output_dir / "v1.0.0.json").read_text(encoding="utf-8"))
+    assert payload["entries"][0]["title"] == "Alpha Feature"
+
+    manifest_path = project_dir / "releases" / "v1.0.0" / "manifest.yaml"
+    manifest_path.write_text(
+        manifest_path.read_text(encoding="utf-8").replace("Hi.", "Updated."), encoding="utf-8"
+    )
+    untouched = (output_dir / "v1.1.0.md").stat().st_mtime_ns
+    second = runner.invoke(cli, arguments)
+    assert second.exit_code == 0, second.output
+    assert "2 files written, 2 unchanged" in second.output
+    assert "Updated." in (output_dir / "v1.0.0.md").read_text(encoding="utf-8")
+    assert (output_dir / "v1.1.0.md").stat().st_mtime_ns == untouched
+
+    missing_dir = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "--all"])
+    assert missing_dir.exit_code == 1
+    assert "--all requires --output-dir." in missing_dir.output
+    # Without --all, the last format flag wins.
+    both = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "-m", "-j"])
+    assert both.exit_code == 0, both.output
+    assert json.loads(both.output)["version"] == "v1.1.0"
+    markdown = runner.invoke(cli, ["--root", str(project_dir), "release", "notes", "-j", "-m"])
+    assert markdown.exit_code == 0, markdown.output
+    assert markdown.output == (output_dir / "v1.1.0.md").read_text(encoding="utf-8")
+
+
+def test_release_notes_all_names_files_after_release_directories(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    write_entry(
+        project_dir,
+        {"title": "Shared Fix", "type": "bugfix", "authors": ["codex"]},
+        "Fixes it.",
+        default_project="project",
+    )
+    created = runner.invoke(
+        cli, ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"]
+    )
+    assert created.exit_code == 0, created.output
+    # Two more releases whose manifests declare a duplicate and a path-like version.
+    source = project_dir / "releases" / "v1.0.0"
+    for name, version in (("v1.0.0-rc", "v1.0.0"), ("nested", "../escape/v2")):
+        copy = project_dir / "releases" / name
+        shutil.copytree(source, copy)
+        manifest_path = copy / "manifest.yaml"
+        manifest_path.write_text(
+            f"version: {version}\n" + manifest_path.read_text(encoding="utf-8"),
+            encoding="utf-8",
+        )
+
+    output_dir = tmp_path / "site" / "notes"
+    result = runner.invoke(
+        cli,
+        ["--root", str(project_dir), "release", "notes", "--all", "--output-dir", str(output_dir)],
+    )
+    assert result.exit_code == 0, result.output
+    assert "rendered 3 releases" in result.output
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "nested.md",
+        "v1.0.0-rc.md",
+        "v1.0.0.md",
+    ]
+    assert not (tmp_path / "site" / "escape").exists()
+
+
+def test_show_limit_reads_only_newest_releases(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    for index, version in enumerate(("v1.0.0", "v1.1.0", "v1.2.0", None)):
+        for suffix in ("a", "b"):
+            write_entry(
+                project_dir,
+                {
+                    "title": f"Entry {index}{suffix}",
+                    "type": "feature",
+                    "created": f"2025-01-0{index + 1}T00:00:0{ord(suffix) - 96}Z",
+                },
+                "Body.",
+                default_project="project",
+            )
+        if version is not None:
+            created = runner.invoke(
+                cli, ["--root", str(project_dir), "release", "create", version, "--yes"]
+            )
+            assert created.exit_code == 0, created.output
+
+    from tenzir_changelog import releases as releases_module
+
+    read: list[str] = []
+    original = releases_module.read_entry
+
+    def recording_read(path: Path, **kwargs: object) -> object:
+        read.append(path.stem)
+        return original(path, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(releases_module, "read_entry", recording_read)
+
+    base = ["--root", str(project_dir), "show", "--table"]
+    limited = runner.invoke(cli, [*base, "--limit", "3", "--offset", "1"])
+    assert limited.exit_code == 0, limited.output
+    titles = [title for title in ("2a", "2b", "3a", "3b") if f"Entry {title}" in limited.output]
+    assert titles == ["2a", "2b", "3a"]
+    assert sorted(read) == ["entry-2a", "entry-2b"]
+    rows = [line.split()[1] for line in limited.output.splitlines() if "Entry" in line]
+    assert rows == ["4", "3", "2"]
+
+    exported = runner.invoke(cli, [*base, "--json", "unreleased", "-n", "1"])
+    assert exported.exit_code == 0, exported.output
+    assert [entry["title"] for entry in json.loads(exported.output)["entries"]] == ["Entry 3b"]
+
+
+def test_show_plain_rows_when_not_a_terminal(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    write_entry(
+        project_dir,
+        {
+            "title": "First\tfeature",
+            "type": "feature",
+            "created": "2025-01-01T00:00:00Z",
+            "authors": ["alice"],
+            "prs": [7],
+            "components": ["cli"],
+        },
+        "Body.",
+        default_project="project",
+    )
+    released = runner.invoke(
+        cli, ["--root", str(project_dir), "release", "create", "v1.0.0", "--yes"]
+    )
+    assert released.exit_code == 0, released.output
+    write_entry(
+        project_dir,
+        {"title": "Second fix", "type": "bugfix", "created": "2025-02-01T00:00:00Z"},
+        "Body.",
+        default_project="project",
+    )
+
+    # CliRunner does not attach a terminal, so the plain view is the default.
+    result = runner.invoke(cli, ["--root", str(project_dir), "show"])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        "2\t2025-01-01\tv1.0.0\tFirst feature\tfeature\tcli\t#7\talice\tfirstfeature",
+        "1\t2025-02-01\t\tSecond fix\tbugfix\t\t\t\tsecond-fix",
+    ]
+
+    explicit = runner.invoke(cli, ["--root", str(project_dir), "show", "--plain"])
+    assert explicit.output == result.output
+    limited = runner.invoke(cli, ["--root", str(project_dir), "show", "-p", "-n", "1"])
+    assert limited.output.splitlines() == result.output.splitlines()[1:]
+
+    banner = runner.invoke(cli, ["--root", str(project_dir), "show", "--plain", "--banner"])
+    assert banner.exit_code != 0
+    assert "only available in table view" in banner.output
+
+
+def test_show_plain_rows_skip_missing_entry_files(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    for index, version in enumerate(("v1.0.0", "v1.1.0", None)):
+        for suffix in ("a", "b"):
+            write_entry(
+                project_dir,
+                {
+                    "title": f"E{index}{suffix}",
+                    "type": "change",
+                    "created": f"2025-01-0{index + 1}T00:00:0{ord(suffix) - 96}Z",
+                },
+                "Body.",
+                default_project="project",
+            )
+        if version is not None:
+            created = runner.invoke(
+                cli, ["--root", str(project_dir), "release", "create", version, "--yes"]
+            )
+            assert created.exit_code == 0, created.output
+    # The manifest still lists the entry, but its file is gone.
+    release_dir = project_dir / "releases" / "v1.0.0"
+    with (release_dir / "manifest.yaml").open("a", encoding="utf-8") as manifest:
+        manifest.write("entries:\n- e0a\n- e0b\n")
+    (release_dir / "entries" / "e0b.md").unlink()
+
+    base = ["--root", str(project_dir), "show"]
+    table = runner.invoke(cli, [*base, "--table"])
+    assert table.exit_code == 0, table.output
+    table_rows = [
+        (cells[1], next(cell for cell in cells if cell.startswith("E")))
+        for cells in (
+            [cell.strip() for cell in line.split("│")] for line in table.output.splitlines()
+        )
+        if len(cells) > 2 and cells[1].isdigit()
+    ]
+    plain = runner.invoke(cli, [*base, "--plain"])
+    assert plain.exit_code == 0, plain.output
+    plain_rows = [
+        (fields[0], fields[3])
+        for fields in (line.split("\t") for line in plain.output.splitlines())
+    ]
+    assert plain_rows == table_rows
+    assert [row for row, _ in plain_rows] == ["5", "4", "3", "2", "1"]
+
+
+def test_release_ranges_group_by_release(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    save_config(Config(id="project", name="Project"), project_dir / "config.yaml")
+    releases = (
+        ("v0.12.0", "2025-01-10", "Alpha"),
+        ("v0.13.0", "2025-02-10", "Beta"),
+        ("v0.18.2", "2025-03-10", "Gamma"),
+        ("v0.19.0", "2025-04-10", "Delta"),
+    )
+    for version, day, title in releases:
+        write_entry(
+            project_dir,
+            {"title": title, "type": "feature", "authors": ["codex"]},
+            f"{title} body.",
+            default_project="project",
+        )
+        created = runner.invoke(
+            cli,
+            ["--root", str(project_dir), "release", "create", version, "--date", day, "--yes"],
+        )
+        assert created.exit_code == 0, created.output
+    base = ["--root", str(project_dir)]
+
+    notes = runner.invoke(
+        cli, [*base, "release", "notes", "--since", "v0.12.0", "--until", "v0.18.2"]
+    )
+    assert notes.exit_code == 0, notes.output
+    headings = [line for line in notes.output.splitlines() if line.startswith("# ")]
+    assert headings == ["# Project v0.18.2", "# Project v0.13.0", "# Project v0.12.0"]
+    assert "Delta" not in notes.output
+
+    by_date = runner.invoke(
+        cli, [*base, "show", "--json", "--since", "2025-02-01", "--until", "2025-03-31"]
+    )
+    assert by_date.exit_code == 0, by_date.output
+    payload = json.loads(by_date.output)
+    assert payload["since"] == "2025-02-01"
+    assert [release["version"] for release in payload["releases"]] == ["v0.18.2", "v0.13.0"]
+    assert payload["releases"][1]["entries"][0]["title"] == "Beta"
+
+    table = runner.invoke(cli, [*base, "show", "--since", "v0.19.0"])
+    assert table.exit_code == 0, table.output
+    assert "Delta" in table.output
+    assert "Gamma" not in table.output
+
+    empty = runner.invoke(cli, [*base, "release", "notes", "--since", "v1.0.0"])
+    assert empty.exit_code == 1
+    assert "No releases match --since v1.0.0." in empty.output
+    invalid = runner.invoke(cli, [*base, "show", "--until", "soon"])
+    assert invalid.exit_code == 1
+    assert "Invalid --until value 'soon'" in invalid.output
+    mixed = runner.invoke(cli, [*base, "show", "v0.12.0", "--since", "v0.12.0"])
+    assert mixed.exit_code == 1
+    assert "Use either identifiers or --since/--until, not both." in mixed.output
+
+
 def test_explicit_links_flag_in_release_notes_command(tmp_path: Path) -> None:
     """Test that --explicit-links works in release notes command."""
     runner = CliRunner()
@@ -3160,3 +3799,239 @@ def test_add_omit_author_config_warns_on_co_author(tmp_path: Path) -> None:
     entry = read_entry(entry_files[0])
     assert "author" not in entry.metadata
     assert "authors" not in entry.metadata
+
+
+def test_jobs_option_and_environment(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    for title in ("First", "Second", "Third"):
+        added = runner.invoke(
+            cli,
+            [
+                "--root",
+                str(project_dir),
+                "add",
+                "--title",
+                title,
+                "--type",
+                "feature",
+                "--description",
+                f"{title} body.",
+                "--author",
+                "codex",
+            ],
+        )
+        assert added.exit_code == 0, added.output
+
+    sequential = runner.invoke(cli, ["--root", str(project_dir), "show", "--json"])
+    parallel = runner.invoke(cli, ["--root", str(project_dir), "--jobs", "3", "show", "--json"])
+    assert parallel.exit_code == 0, parallel.output
+    assert parallel.output == sequential.output
+
+    monkeypatch.setenv("TENZIR_CHANGELOG_JOBS", "many")
+    invalid = runner.invoke(cli, ["--root", str(project_dir), "show"])
+    assert invalid.exit_code != 0
+    assert "TENZIR_CHANGELOG_JOBS must be an integer" in invalid.output
+
+
+def _write_invalid_entry(project_dir: Path, entry_id: str) -> Path:
+    path = project_dir / "unreleased" / f"{entry_id}.md"
+    path.write_text("---\ntitle: Broken\ntype: unknown\n---\n\nBody.\n", encoding="utf-8")
+    return path
+
+
+def test_validate_changed_rechecks_only_modified_files(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    _create_project_with_entry(
+        project_dir,
+        "demo",
+        "Demo",
+        entry_id="first",
+        title="First",
+        created=date(2025, 1, 1),
+    )
+    release_dir = project_dir / "releases" / "v1.0.0"
+    (release_dir / "entries").mkdir(parents=True)
+    (release_dir / "manifest.yaml").write_text(
+        "created: 2025-01-02\nentries:\n  - shipped\n", encoding="utf-8"
+    )
+    shipped = release_dir / "entries" / "shipped.md"
+    shipped.write_text("---\ntitle: Shipped\ntype: feature\n---\n\nBody.\n", encoding="utf-8")
+
+    arguments = ["--root", str(project_dir), "validate", "--changed"]
+    first = runner.invoke(cli, arguments)
+    assert first.exit_code == 0, first.output
+    assert "changed file" not in first.output
+
+    unchanged = runner.invoke(cli, arguments)
+    assert unchanged.exit_code == 0, unchanged.output
+    assert "checking 0 changed file(s)" in unchanged.output
+
+    broken = _write_invalid_entry(project_dir, "broken")
+    failed = runner.invoke(cli, arguments)
+    assert failed.exit_code == 1
+    assert "checking 1 changed file(s)" in failed.output
+    assert "Unknown type 'unknown'" in failed.output
+
+    # Failed runs are not recorded, so the broken file is checked again.
+    broken.unlink()
+    recovered = runner.invoke(cli, arguments)
+    assert recovered.exit_code == 0, recovered.output
+
+    # Cross-file checks still see the whole project.
+    shipped.unlink()
+    missing = runner.invoke(cli, arguments)
+    assert missing.exit_code == 1
+    assert "Release references missing entry id 'shipped'" in missing.output
+
+
+def test_validate_changed_rechecks_everything_after_config_change(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    _create_project_with_entry(
+        project_dir,
+        "demo",
+        "Demo",
+        entry_id="first",
+        title="First",
+        created=date(2025, 1, 1),
+    )
+    entry_path = project_dir / "unreleased" / "first.md"
+    entry_path.write_text(
+        entry_path.read_text(encoding="utf-8").replace(
+            "type: feature", "type: feature\ncomponents:\n  - cli"
+        ),
+        encoding="utf-8",
+    )
+    arguments = ["--root", str(project_dir), "validate", "--changed"]
+    assert runner.invoke(cli, arguments).exit_code == 0
+
+    save_config(
+        Config(id="demo", name="Demo", components={"api": "The API."}),
+        project_dir / "config.yaml",
+    )
+    result = runner.invoke(cli, arguments)
+    assert result.exit_code == 1
+    assert "Unknown component(s) 'cli'" in result.output
+
+
+def test_validate_since_checks_files_changed_since_ref(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    _create_project_with_entry(
+        project_dir,
+        "demo",
+        "Demo",
+        entry_id="first",
+        title="First",
+        created=date(2025, 1, 1),
+    )
+    _write_invalid_entry(project_dir, "committed")
+    for command in (
+        ["git", "init", "-q"],
+        ["git", "config", "user.email", "codex@example.com"],
+        ["git", "config", "user.name", "Codex"],
+        ["git", "config", "commit.gpgsign", "false"],
+        ["git", "add", "."],
+        ["git", "commit", "-q", "-m", "Initial"],
+    ):
+        subprocess.run(command, cwd=project_dir, check=True)
+
+    clean = runner.invoke(cli, ["--root", str(project_dir), "validate", "--since", "HEAD"])
+    assert clean.exit_code == 0, clean.output
+    assert "checking 0 changed file(s)" in clean.output
+
+    _write_invalid_entry(project_dir, "untracked")
+    result = runner.invoke(cli, ["--root", str(project_dir), "validate", "--since", "HEAD"])
+    assert result.exit_code == 1
+    assert "untracked.md" in result.output
+    assert "committed.md" not in result.output
+
+    full = runner.invoke(cli, ["--root", str(project_dir), "validate"])
+    assert "committed.md" in full.output
+
+    unknown = runner.invoke(cli, ["--root", str(project_dir), "validate", "--since", "nope"])
+    assert unknown.exit_code == 1
+    assert "git could not compare against 'nope'" in unknown.output
+
+    both = runner.invoke(
+        cli, ["--root", str(project_dir), "validate", "--changed", "--since", "HEAD"]
+    )
+    assert both.exit_code == 1
+    assert "Use either --changed or --since, not both." in both.output
+
+
+def test_backfill_created_dates_entries_from_git_history(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    _create_project_with_entry(
+        project_dir,
+        "demo",
+        "Demo",
+        entry_id="dated",
+        title="Dated",
+        created=date(2025, 1, 1),
+    )
+    unreleased = project_dir / "unreleased"
+    (unreleased / "pending.md").write_text(
+        "---\ntitle: Pending\ntype: feature\n---\n\nBody.\n", encoding="utf-8"
+    )
+    (unreleased / "shipped.md").write_text(
+        "---\ntitle: Shipped\ntype: bugfix\ncreated: ''\n---\n\nShipped body.\n",
+        encoding="utf-8",
+    )
+
+    def git(*arguments: str, when: str | None = None) -> None:
+        env = dict(os.environ)
+        if when is not None:
+            env.update(GIT_AUTHOR_DATE=when, GIT_COMMITTER_DATE=when)
+        subprocess.run(["git", *arguments], cwd=project_dir, check=True, env=env)
+
+    git("init", "-q")
+    git("config", "user.email", "codex@example.com")
+    git("config", "user.name", "Codex")
+    git("config", "commit.gpgsign", "false")
+    git("add", ".")
+    git("commit", "-q", "-m", "Initial", when="2024-03-04T05:06:07+02:00")
+    release_dir = project_dir / "releases" / "v1.0.0"
+    (release_dir / "entries").mkdir(parents=True)
+    (release_dir / "manifest.yaml").write_text(
+        "created: 2024-06-01\nentries:\n  - shipped\n", encoding="utf-8"
+    )
+    git("mv", "unreleased/shipped.md", "releases/v1.0.0/entries/shipped.md")
+    git("add", ".")
+    git("commit", "-q", "-m", "Release", when="2024-06-01T00:00:00+00:00")
+    (unreleased / "untracked.md").write_text(
+        "---\ntitle: Untracked\ntype: feature\n---\n\nBody.\n", encoding="utf-8"
+    )
+
+    preview = runner.invoke(cli, ["--root", str(project_dir), "backfill-created"])
+    assert preview.exit_code == 0, preview.output
+    assert "pending\t2024-03-04T03:06:07+00:00" in preview.output
+    assert "shipped\t2024-03-04T03:06:07+00:00" in preview.output
+    assert "no git history for entry 'untracked'" in preview.output
+    assert "dated" not in preview.output
+    assert "created:" not in (unreleased / "pending.md").read_text(encoding="utf-8")
+
+    refused = runner.invoke(
+        cli, ["--root", str(project_dir), "--ref", "HEAD", "backfill-created", "--write"]
+    )
+    assert refused.exit_code == 1
+    assert "Cannot backfill created dates while reading from --ref HEAD." in refused.output
+
+    written = runner.invoke(cli, ["--root", str(project_dir), "backfill-created", "--write"])
+    assert written.exit_code == 0, written.output
+    assert "wrote created dates to 2 entries" in written.output
+    assert (unreleased / "pending.md").read_text(encoding="utf-8") == (
+        "---\ntitle: Pending\ntype: feature\ncreated: 2024-03-04T03:06:07Z\n---\n\nBody.\n"
+    )
+    shipped = (release_dir / "entries" / "shipped.md").read_text(encoding="utf-8")
+    assert "created: 2024-03-04T03:06:07Z\n" in shipped
+    assert shipped.count("created:") == 1
+
+    again = runner.invoke(cli, ["--root", str(project_dir), "backfill-created"])
+    assert again.exit_code == 0, again.output
+    assert "pending" not in again.output
+    assert "no git history for entry 'untracked'" in again.output
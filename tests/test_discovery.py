@@ -0,0 +1,109 @@
+"""Tests for filesystem and git-backed file discovery."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+from conftest import git, write_entry_file, write_file
+
+from tenzir_changelog import discovery
+from tenzir_changelog.cli import cli
+from tenzir_changelog.discovery import configure_discovery, glob_paths
+from tenzir_changelog.modules import discover_modules
+
+
+@pytest.fixture
+def repository(git_repository: Path) -> Path:
+    """A repository with tracked, untracked, ignored, and deleted files."""
+    project = git_repository / "changelog"
+    write_file(
+        project / "config.yaml",
+        yaml.safe_dump({"id": "parent", "name": "Parent", "modules": "../packages/*/changelog"}),
+    )
+    write_entry_file(project / "unreleased", "tracked")
+    write_entry_file(project / "unreleased", "deleted")
+    for module_id in ("alpha", "vendored"):
+        write_file(
+            git_repository / "packages" / module_id / "changelog" / "config.yaml",
+            yaml.safe_dump({"id": module_id, "name": module_id.title()}),
+        )
+    write_file(git_repository / ".gitignore", "packages/vendored/\n*.draft.md\n")
+    git(git_repository, "add", ".")
+    git(git_repository, "commit", "-q", "-m", "Initial")
+    (project / "unreleased" / "deleted.md").unlink()
+    write_entry_file(project / "unreleased", "untracked")
+    write_entry_file(project / "unreleased", "ignored.draft")
+    return git_repository
+
+
+def _names(paths: list[Path]) -> list[str]:
+    return [path.name for path in paths]
+
+
+def test_git_discovery_lists_tracked_and_untracked_files(repository: Path) -> None:
+    unreleased = repository / "changelog" / "unreleased"
+    assert _names(glob_paths(unreleased, "*.md")) == [
+        "ignored.draft.md",
+        "tracked.md",
+        "untracked.md",
+    ]
+
+    configure_discovery("git")
+    paths = glob_paths(unreleased, "*.md")
+    assert _names(paths) == ["tracked.md", "untracked.md"]
+    assert all(path.parent == unreleased for path in paths)
+
+
+def test_git_discovery_skips_ignored_modules(repository: Path) -> None:
+    project = repository / "changelog"
+    pattern = "../packages/*/changelog"
+    all_ids = [module.config.id for module in discover_modules(project, pattern)]
+    assert all_ids == ["alpha", "vendored"]
+
+    configure_discovery("git")
+    assert [module.config.id for module in discover_modules(project, pattern)] == ["alpha"]
+
+
+def test_git_discovery_lists_repository_once(
+    repository: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[list[str]] = []
+    original = discovery.git_output
+
+    def record(root: Path, arguments: list[str], failure: str) -> str:
+        calls.append(arguments)
+        return original(root, arguments, failure)
+
+    monkeypatch.setattr(discovery, "git_output", record)
+    configure_discovery("git")
+    project = repository / "changelog"
+    glob_paths(project / "unreleased", "*.md")
+    glob_paths(project / "releases", "*/manifest.yaml")
+    list(discover_modules(project, "../packages/*/changelog"))
+    assert [arguments[0] for arguments in calls] == ["rev-parse", "ls-files"]
+
+
+def test_git_discovery_falls_back_outside_repositories(tmp_path: Path) -> None:
+    write_entry_file(tmp_path / "unreleased", "plain")
+    configure_discovery("git")
+    assert _names(glob_paths(tmp_path / "unreleased", "*.md")) == ["plain.md"]
+
+
+def test_cli_discovery_option_and_environment(
+    repository: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runner = CliRunner()
+    project = repository / "changelog"
+    result = runner.invoke(cli, ["--root", str(project), "--discovery", "git", "show", "--json"])
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert sorted(entry["title"] for entry in payload["entries"]) == ["Tracked", "Untracked"]
+
+    monkeypatch.setenv("TENZIR_CHANGELOG_DISCOVERY", "svn")
+    invalid = runner.invoke(cli, ["--root", str(project), "show"])
+    assert invalid.exit_code != 0
+    assert "TENZIR_CHANGELOG_DISCOVERY must be one of filesystem, git" in invalid.output
@@ -5,7 +5,15 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 
-from tenzir_changelog.entries import iter_entries, read_entry, sort_entries_desc, write_entry
+import pytest
+
+from tenzir_changelog.entries import (
+    Entry,
+    iter_entries,
+    read_entry,
+    sort_entries_desc,
+    write_entry,
+)
 
 
 def test_sort_entries_desc_orders_by_created_datetime(tmp_path: Path) -> None:
@@ -130,3 +138,150 @@ def test_read_entry_rejects_both_component_and_components(tmp_path: Path) -> Non
 
     with pytest.raises(ValueError, match="cannot have both 'component' and 'components'"):
         read_entry(entry_file)
+
+
+def test_parallel_iter_entries_matches_sequential_order(tmp_path: Path) -> None:
+    """Parallel loading yields the same entries in the same order."""
+    from tenzir_changelog.parallel import configure_jobs
+
+    unreleased = tmp_path / "unreleased"
+    unreleased.mkdir()
+    for index in range(24):
+        (unreleased / f"entry-{index:02d}.md").write_text(
+            f"---\ntitle: Entry {index}\ntype: feature\n---\nBody {index}.\n",
+            encoding="utf-8",
+        )
+
+    sequential = [(entry.entry_id, entry.body) for entry in iter_entries(tmp_path)]
+    configure_jobs(4)
+    parallel = [(entry.entry_id, entry.body) for entry in iter_entries(tmp_path)]
+
+    assert parallel == sequential
+    assert [entry_id for entry_id, _ in parallel] == sorted(entry_id for entry_id, _ in parallel)
+
+
+def test_parallel_iter_entries_reports_first_invalid_file(tmp_path: Path) -> None:
+    """Parallel loading raises the same error as a sequential scan."""
+    import pytest
+    from click import ClickException
+
+    from tenzir_changelog.parallel import configure_jobs
+
+    unreleased = tmp_path / "unreleased"
+    unreleased.mkdir()
+    (unreleased / "a-valid.md").write_text("---\ntitle: Valid\n---\nBody.\n", encoding="utf-8")
+    (unreleased / "b-broken.md").write_text(
+        "---\ntitle: Broken: colon\n---\nBody.\n", encoding="utf-8"
+    )
+    (unreleased / "c-broken.md").write_text("No frontmatter.\n", encoding="utf-8")
+
+    with pytest.raises(ClickException) as sequential:
+        list(iter_entries(tmp_path))
+    configure_jobs(4)
+    with pytest.raises(ClickException) as parallel:
+        list(iter_entries(tmp_path))
+
+    assert "Failed to parse YAML frontmatter in 'b-broken.md'" in parallel.value.message
+    assert parallel.value.message == sequential.value.message
+
+
+def test_read_entry_defers_body_until_accessed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only the frontmatter is read up front; the body loads on demand."""
+    from tenzir_changelog import entries as entries_module
+
+    entry_file = tmp_path / "lazy.md"
+    entry_file.write_text(
+        "---\ntitle: Lazy\ntype: feature\n---\n\nFirst paragraph.\n\n---\n\nAfter a rule.\n",
+        encoding="utf-8",
+    )
+    body_reads: list[Path] = []
+    original = entries_module._read_entry_body
+
+    def tracking(path: Path, offset: int) -> str:
+        body_reads.append(path)
+        return original(path, offset)
+
+    monkeypatch.setattr(entries_module, "_read_entry_body", tracking)
+
+    entry = read_entry(entry_file)
+    assert entry.title == "Lazy"
+    assert body_reads == []
+
+    assert entry.body == "First paragraph.\n\n---\n\nAfter a rule."
+    assert entry.body == "First paragraph.\n\n---\n\nAfter a rule."
+    assert body_reads == [entry_file]
+
+
+def test_read_entry_handles_crlf_line_endings(tmp_path: Path) -> None:
+    """Windows line endings parse the same as Unix ones."""
+    entry_file = tmp_path / "crlf.md"
+    entry_file.write_bytes(
+        b"---\r\ntitle: CRLF\r\ntype: bugfix\r\n---\r\n\r\nLine one.\r\nLine two.\r\n"
+    )
+
+    entry = read_entry(entry_file)
+
+    assert entry.metadata["title"] == "CRLF"
+    assert entry.body == "Line one.\nLine two."
+
+
+def test_entry_precomputes_derived_fields(tmp_path: Path) -> None:
+    """Derived fields are computed once and entries reject mutation."""
+    import dataclasses
+
+    entry_file = tmp_path / "derived.md"
+    entry_file.write_text(
+        "---\ntitle: Derived\ntype: bugfix\nprojects: [core]\ncomponent: cli\n"
+        "created: 2024-03-01T12:00:00Z\n---\nBody.\n",
+        encoding="utf-8",
+    )
+
+    entry = read_entry(entry_file)
+
+    assert (entry.title, entry.type, entry.project) == ("Derived", "bugfix", "core")
+    assert entry.metadata["project"] == "core"
+    assert "projects" not in entry.metadata
+    assert entry.components == ["cli"]
+    expected = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc).timestamp() * 1_000_000
+    assert entry.sort_key == (int(expected), "derived")
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        entry.title = "Changed"  # type: ignore[misc]
+
+
+def test_entry_metadata_is_read_only(tmp_path: Path) -> None:
+    """Metadata cannot drift from the derived fields; edits build a new entry."""
+    import pickle
+
+    metadata = {"title": "Original", "type": "feature", "project": "core"}
+    entry = Entry("original", metadata, "Body.", tmp_path / "original.md")
+
+    metadata["title"] = "Changed by caller"
+    assert entry.metadata["title"] == "Original"
+    with pytest.raises(TypeError):
+        entry.metadata["title"] = "Changed"  # type: ignore[index]
+    assert entry.title == "Original"
+
+    edited = Entry(entry.entry_id, {**entry.metadata, "title": "Edited"}, entry.body, entry.path)
+    assert (edited.title, edited.project) == ("Edited", "core")
+
+    restored = pickle.loads(pickle.dumps(edited))
+    assert restored == edited
+    assert (restored.title, restored.body) == ("Edited", "Body.")
+
+
+def test_entry_defers_invalid_project_errors(tmp_path: Path) -> None:
+    """Invalid project metadata only fails when the project is requested."""
+    entry_file = tmp_path / "conflict.md"
+    entry_file.write_text(
+        "---\ntitle: Conflict\ntype: change\nprojects: [a, b]\n---\nBody.\n",
+        encoding="utf-8",
+    )
+
+    entry = read_entry(entry_file)
+
+    assert entry.title == "Conflict"
+    with pytest.raises(ValueError, match="Entry 'conflict' has invalid project metadata"):
+        _ = entry.project
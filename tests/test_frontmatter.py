@@ -0,0 +1,140 @@
+"""Differential tests for the frontmatter loaders."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from tenzir_changelog.frontmatter import load_frontmatter, parse_flat_mapping
+
+REPO_CHANGELOG = Path(__file__).resolve().parents[1] / "changelog"
+
+# Documents the fast path must accept.
+FLAT_DOCUMENTS = [
+    "title: Add feature\ntype: feature\n",
+    "title: Fix crash\ntype: bugfix\ncreated: 2025-01-02T03:04:05Z\n",
+    "title: Dated\ncreated: 2025-01-02\n",
+    "title: Offset\ncreated: 2025-01-02T03:04:05.123456+02:00\n",
+    "title: Spaced date\ncreated: 2025-01-02 03:04:05\n",
+    "title: PRs\nprs:\n  - 42\n  - 43\n",
+    "title: Indentless\nauthors:\n- alice\n- bob\n",
+    "title: Single\npr: 7\nauthor: codex\ncomponent: cli\n",
+    "title: 'Quoted: with colon'\ntype: change\n",
+    "title: 'It''s quoted'\n",
+    'title: "Double: quoted"\n',
+    "title: Empty value\nproject:\n",
+    "title: Booleans\nbreaking: true\nlegacy: no\nflag: On\n",
+    "title: Numbers\nfloat: 1.5\nhex: 0x1F\noctal: 0o17\nsexagesimal: 1:30\n",
+    "title: Nulls\na: ~\nb: null\nc: Null\n",
+    "title: Versions\nversion: 1.2.3\nplain: v1.0\n",
+    "title: Symbols in C# and 100%\ntype: change\n",
+    "title: Trailing spaces   \ntype: feature  \n",
+    "# leading comment\ntitle: Commented\n\n  # indented comment\ntype: feature\n",
+    "title: Duplicate\ntitle: Wins\n",
+    "components:\n  - cli\n\n  - api\ntitle: Blank inside list\n",
+    "title: Unicode ümlaut ✓\n",
+    "title: Float specials\na: .inf\nb: .NaN\n",
+]
+
+# Documents the fast path must hand over to full YAML.
+FALLBACK_DOCUMENTS = [
+    "title: Nested\nmeta:\n  key: value\n",
+    "title: Flow\ncomponents: [cli, api]\n",
+    "title: Flow map\nmeta: {a: 1}\n",
+    "title: Block\nbody: |\n  line\n",
+    "title: Folded\nintro: >-\n  folded\n  text\n",
+    "title: Anchor\na: &x 1\nb: *x\n",
+    "title: Tagged\na: !!str 1\n",
+    'title: Escaped\na: "tab\\tseparated"\n',
+    "title: Trailing comment # note\n",
+    "title: Multi\n  line plain\n",
+    "title: Next line\nvalue:\n  scalar\n",
+    "title: Nested list\nitems:\n  - a: 1\n",
+    "title: Mixed indent\nitems:\n  - a\n    - b\n",
+    "title: Empty item\nitems:\n  -\n",
+    "title: Negative\na: -5\n",
+    "---\ntitle: Marker\n",
+    "title: Equals\na: =\n",
+    "true: boolean key\n",
+    "1: numeric key\n",
+    "title:value\n",
+    "\ttitle: Tabbed\n",
+    "",
+    "# only a comment\n",
+]
+
+
+def _typed(value: Any) -> Any:
+    """Return a representation that distinguishes types that compare equal."""
+    if isinstance(value, dict):
+        return ("dict", [(_typed(k), _typed(v)) for k, v in value.items()])
+    if isinstance(value, list):
+        return ("list", [_typed(item) for item in value])
+    if isinstance(value, float) and value != value:
+        return ("float", "nan")
+    return (type(value).__name__, repr(value))
+
+
+def _reference_loads(text: str) -> list[Any]:
+    loaders: list[type[yaml.SafeLoader]] = [yaml.SafeLoader]
+    if hasattr(yaml, "CSafeLoader"):
+        loaders.append(yaml.CSafeLoader)
+    return [yaml.load(text, Loader=loader) for loader in loaders]
+
+
+@pytest.mark.parametrize("text", FLAT_DOCUMENTS)
+def test_fast_path_matches_yaml(text: str) -> None:
+    fast = parse_flat_mapping(text)
+    assert fast is not None, "expected the fast path to accept this document"
+    for reference in _reference_loads(text):
+        assert _typed(fast) == _typed(reference)
+    assert _typed(load_frontmatter(text)) == _typed(fast)
+
+
+@pytest.mark.parametrize("text", FALLBACK_DOCUMENTS)
+def test_unsupported_shapes_fall_back_to_yaml(text: str) -> None:
+    assert parse_flat_mapping(text) is None
+    try:
+        references = _reference_loads(text)
+    except yaml.YAMLError:
+        with pytest.raises(yaml.YAMLError):
+            load_frontmatter(text)
+        return
+    for reference in references:
+        assert _typed(load_frontmatter(text)) == _typed(reference)
+
+
+def test_invalid_yaml_still_raises() -> None:
+    with pytest.raises(yaml.YAMLError):
+        load_frontmatter("title: Broken: colon\n")
+
+
+def _repository_frontmatter() -> list[Path]:
+    paths = sorted(REPO_CHANGELOG.glob("unreleased/*.md"))
+    paths += sorted(REPO_CHANGELOG.glob("releases/*/entries/*.md"))
+    return paths
+
+
+@pytest.mark.parametrize("path", _repository_frontmatter(), ids=lambda path: path.name)
+def test_repository_entries_parse_identically(path: Path) -> None:
+    content = path.read_text(encoding="utf-8")
+    frontmatter = content.partition("---\n")[2].partition("\n---\n")[0]
+    results = [load_frontmatter(frontmatter), *_reference_loads(frontmatter)]
+    fast = parse_flat_mapping(frontmatter)
+    if fast is not None:
+        results.append(fast)
+    assert all(_typed(result) == _typed(results[0]) for result in results)
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(REPO_CHANGELOG.glob("releases/*/manifest.yaml")),
+    ids=lambda path: path.parent.name,
+)
+def test_repository_manifests_parse_identically(path: Path) -> None:
+    text = path.read_text(encoding="utf-8")
+    results = [load_frontmatter(text), *_reference_loads(text)]
+    assert all(_typed(result) == _typed(results[0]) for result in results)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
+from tenzir_changelog import modules as modules_module
 from tenzir_changelog.cli import cli
 from tenzir_changelog.config import Config
 from tenzir_changelog.modules import discover_modules, discover_modules_from_config
@@ -100,6 +103,60 @@ def test_discover_modules_skips_invalid_configs(tmp_path: Path) -> None:
     assert modules[0].config.id == "valid"
 
 
+def _age_tree(root: Path) -> None:
+    """Move all timestamps below `root` out of the racy-timestamp window."""
+    for path in [root, *root.rglob("*")]:
+        timestamp = path.stat().st_mtime - 3600
+        os.utime(path, (timestamp, timestamp))
+
+
+def test_discover_modules_reuses_cached_configs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged module trees are served from the discovery cache."""
+    packages = tmp_path / "packages"
+    create_module(packages, "foo", "Foo Package")
+    create_module(packages, "bar", "Bar Package")
+    parent_root = tmp_path / "changelog"
+    parent_root.mkdir()
+    _age_tree(tmp_path)
+
+    first = list(discover_modules(parent_root, "../packages/*/changelog"))
+
+    def fail(root: Path) -> None:
+        raise AssertionError(f"config of {root} was loaded despite a valid cache record")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(modules_module, "load_project_config", fail)
+        cached = list(discover_modules(parent_root, "../packages/*/changelog"))
+    assert cached == first
+
+
+def test_discover_modules_cache_tracks_directories_and_configs(tmp_path: Path) -> None:
+    """New modules and edited configs invalidate the discovery cache."""
+    packages = tmp_path / "packages"
+    foo_root = create_module(packages, "foo", "Foo Package")
+    (packages / "pending").mkdir()
+    parent_root = tmp_path / "changelog"
+    parent_root.mkdir()
+    _age_tree(tmp_path)
+    pattern = "../packages/*/changelog"
+    assert [m.config.id for m in discover_modules(parent_root, pattern)] == ["foo"]
+
+    # Adding the changelog directory only touches the (unmatched) package dir.
+    pending_root = packages / "pending" / "changelog"
+    pending_root.mkdir()
+    write_yaml(pending_root / "config.yaml", {"id": "pending", "name": "Pending"})
+    modules = list(discover_modules(parent_root, pattern))
+    assert sorted(m.config.id for m in modules) == ["foo", "pending"]
+
+    _age_tree(tmp_path)
+    list(discover_modules(parent_root, pattern))
+    write_yaml(foo_root / "config.yaml", {"id": "foo", "name": "Renamed"})
+    names = {m.config.id: m.config.name for m in discover_modules(parent_root, pattern)}
+    assert names["foo"] == "Renamed"
+
+
 def test_discover_modules_handles_relative_paths(tmp_path: Path) -> None:
     """Module relative_path is set correctly for display."""
     packages = tmp_path / "packages"
@@ -202,6 +259,44 @@ def test_run_validation_with_modules_prefixes_issues(tmp_path: Path) -> None:
     assert "Unknown type" in module_issues[0].message
 
 
+def test_run_validation_with_modules_in_worker_processes(tmp_path: Path) -> None:
+    """Process-pool validation reports the same issues in the same order."""
+    from tenzir_changelog.parallel import configure_jobs
+
+    packages = tmp_path / "packages"
+    for module_id in ("alpha", "beta", "gamma", "delta"):
+        mod_root = create_module(packages, module_id, module_id.title())
+        (mod_root / "unreleased" / f"{module_id}-bad.md").write_text(
+            "---\ntitle: Bad Entry\ntype: unknown\n---\n\nBody.\n",
+            encoding="utf-8",
+        )
+        create_entry(mod_root, f"{module_id} feature")
+
+    parent_root = tmp_path / "changelog"
+    parent_root.mkdir()
+    write_yaml(parent_root / "config.yaml", {"id": "parent", "name": "Parent"})
+    (parent_root / "unreleased").mkdir()
+    (parent_root / "unreleased" / "parent-bad.md").write_text(
+        "---\ntitle: Parent\n---\n\nBody.\n", encoding="utf-8"
+    )
+
+    config = Config(id="parent", name="Parent", modules="../packages/*/changelog")
+    modules = discover_modules_from_config(parent_root, config)
+
+    sequential = run_validation_with_modules(parent_root, config, modules)
+    configure_jobs(3)
+    parallel = run_validation_with_modules(parent_root, config, modules)
+
+    assert parallel == sequential
+    assert [issue.message.split("]")[0] for issue in parallel] == [
+        "Unknown type 'None'. Allowed types: breaking, feature, bugfix, change",
+        "[alpha",
+        "[beta",
+        "[delta",
+        "[gamma",
+    ]
+
+
 # --- CLI Tests ---
 
 
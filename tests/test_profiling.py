@@ -0,0 +1,83 @@
+"""Tests for timing spans."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from tenzir_changelog import profiling
+from tenzir_changelog.cli import cli
+
+
+def test_spans_are_noops_when_disabled() -> None:
+    profiling.disable_profiling()
+    assert profiling.active_profiler() is None
+    assert profiling.span("anything") is profiling.span("other")
+
+
+def test_nested_spans_track_self_time() -> None:
+    profiler = profiling.enable_profiling()
+    try:
+        with profiling.span("outer"):
+            time.sleep(0.01)
+            with profiling.span("inner"):
+                time.sleep(0.01)
+    finally:
+        profiling.disable_profiling()
+
+    phases = {phase.name: phase for phase in profiler.summary()}
+    assert phases["outer"].calls == 1
+    assert phases["outer"].total >= phases["inner"].total
+    assert abs(phases["outer"].self_total - (phases["outer"].total - phases["inner"].total)) < 1e-6
+    events = profiler.to_trace()["traceEvents"]
+    assert [event["name"] for event in events] == ["outer", "inner"]
+
+
+def test_profile_options_report_phases(tmp_path: Path) -> None:
+    runner = CliRunner()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    added = runner.invoke(
+        cli,
+        [
+            "--root",
+            str(project_dir),
+            "add",
+            "--title",
+            "Profiled",
+            "--type",
+            "feature",
+            "--description",
+            "Body.",
+            "--author",
+            "codex",
+        ],
+    )
+    assert added.exit_code == 0, added.output
+
+    trace_path = tmp_path / "trace.json"
+    result = runner.invoke(
+        cli,
+        [
+            "--root",
+            str(project_dir),
+            "--profile",
+            "--profile-output",
+            str(trace_path),
+            "show",
+            "--json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Profiled" in result.stdout
+    assert "entries.parse" not in result.stdout
+    assert "entries.parse" in result.stderr
+    assert "config.load" in result.stderr
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert {"config.load", "entries.load", "entries.parse"} <= names
+    assert profiling.active_profiler() is None
@@ -0,0 +1,59 @@
+"""Tests for the semver release index."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from packaging.version import Version
+
+from tenzir_changelog.releases import ReleaseManifest, SemverIndex
+
+
+def _index(*labels: str) -> SemverIndex:
+    return SemverIndex(ReleaseManifest(version=label, created=date(2025, 1, 1)) for label in labels)
+
+
+def _versions(manifests: list[ReleaseManifest]) -> list[str]:
+    return [manifest.version for manifest in manifests]
+
+
+def test_semver_index_orders_by_version() -> None:
+    index = _index("v1.10.0", "v1.2.0", "nightly", "v1.9.1", "v0.1.0")
+    assert [manifest.version for _, manifest in index] == [
+        "v0.1.0",
+        "v1.2.0",
+        "v1.9.1",
+        "v1.10.0",
+    ]
+    assert len(index) == 4
+    latest = index.latest()
+    assert latest is not None
+    assert latest[0] == Version("1.10.0")
+    assert SemverIndex([]).latest() is None
+
+
+def test_semver_index_neighbours() -> None:
+    index = _index("v1.0.0", "v1.1.0", "v1.2.0")
+    found = index.find("1.1.0")
+    assert found is not None and found.version == "v1.1.0"
+    assert index.find("v1.1.1") is None
+    assert index.find("not-a-version") is None
+
+    before = index.before("v1.1.0")
+    assert before is not None and before.version == "v1.0.0"
+    assert index.before("v1.0.0") is None
+    between = index.before("v1.1.5")
+    assert between is not None and between.version == "v1.1.0"
+
+    after = index.after(Version("1.1.0"))
+    assert after is not None and after.version == "v1.2.0"
+    assert index.after("v1.2.0") is None
+
+
+def test_semver_index_ranges_are_inclusive() -> None:
+    index = _index("v0.12.0", "v0.13.0", "v0.18.2", "v0.19.0")
+    assert _versions(index.between("v0.12.0", "v0.18.2")) == ["v0.12.0", "v0.13.0", "v0.18.2"]
+    assert _versions(index.between("v0.12.5", None)) == ["v0.13.0", "v0.18.2", "v0.19.0"]
+    assert _versions(index.between(None, "v0.13.0")) == ["v0.12.0", "v0.13.0"]
+    assert index.between("v0.19.0", "v0.12.0") == []
+    assert index.between("bogus", None) == []
@@ -0,0 +1,89 @@
+"""Guard the CLI startup cost against eager imports of heavy dependencies."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SOURCE_ROOT = Path(__file__).resolve().parents[1] / "src"
+REPO_CHANGELOG = Path(__file__).resolve().parents[1] / "changelog"
+
+# Modules that only rendering, markdown normalization, or version lookups need.
+RENDERING_MODULES = (
+    "rich.console",
+    "rich.markdown",
+    "rich.table",
+    "mdformat",
+    "markdown_it",
+    "multiprocessing",
+    "importlib.metadata",
+)
+
+# Modules that no command needs before it starts reading the project; YAML
+# parsing and release version comparisons load them on first use.
+DEFERRED_MODULES = (*RENDERING_MODULES, "yaml", "packaging.version")
+
+# Ceiling for `import tenzir_changelog.cli`, measured with `-X importtime`.
+# It is generous to tolerate slow CI machines; the module checks above catch
+# individual heavy imports precisely.
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def _run_python(code: str, *arguments: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ, PYTHONPATH=str(SOURCE_ROOT))
+    return subprocess.run(
+        [sys.executable, *arguments, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _loaded_after(arguments: list[str], modules: tuple[str, ...]) -> list[str]:
+    code = (
+        "import json, sys\n"
+        "from tenzir_changelog.cli import main\n"
+        f"code = main({arguments!r})\n"
+        f"loaded = [name for name in {modules!r} if name in sys.modules]\n"
+        "print(json.dumps({'code': code, 'loaded': loaded}), file=sys.stderr)\n"
+    )
+    result = _run_python(code)
+    report = json.loads(result.stderr.strip().splitlines()[-1])
+    assert report["code"] == 0
+    return list(report["loaded"])
+
+
+def test_import_defers_heavy_dependencies() -> None:
+    assert _loaded_after(["--help"], DEFERRED_MODULES) == []
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        ["release", "version"],
+        ["show", "--json"],
+        ["validate"],
+    ],
+    ids=lambda arguments: " ".join(arguments),
+)
+def test_machine_readable_commands_skip_rendering_stack(arguments: list[str]) -> None:
+    loaded = _loaded_after(["--root", str(REPO_CHANGELOG), *arguments], RENDERING_MODULES)
+    assert loaded == []
+
+
+def test_import_time_budget() -> None:
+    result = _run_python("import tenzir_changelog.cli", "-X", "importtime")
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = (part.strip() for part in line.split("|"))
+        if total.isdigit():
+            cumulative[name] = int(total) / 1_000_000
+    assert cumulative["tenzir_changelog.cli"] < IMPORT_BUDGET_SECONDS
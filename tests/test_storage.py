@@ -0,0 +1,124 @@
+"""Tests for reading a changelog at a git ref."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+from conftest import git, write_entry_file, write_file
+
+from tenzir_changelog import storage
+from tenzir_changelog.cli import cli
+from tenzir_changelog.storage import configure_storage
+
+
+@pytest.fixture
+def repository(git_repository: Path) -> Path:
+    """A project whose working tree has moved on from the tagged state."""
+    project = git_repository / "changelog"
+    write_file(project / "config.yaml", yaml.safe_dump({"id": "demo", "name": "Tagged"}))
+    write_entry_file(project / "unreleased", "pending", body="Line one\r\nline two.")
+    release = project / "releases" / "v1.0.0"
+    write_file(release / "manifest.yaml", "created: 2025-01-02\nintro: First release.\n")
+    write_entry_file(release / "entries", "shipped")
+    git(git_repository, "add", ".")
+    git(git_repository, "commit", "-q", "-m", "Release")
+    git(git_repository, "tag", "v1.0.0")
+
+    write_file(project / "config.yaml", yaml.safe_dump({"id": "demo", "name": "Working"}))
+    (project / "unreleased" / "pending.md").unlink()
+    write_entry_file(project / "unreleased", "later")
+    return git_repository
+
+
+def test_show_reads_from_ref(repository: Path) -> None:
+    runner = CliRunner()
+    project = repository / "changelog"
+
+    current = runner.invoke(cli, ["--root", str(project), "show", "--json", "unreleased"])
+    assert current.exit_code == 0, current.output
+    assert [entry["title"] for entry in json.loads(current.output)["entries"]] == ["Later"]
+
+    tagged = runner.invoke(
+        cli, ["--root", str(project), "--ref", "v1.0.0", "show", "--json", "unreleased"]
+    )
+    assert tagged.exit_code == 0, tagged.output
+    entries = json.loads(tagged.output)["entries"]
+    assert [entry["title"] for entry in entries] == ["Pending"]
+    assert entries[0]["body"] == "Line one\nline two."
+
+
+def test_release_notes_and_validate_at_ref(repository: Path) -> None:
+    runner = CliRunner()
+    project = repository / "changelog"
+    notes = runner.invoke(cli, ["--root", str(project), "--ref", "v1.0.0", "release", "notes"])
+    assert notes.exit_code == 0, notes.output
+    assert "First release." in notes.output
+    assert "Shipped" in notes.output
+
+    validated = runner.invoke(cli, ["--root", str(project), "--ref", "v1.0.0", "validate"])
+    assert validated.exit_code == 0, validated.output
+
+
+def test_ref_storage_uses_one_batch_process(
+    repository: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    started: list[list[str]] = []
+    original = storage.subprocess.Popen
+
+    def record(command: list[str], **kwargs: object) -> object:
+        started.append(command)
+        return original(command, **kwargs)  # type: ignore[call-overload]
+
+    monkeypatch.setattr(storage.subprocess, "Popen", record)
+    configure_storage("v1.0.0", start=repository)
+    try:
+        project = repository / "changelog"
+        assert storage.read_text(project / "config.yaml") == "id: demo\nname: Tagged\n"
+        assert storage.is_dir(project / "releases" / "v1.0.0")
+        assert not storage.path_exists(project / "unreleased" / "later.md")
+        with pytest.raises(FileNotFoundError):
+            storage.read_bytes(project / "unreleased" / "later.md")
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--root", str(project), "--ref", "v1.0.0", "--jobs", "4", "show"]
+        )
+        assert result.exit_code == 0, result.output
+    finally:
+        configure_storage()
+    # One process for the direct reads and one for the CLI invocation, which
+    # reads every entry from several threads.
+    batches = [command for command in started if command[1] == "cat-file"]
+    assert batches == [["git", "cat-file", "--batch"]] * 2
+
+
+def test_ref_is_read_only_and_validated(repository: Path) -> None:
+    runner = CliRunner()
+    project = repository / "changelog"
+    added = runner.invoke(
+        cli,
+        [
+            "--root",
+            str(project),
+            "--ref",
+            "v1.0.0",
+            "add",
+            "--title",
+            "Nope",
+            "--type",
+            "feature",
+            "--description",
+            "Body.",
+            "--author",
+            "codex",
+        ],
+    )
+    assert added.exit_code == 1
+    assert "Cannot add entries while reading from --ref v1.0.0." in added.output
+
+    unknown = runner.invoke(cli, ["--root", str(project), "--ref", "v9.9.9", "show"])
+    assert unknown.exit_code == 1
+    assert "Cannot read --ref v9.9.9: unknown git ref 'v9.9.9'" in unknown.output